@@ -0,0 +1,318 @@
+# Micro-benchmarks for the render, serialization and graph hot paths.
+#
+#   python benchmarks/run.py                  run and compare against benchmarks/baseline.json
+#   python benchmarks/run.py --save           run and store the results as the new baseline
+#   python benchmarks/run.py -k rerender      only benchmarks whose name contains "rerender"
+#
+# Clients are driven in-process through FakeWebSocket, so whole frames are encoded and measured
+# without a server. Exits with status 1 if there is no baseline file, or if a benchmark is slower,
+# allocates more or sends more bytes per frame than its baseline entry. Only the metrics an entry
+# holds are compared: timings and allocations are only comparable on the same machine, while
+# bytes per frame are deterministic. The committed baseline holds bytes per frame only
+# (--save --metrics bytes_per_frame), for both tree sizes. Benchmarks without an entry, such as
+# the ones that send no frames, are listed as not gated and never fail the run.
+
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from pyx2 import PyX, createElement
+from pyx2.codec import WireFormat, getCodec
+from pyx2.identity import identities
+from pyx2.resource import ReferenceGraph, hashResource
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+class FakeWebSocket:
+    # Stands in for starlette's WebSocket on the server side; counts what would go over the wire
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    async def send_text(self, data: str):
+        self.frames += 1
+        self.bytes += len(data.encode())
+
+    async def send_bytes(self, data: bytes):
+        self.frames += 1
+        self.bytes += len(data)
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+class Node:
+    # Synthetic component: `fanout` child components per level, `depth` levels deep
+    def __init__(self, depth: int, fanout: int, label: str = 'n'):
+        self.label = label
+        self.value = 0
+        self.children = [Node(depth - 1, fanout, f'{label}.{index}') for index in range(fanout)] if depth > 0 else []
+
+    def onClick(self):
+        self.value += 1
+
+    def __render__(self):
+        return createElement('div', {'className': 'node', 'data-value': self.value},
+            createElement('span', {'onClick': self.onClick}, f'{self.label}: {self.value}'),
+            *self.children,
+        )
+
+    def leaves(self):
+        stack, leaves = [self], []
+        while stack:
+            node = stack.pop()
+            if node.children:
+                stack.extend(node.children)
+            else:
+                leaves.append(node)
+        return leaves
+
+
+def elementTree(depth: int, fanout: int):
+    # Plain elements only, as returned by a single large __render__
+    if depth == 0:
+        return createElement('li', {'className': 'leaf', 'style': {'width': 10}}, 'leaf')
+    return createElement('ul', {'className': f'level{depth}'}, *[elementTree(depth - 1, fanout) for _ in range(fanout)])
+
+
+def measure(run, repeat: int):
+    # Median time of `repeat` runs, and the peak memory allocated by one more, traced run
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'ms': statistics.median(times) * 1000, 'alloc_kb': peak / 1024}
+
+
+def benchSerialize(depth: int, fanout: int, repeat: int):
+    app = PyX(Node(0, 0), ssr=False)
+    tree = elementTree(depth, fanout)
+    return measure(lambda: app.resource_manager.serializeElement(tree), repeat)
+
+
+def benchHash(count: int, repeat: int):
+    objects = [Node(0, 0) for _ in range(count)]
+    return measure(lambda: [hashResource(obj) for obj in objects], repeat)
+
+
+def benchGraph(nodes: int, fanout: int, mutation: float, repeat: int):
+    # Builds a random DAG, rewires a fraction of the nodes, then releases everything below the root
+    rng = random.Random(1)
+
+    def run():
+        graph = ReferenceGraph(0)
+        updates = {parent: set(range(parent * fanout + 1, min(parent * fanout + fanout + 1, nodes))) for parent in range(nodes // fanout)}
+        graph.applyUpdates(updates)
+        for parent in rng.sample(range(nodes // fanout), int(nodes // fanout * mutation)):
+            graph.updateGraph(parent, {rng.randrange(1, nodes) for _ in range(fanout)} - {parent})
+        graph.updateGraph(0, set())
+    return measure(run, repeat)
+
+
+async def connect(app: PyX, count: int):
+    sockets = []
+    for _ in range(count):
+        websocket = FakeWebSocket()
+        client = app.createClient(websocket, WireFormat(getCodec('json')))
+        client.start()
+        app.clients.add(client)
+        sockets.append(websocket)
+    return sockets
+
+
+async def delivered(sockets, frames: int):
+    # Frames are written by each client's outbox task
+    while any(websocket.frames < frames for websocket in sockets):
+        await asyncio.sleep(0)
+
+
+def benchInitialRender(depth: int, fanout: int, clients: int, repeat: int):
+    result = {}
+
+    async def main():
+        app = PyX(Node(depth, fanout), ssr=False)
+        app.scheduler.loop = asyncio.get_running_loop()
+        sockets = await connect(app, clients)
+
+        async def render():
+            # Every client starts from an empty graph, and the first one from a cold render cache
+            for client in app.clients:
+                client.release()
+            app.resource_manager.renderCache.entries.clear()
+            frames = sockets[0].frames
+            for client in app.clients:
+                client.rerender(app.component)
+            await delivered(sockets, frames + 1)
+
+        # Frame sizes are taken from the first run, so they do not depend on `repeat`
+        times = []
+        for index in range(repeat):
+            before = sum(websocket.bytes for websocket in sockets)
+            gc.collect()
+            start = time.perf_counter()
+            await render()
+            times.append(time.perf_counter() - start)
+            if index == 0:
+                sent = sum(websocket.bytes for websocket in sockets) - before
+        tracemalloc.start()
+        await render()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        result.update({'ms': statistics.median(times) * 1000, 'alloc_kb': peak / 1024, 'bytes_per_frame': sent / clients})
+        for client in list(app.clients):
+            app.dropClient(client)
+
+    asyncio.run(main())
+    return result
+
+
+def benchRerender(depth: int, fanout: int, clients: int, mutation: float, repeat: int):
+    # State writes to a fraction of the leaves, flushed as one render frame per client
+    result = {}
+
+    async def main():
+        root = Node(depth, fanout)
+        app = PyX(root, ssr=False)
+        app.scheduler.loop = asyncio.get_running_loop()
+        sockets = await connect(app, clients)
+        for client in app.clients:
+            client.rerender(root)
+        await delivered(sockets, 1)
+        leaves = root.leaves()
+        rng = random.Random(1)
+        count = max(1, int(len(leaves) * mutation))
+
+        async def mutate():
+            frames = sockets[0].frames
+            for leaf in rng.sample(leaves, count):
+                leaf.value += 1
+            app.scheduler.flush()
+            await delivered(sockets, frames + 1)
+
+        # Frame sizes are taken from the first run, so they do not depend on `repeat`
+        times = []
+        for index in range(repeat):
+            before = sum(websocket.bytes for websocket in sockets)
+            gc.collect()
+            start = time.perf_counter()
+            await mutate()
+            times.append(time.perf_counter() - start)
+            if index == 0:
+                sent = sum(websocket.bytes for websocket in sockets) - before
+        tracemalloc.start()
+        await mutate()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        result.update({'ms': statistics.median(times) * 1000, 'alloc_kb': peak / 1024, 'bytes_per_frame': sent / clients})
+        for client in list(app.clients):
+            app.dropClient(client)
+
+    asyncio.run(main())
+    return result
+
+
+def benchmarks(quick: bool):
+    depth = 3 if quick else 4
+    yield f'serialize[depth={depth},fanout=8]', lambda repeat: benchSerialize(depth, 8, repeat)
+    yield 'hashResource[10000]', lambda repeat: benchHash(10000, repeat)
+    yield 'graph[nodes=20000,fanout=8,mutation=0.2]', lambda repeat: benchGraph(20000, 8, 0.2, repeat)
+    yield f'initialRender[depth={depth},fanout=6,clients=10]', lambda repeat: benchInitialRender(depth, 6, 10, repeat)
+    yield f'rerender[depth={depth},fanout=6,clients=100,mutation=0.01]', lambda repeat: benchRerender(depth, 6, 100, 0.01, repeat)
+    yield f'rerender[depth={depth},fanout=6,clients=10,mutation=0.5]', lambda repeat: benchRerender(depth, 6, 10, 0.5, repeat)
+
+
+METRICS = ('ms', 'alloc_kb', 'bytes_per_frame')
+
+
+def compare(results, baseline, threshold: float):
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric, expected in baseline[name].items():
+            if metric not in result:
+                continue
+            # Frame sizes do not vary from run to run, so any growth counts
+            allowed = expected if metric == 'bytes_per_frame' else expected * (1 + threshold)
+            if expected > 0 and result[metric] > allowed + 1e-6:
+                regressions.append(f"{name}: {metric} {expected:.2f} -> {result[metric]:.2f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='pyx2 micro-benchmarks')
+    parser.add_argument('-k', dest='filter', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown over the baseline, as a fraction')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save', action='store_true', help='store the results as the baseline')
+    parser.add_argument('--metrics', default=','.join(METRICS), help='comma-separated metrics to store with --save')
+    parser.add_argument('--quick', action='store_true', help='smaller trees')
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+
+    results = {}
+    print(f"{'benchmark':58} {'ms':>9} {'alloc KB':>10} {'B/frame':>9}")
+    for name, bench in benchmarks(args.quick):
+        if args.filter not in name:
+            continue
+        # Resource ids restart for every benchmark, so frame sizes do not depend on what ran before
+        gc.collect()
+        identities.counter = itertools.count(1)
+        result = bench(args.repeat)
+        results[name] = result
+        frame = f"{result['bytes_per_frame']:.0f}" if 'bytes_per_frame' in result else '-'
+        print(f"{name:58} {result['ms']:9.2f} {result['alloc_kb']:10.1f} {frame:>9}")
+
+    if args.save:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as file:
+                baseline = json.load(file)
+        metrics = [metric for metric in args.metrics.split(',') if metric]
+        for metric in metrics:
+            if metric not in METRICS:
+                raise Exception(f"Unknown metric {metric}")
+        for name, result in results.items():
+            entry = {metric: value for metric, value in result.items() if metric in metrics}
+            if entry:
+                baseline[name] = entry
+        with open(args.baseline, 'w') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save first")
+        return 1
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    for name in results:
+        if name not in baseline:
+            print(f"not gated (no baseline entry): {name}")
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
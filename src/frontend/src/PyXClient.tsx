@@ -2,22 +2,42 @@
 
 import React, { Dispatch, SetStateAction, useEffect, useState } from "react";
 import PyXRenderable from "./PyXRenderable";
+import { WireFormat, supportedProtocols } from "./codec";
 
-function useRootId(this: PyXClient): string | null {
-    const [rootId, setRootId] = useState<string | null>(null);
+// Typed arrays for the element types of pyx2/series.py (little-endian)
+const ARRAY_TYPES: {[dtype: string]: any} = {
+    i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array, i4: Int32Array, u4: Uint32Array,
+    i8: BigInt64Array, u8: BigUint64Array, f4: Float32Array, f8: Float64Array,
+};
+
+interface ArrayEntry {
+    version: number;
+    token: string;          // Access token of the array resource, required by /arrays
+    bytes: Uint8Array;      // Received bytes; the capacity doubles as a Series grows
+    length: number;         // Number of bytes received
+    loading: boolean;
+    view: any;              // Typed array over the received bytes
+    users: Set<number>;     // Renderables whose trees reference the array
+}
+
+function useRootId(this: PyXClient): number | null {
+    const [rootId, setRootId] = useState<number | null>(this.rootId);
     if (this.rootIdSetter === null) {
         this.rootIdSetter = setRootId;
     }
     return rootId;
 }
 
-function useRenderable(this: PyXClient, resourceId: string | null): React.ReactNode {
-    const [element, setElement] = useState<React.ReactNode>(null);
+function useRenderable(this: PyXClient, resourceId: number | null): React.ReactNode {
+    // Resources embedded by server-side rendering are available for the first (hydrating) render
+    const [element, setElement] = useState<React.ReactNode>(() => (
+        resourceId !== null && resourceId in this.resources ? this.convertResource(resourceId) : null
+    ));
     useEffect(() => {
         if (resourceId !== null) {
             this.setters.set(resourceId, setElement);
             if (resourceId in this.resources) {
-                setElement(this.convert(this.resources[resourceId]));
+                setElement(this.convertResource(resourceId));
             }
         }
     }, [resourceId]);
@@ -27,35 +47,81 @@ function useRenderable(this: PyXClient, resourceId: string | null): React.ReactN
 
 export class PyXClient {
     private websocket: WebSocket;
-    setters: Map<string, Dispatch<SetStateAction<React.ReactNode>>>;
-    rootIdSetter: Dispatch<SetStateAction<string | null>> | null;
-    useRenderable: (resourceId: string|null) => React.ReactNode;
-    useRootId: () => string | null;
-    resources: {[key: string]: object};
+    private wire: WireFormat;
+    private inbox: Promise<void>;
+    setters: Map<number, Dispatch<SetStateAction<React.ReactNode>>>;
+    rootId: number | null;
+    rootIdSetter: Dispatch<SetStateAction<number | null>> | null;
+    useRenderable: (resourceId: number|null) => React.ReactNode;
+    useRootId: () => number | null;
+    resources: {[key: number]: object};
     functionArguments: {[key: string]: any};    // Stores the arguments for functions.
+    preloads: {[key: number]: any[][]};         // Argument paths updated by the server since the last render
+    arrays: {[key: number]: ArrayEntry};        // Binary payloads fetched from /arrays
+    converting: number | null;                  // Renderable being converted
     constructor() {
-        this.websocket = new WebSocket("wss://" + window.location.host + window.location.pathname + "ws");
+        // Pages rendered on the server carry their tree and the session to attach to
+        const state = window.__PYX_STATE__;
+        this.resources = state !== undefined ? state.resources : {};
+        this.rootId = state !== undefined ? state.root : null;
+        const query = state !== undefined ? "?session=" + encodeURIComponent(state.session) : "";
+        this.websocket = new WebSocket("wss://" + window.location.host + window.location.pathname + "ws" + query, supportedProtocols());
+        this.websocket.binaryType = "arraybuffer";
+        this.wire = new WireFormat("");
+        this.inbox = Promise.resolve();
+        this.websocket.onopen = () => {
+            this.wire = new WireFormat(this.websocket.protocol);
+        };
         this.setters = new Map();
         this.rootIdSetter = null;
         this.useRenderable = useRenderable.bind(this);
         this.useRootId = useRootId.bind(this);
         this.websocket.onmessage = this.onMessage.bind(this);
-        this.resources = {};
         this.functionArguments = {};
+        this.preloads = {};
+        this.arrays = {};
+        this.converting = null;
     }
 
     onMessage(msg: MessageEvent) {
-        const {event, data} = JSON.parse(msg.data);
-        if (event === "root") {
+        // Decoding may be asynchronous (deflate), so messages are chained to keep their order
+        this.inbox = this.inbox
+            .then(() => this.wire.decode(msg.data))
+            .then((message) => this.handleMessage(message))
+            .catch((error) => console.error(error));
+    }
+
+    send(message: any) {
+        this.websocket.send(this.wire.encode(message));
+    }
+
+    handleMessage(message: any) {
+        const {event, data, patch} = message;
+        if (event === "batch") {
+            // Messages the server queued while the previous frame was being written
+            for (const queued of data) {
+                this.handleMessage(queued);
+            }
+        }
+        else if (event === "ping") {
+            this.send({event: "pong"});
+        }
+        else if (event === "root") {
+            this.rootId = data;
             this.rootIdSetter!(data);
         }
         else if (event === "render") {
             for (const key in data) {
                 this.resources[key] = data[key];
             }
+            if (patch !== undefined) {
+                for (const key in patch) {
+                    this.resources[key] = this.applyPatch(this.resources[key], patch[key]);
+                }
+            }
             for (const [key, setter] of this.setters) {
-                if (key in data) {
-                    setter(this.convert(data[key]));
+                if (key in data || (patch !== undefined && key in patch)) {
+                    setter(this.convertResource(key));
                 }
             }
         }
@@ -63,30 +129,154 @@ export class PyXClient {
             const call_id = data["call_id"];
             // const result = data["return"];
             delete this.functionArguments[call_id];
+        } else if (event === "preload") {
+            this.preloads[data["id"]] = data["paths"];
         } else if (event === "request") {
-            const request_id = data["id"];
-            const request_data = data["data"];
-            
-            if (request_data.event === "get_function_argument") {
-                const call_id = request_data.data["call_id"];
-                const path = request_data.data["path"];
-                const arg = path.reduce((obj: any, key: any) => obj[key], this.functionArguments[call_id]);
-                this.websocket.send(JSON.stringify({event: "response", data: {id: request_id, data: arg}}));
+            this.send({event: "response", data: this.answer(data)});
+        } else if (event === "requests") {
+            // Requests the server made within one tick are answered in a single frame
+            this.send({event: "responses", data: data.map((request: any) => this.answer(request))});
+        }
+    }
+
+    // Applies the structural patch ops produced by pyx2/diff.py in place.
+    applyPatch(tree: any, ops: any[]): any {
+        for (const op of ops) {
+            const [kind, path] = op;
+            if (kind === "r" && path.length === 0) {
+                tree = op[2];
+                continue;
+            }
+            const parentPath = kind === "r" ? path.slice(0, -1) : path;
+            let node = tree;
+            for (const index of parentPath) {
+                node = node.children[index];
+            }
+            if (kind === "r") {
+                node.children[path[path.length - 1]] = op[2];
+            } else if (kind === "p") {
+                node.props[op[2]] = op[3];
+            } else if (kind === "d") {
+                delete node.props[op[2]];
+            } else if (kind === "i") {
+                node.children.splice(op[2], 0, op[3]);
+            } else if (kind === "x") {
+                node.children.splice(op[2], 1);
+            } else if (kind === "m") {
+                const [child] = node.children.splice(op[2], 1);
+                node.children.splice(op[3], 0, child);
             }
         }
+        return tree;
     }
 
-    preload(jsobj: any, structure: any) {
-        const result: any = {};
-        for (const key in structure) {
-            const parsed_key = JSON.parse(key);
-            if (structure[key] === null) {
-                result[key] = jsobj[parsed_key];
-            } else {
-                result[key] = this.preload(jsobj[parsed_key], structure[key]);
+    answer(request: any) {
+        const request_id = request["id"];
+        const request_data = request["data"];
+        let result = null;
+        if (request_data.event === "get_function_arguments") {
+            // Every path the handler looked up within one tick
+            const call_id = request_data.data["call_id"];
+            const paths = request_data.data["paths"];
+            const args = this.functionArguments[call_id];
+            result = paths.map((path: any[]) => this.lookup(args, path));
+        }
+        return {id: request_id, data: result};
+    }
+
+    lookup(args: any, path: any[]): any {
+        let value = args;
+        for (const key of path) {
+            if (value === null || value === undefined) {
+                return null;
+            }
+            value = value[key];
+        }
+        return value === undefined ? null : value;
+    }
+
+    // Values of the argument paths the handler declared or the server learned, as [path, value] pairs
+    preload(args: any[], paths: any[][]) {
+        return paths.map((path) => [path, this.lookup(args, path)]);
+    }
+
+    convertResource(key: number): React.ReactNode {
+        this.converting = key;
+        try {
+            return this.convert(this.resources[key]);
+        } finally {
+            this.converting = null;
+        }
+    }
+
+    // The typed array of an Array resource; empty, or shorter than on the server, until fetched
+    array(obj: any): any {
+        const {id, dtype, length, v, token} = obj;
+        let entry = this.arrays[id];
+        if (entry === undefined || entry.version !== v) {
+            const users = entry !== undefined ? entry.users : new Set<number>();
+            entry = {version: v, token, bytes: new Uint8Array(0), length: 0, loading: false, view: new ARRAY_TYPES[dtype](0), users};
+            this.arrays[id] = entry;
+        }
+        if (this.converting !== null) {
+            entry.users.add(this.converting);
+        }
+        if (entry.length < length && !entry.loading) {
+            this.fetchArray(id, dtype, entry);
+        }
+        return entry.view;
+    }
+
+    async fetchArray(id: number, dtype: string, entry: ArrayEntry) {
+        // A growing Series only fetches what was appended since the last fetch
+        entry.loading = true;
+        try {
+            const start = entry.length;
+            const response = await fetch("arrays/" + id + "?t=" + entry.token + "&v=" + entry.version, start > 0 ? {headers: {Range: "bytes=" + start + "-"}} : {});
+            if ((response.status !== 200 && response.status !== 206) || this.arrays[id] !== entry) {
+                return;
+            }
+            const received = new Uint8Array(await response.arrayBuffer());
+            const offset = response.status === 206 ? start : 0;
+            const total = offset + received.length;
+            if (total > entry.bytes.length) {
+                const bytes = new Uint8Array(Math.max(total, entry.bytes.length * 2));
+                bytes.set(entry.bytes.subarray(0, offset));
+                entry.bytes = bytes;
             }
+            entry.bytes.set(received, offset);
+            entry.length = total;
+            const ArrayType = ARRAY_TYPES[dtype];
+            entry.view = new ArrayType(entry.bytes.buffer, 0, Math.floor(total / ArrayType.BYTES_PER_ELEMENT));
+        } finally {
+            entry.loading = false;
+        }
+        for (const key of entry.users) {
+            const setter = this.setters.get(key);
+            if (setter !== undefined && key in this.resources) {
+                setter(this.convertResource(key));
+            }
+        }
+    }
+
+    // React 18 passes props of custom elements as attributes; typed arrays are set as properties
+    assignProperties(props: any) {
+        const properties: [string, any][] = [];
+        for (const key in props) {
+            if (ArrayBuffer.isView(props[key])) {
+                properties.push([key, props[key]]);
+                delete props[key];
+            }
+        }
+        if (properties.length > 0) {
+            props.ref = (element: any) => {
+                if (element !== null) {
+                    for (const [key, value] of properties) {
+                        element[key] = value;
+                    }
+                }
+            };
         }
-        return result;
     }
 
     convert(obj: any): any {
@@ -105,21 +295,21 @@ export class PyXClient {
                     const tag = obj["tag"];
                     const props = this.convert(obj["props"]);
                     const children = this.convert(obj["children"]);
+                    if (tag.includes("-")) {
+                        this.assignProperties(props);
+                    }
                     return React.createElement(tag, props, ...children);
+                } else if (resourceType === "Array") {
+                    return this.array(obj);
                 } else if (resourceType === "Function") {
                     const id = obj["id"];
                     const preload_args = obj["preload_args"];
-                    // TODO: Add argument support.
                     return (...args: any[]) => {
                         const call_id = Math.random().toString(36).substring(7);
                         this.functionArguments[call_id] = args;
-                        let preloaded_data = {};
-                        console.log('preload_args', preload_args);
-                        if (preload_args !== null) {
-                            preloaded_data = this.preload(args, preload_args);
-                        }
-                        console.log('preloaded_data', preloaded_data)
-                        this.websocket.send(JSON.stringify({
+                        const paths = id in this.preloads ? this.preloads[id] : preload_args;
+                        const preloaded_data = this.preload(args, paths);
+                        this.send({
                             event: "resource_event",
                             data: {
                                 id: id,
@@ -132,7 +322,7 @@ export class PyXClient {
                                     }
                                 }
                             }
-                        }));
+                        });
                     };
                 }
             } else {
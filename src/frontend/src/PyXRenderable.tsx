@@ -1,7 +1,7 @@
 import { PyXClient } from "./PyXClient"
 
 
-export default function PyXRenderable({client, id}: {client: PyXClient, id: string}) {
+export default function PyXRenderable({client, id}: {client: PyXClient, id: number}) {
     const element = client.useRenderable(id);
     return element;
 }
\ No newline at end of file
@@ -0,0 +1,240 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+
+// Wire formats negotiated with the server through the WebSocket subprotocol (see pyx2/codec.py).
+
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
+export function supportedProtocols(): string[] {
+    const protocols = ["pyx2.msgpack", "pyx2.json"];
+    if (typeof DecompressionStream !== "undefined") {
+        return ["pyx2.msgpack+deflate", "pyx2.json+deflate", ...protocols];
+    }
+    return protocols;
+}
+
+function concat(a: Uint8Array, b: Uint8Array): Uint8Array {
+    const result = new Uint8Array(a.length + b.length);
+    result.set(a, 0);
+    result.set(b, a.length);
+    return result;
+}
+
+// A single raw deflate stream per connection; every frame is prefixed with its uncompressed length.
+class Inflater {
+    writer: WritableStreamDefaultWriter<Uint8Array>;
+    reader: ReadableStreamDefaultReader<Uint8Array>;
+    buffer: Uint8Array;
+    constructor() {
+        const stream = new DecompressionStream("deflate-raw");
+        this.writer = stream.writable.getWriter();
+        this.reader = stream.readable.getReader();
+        this.buffer = new Uint8Array(0);
+    }
+
+    async inflate(chunk: Uint8Array): Promise<Uint8Array> {
+        this.writer.write(chunk);
+        for (;;) {
+            if (this.buffer.length >= 4) {
+                const length = new DataView(this.buffer.buffer, this.buffer.byteOffset).getUint32(0);
+                if (this.buffer.length >= 4 + length) {
+                    const frame = this.buffer.slice(4, 4 + length);
+                    this.buffer = this.buffer.slice(4 + length);
+                    return frame;
+                }
+            }
+            const {value} = await this.reader.read();
+            this.buffer = concat(this.buffer, value!);
+        }
+    }
+}
+
+export function decodeMessagePack(bytes: Uint8Array): any {
+    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+    let offset = 0;
+    const str = (length: number) => {
+        const value = textDecoder.decode(bytes.subarray(offset, offset + length));
+        offset += length;
+        return value;
+    };
+    const bin = (length: number) => {
+        const value = bytes.slice(offset, offset + length);
+        offset += length;
+        return value;
+    };
+    const arr = (length: number) => {
+        const value = new Array(length);
+        for (let i = 0; i < length; i++) {
+            value[i] = read();
+        }
+        return value;
+    };
+    const map = (length: number) => {
+        const value: any = {};
+        for (let i = 0; i < length; i++) {
+            const key = read();
+            value[key] = read();
+        }
+        return value;
+    };
+    const read = (): any => {
+        const type = view.getUint8(offset++);
+        let value: any;
+        if (type < 0x80) return type;
+        if (type < 0x90) return map(type & 0x0f);
+        if (type < 0xa0) return arr(type & 0x0f);
+        if (type < 0xc0) return str(type & 0x1f);
+        if (type >= 0xe0) return type - 0x100;
+        switch (type) {
+            case 0xc0: return null;
+            case 0xc2: return false;
+            case 0xc3: return true;
+            case 0xc4: value = view.getUint8(offset); offset += 1; return bin(value);
+            case 0xc5: value = view.getUint16(offset); offset += 2; return bin(value);
+            case 0xc6: value = view.getUint32(offset); offset += 4; return bin(value);
+            case 0xca: value = view.getFloat32(offset); offset += 4; return value;
+            case 0xcb: value = view.getFloat64(offset); offset += 8; return value;
+            case 0xcc: value = view.getUint8(offset); offset += 1; return value;
+            case 0xcd: value = view.getUint16(offset); offset += 2; return value;
+            case 0xce: value = view.getUint32(offset); offset += 4; return value;
+            case 0xcf: value = Number(view.getBigUint64(offset)); offset += 8; return value;
+            case 0xd0: value = view.getInt8(offset); offset += 1; return value;
+            case 0xd1: value = view.getInt16(offset); offset += 2; return value;
+            case 0xd2: value = view.getInt32(offset); offset += 4; return value;
+            case 0xd3: value = Number(view.getBigInt64(offset)); offset += 8; return value;
+            case 0xd9: value = view.getUint8(offset); offset += 1; return str(value);
+            case 0xda: value = view.getUint16(offset); offset += 2; return str(value);
+            case 0xdb: value = view.getUint32(offset); offset += 4; return str(value);
+            case 0xdc: value = view.getUint16(offset); offset += 2; return arr(value);
+            case 0xdd: value = view.getUint32(offset); offset += 4; return arr(value);
+            case 0xde: value = view.getUint16(offset); offset += 2; return map(value);
+            case 0xdf: value = view.getUint32(offset); offset += 4; return map(value);
+        }
+        throw new Error("Unsupported MessagePack type " + type);
+    };
+    return read();
+}
+
+export function encodeMessagePack(message: any): Uint8Array {
+    let buffer = new Uint8Array(256);
+    let view = new DataView(buffer.buffer);
+    let offset = 0;
+    const ensure = (size: number) => {
+        if (offset + size > buffer.length) {
+            const next = new Uint8Array(Math.max(buffer.length * 2, offset + size));
+            next.set(buffer);
+            buffer = next;
+            view = new DataView(buffer.buffer);
+        }
+    };
+    const header = (length: number, fix: number, fixLimit: number, type16: number, type32: number) => {
+        ensure(5);
+        if (length < fixLimit) {
+            view.setUint8(offset++, fix | length);
+        } else if (length < 0x10000) {
+            view.setUint8(offset++, type16);
+            view.setUint16(offset, length);
+            offset += 2;
+        } else {
+            view.setUint8(offset++, type32);
+            view.setUint32(offset, length);
+            offset += 4;
+        }
+    };
+    const write = (value: any, depth: number) => {
+        if (depth > 64) {
+            throw new Error("Cannot encode deeply nested or circular value");
+        }
+        if (value !== null && typeof value === "object" && typeof value.toJSON === "function") {
+            value = value.toJSON();
+        }
+        ensure(9);
+        if (value === null || value === undefined || typeof value === "function" || typeof value === "symbol") {
+            view.setUint8(offset++, 0xc0);
+        } else if (typeof value === "boolean") {
+            view.setUint8(offset++, value ? 0xc3 : 0xc2);
+        } else if (typeof value === "number") {
+            if (Number.isInteger(value) && value >= 0 && value < 0x80) {
+                view.setUint8(offset++, value);
+            } else if (Number.isInteger(value) && value < 0 && value >= -32) {
+                view.setUint8(offset++, value & 0xff);
+            } else if (Number.isInteger(value) && value >= 0 && value <= 0xffffffff) {
+                view.setUint8(offset++, 0xce);
+                view.setUint32(offset, value);
+                offset += 4;
+            } else if (Number.isInteger(value) && value < 0 && value >= -0x80000000) {
+                view.setUint8(offset++, 0xd2);
+                view.setInt32(offset, value);
+                offset += 4;
+            } else {
+                view.setUint8(offset++, 0xcb);
+                view.setFloat64(offset, value);
+                offset += 8;
+            }
+        } else if (typeof value === "string") {
+            const bytes = textEncoder.encode(value);
+            if (bytes.length < 32) {
+                view.setUint8(offset++, 0xa0 | bytes.length);
+            } else if (bytes.length < 0x100) {
+                view.setUint8(offset++, 0xd9);
+                view.setUint8(offset++, bytes.length);
+            } else {
+                header(bytes.length, 0, 0, 0xda, 0xdb);
+            }
+            ensure(bytes.length);
+            buffer.set(bytes, offset);
+            offset += bytes.length;
+        } else if (value instanceof Uint8Array) {
+            header(value.length, 0, 0, 0xc5, 0xc6);
+            ensure(value.length);
+            buffer.set(value, offset);
+            offset += value.length;
+        } else if (Array.isArray(value)) {
+            header(value.length, 0x90, 16, 0xdc, 0xdd);
+            for (const item of value) {
+                write(item, depth + 1);
+            }
+        } else {
+            // Same rules as JSON.stringify: functions and undefined values are skipped
+            const keys = Object.keys(value).filter((key) => {
+                const type = typeof value[key];
+                return type !== "function" && type !== "undefined" && type !== "symbol";
+            });
+            header(keys.length, 0x80, 16, 0xde, 0xdf);
+            for (const key of keys) {
+                write(key, depth + 1);
+                write(value[key], depth + 1);
+            }
+        }
+    };
+    write(message, 0);
+    return buffer.slice(0, offset);
+}
+
+export class WireFormat {
+    format: string;
+    inflater: Inflater | null;
+    constructor(protocol: string) {
+        const [format, compression] = protocol.replace(/^pyx2\./, "").split("+");
+        this.format = format === "msgpack" ? "msgpack" : "json";
+        this.inflater = compression === "deflate" ? new Inflater() : null;
+    }
+
+    async decode(data: string | ArrayBuffer): Promise<any> {
+        if (typeof data === "string") {
+            return JSON.parse(data);
+        }
+        let bytes = new Uint8Array(data);
+        if (this.inflater !== null) {
+            bytes = await this.inflater.inflate(bytes);
+        }
+        if (this.format === "msgpack") {
+            return decodeMessagePack(bytes);
+        }
+        return JSON.parse(textDecoder.decode(bytes));
+    }
+
+    encode(message: any): string | Uint8Array {
+        return this.format === "msgpack" ? encodeMessagePack(message) : JSON.stringify(message);
+    }
+}
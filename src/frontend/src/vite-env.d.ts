@@ -1 +1,6 @@
 /// <reference types="vite/client" />
+
+interface Window {
+  // Embedded by the server when the page is rendered on the server (see pyx2/ssr.py)
+  __PYX_STATE__?: {session: string, root: number, resources: {[key: number]: object}}
+}
@@ -2,6 +2,14 @@
 from .app import PyX
 from .element import createElement
 from .context import current
+from .image import imageChanged, imageHints
+from .resource import preload
+from .executor import offload
+from .bus import Bus, LocalBus, UnixSocketBus
+from .serializer import registerConverter
+from .series import Series
+from .virtual import VirtualList
+from .metrics import Metrics
 
 __version__ = '0.0.1'
-__all__ = ['PyX', 'createElement', 'current']
+__all__ = ['PyX', 'createElement', 'current', 'imageChanged', 'imageHints', 'preload', 'offload', 'Bus', 'LocalBus', 'UnixSocketBus', 'registerConverter', 'Series', 'VirtualList', 'Metrics']
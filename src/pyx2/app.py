@@ -1,147 +1,391 @@
 
 from starlette.applications import Starlette
-from starlette.responses import HTMLResponse, FileResponse, Response
+from starlette.responses import HTMLResponse, Response, StreamingResponse
 from starlette.endpoints import WebSocketEndpoint
+from starlette.requests import Request
 from starlette.websockets import WebSocket
 
 import asyncio
+import itertools
 import os
-import io
-import random
+import time
+from collections import deque
 
-from typing import Dict, Set
+from typing import Awaitable, Dict, List, Optional, Set, Tuple, Union
 
-from .resource import RenderableResource, ReferenceGraph, ResourceManager, Hash, hashResource, Resource
+from .resource import RenderableResource, ReferenceGraph, ResourceManager, Hash, hashResource, Resource, ImageResource, ArrayResource
+from .image import MEDIA_TYPES, negotiateFormat
 
 from .context import current
+from .diff import diffElement
+from .scheduler import RenderScheduler
+from .assets import AssetPipeline
+from .codec import Codec, DeflateCompression, WireFormat, getCodec, negotiate
+from .ssr import ROOT_ELEMENT, embedState, renderToHTML
+from .session import PendingSessions
+from .executor import HandlerExecutor
+from .outbox import OVERFLOW_POLICIES, Outbox
+from .bus import Broadcaster, Bus
+from .tracking import trackInstance
+from .supervisor import ConnectionSupervisor
+from .quota import SessionQuota
+from .series import Series, arrayInfo, parseRange
+from .metrics import Metrics
+from .reload import HotReloader
+
+EVENTS = ('pong', 'resource_event', 'response', 'responses')   # Events the browser sends
 
 class RequestManager:
-    def __init__(self, websocket: WebSocket):
-        self.websocket = websocket
-        self.requests: Dict[int, asyncio.Future] = {}
-    
-    def request(self, data):
-        request_id = random.randint(0, 2**32).to_bytes(4, 'big').hex()
-        loop = asyncio.get_event_loop()
-        loop.create_task(self.websocket.send_json({'event': 'request', 'data': {'id': request_id, 'data': data}}))
-        future = asyncio.Future()
-        self.requests[request_id] = future
+    # Requests to the browser, answered with `response` events. Ids are monotonic per connection,
+    # every request has a deadline, and requests made within one tick are sent in a single frame.
+    def __init__(self, sender: Outbox, timeout: float = 30):
+        self.sender = sender
+        self.timeout = timeout
+        self.ids = itertools.count(1)
+        self.lastId = 0
+        self.requests: Dict[int, Tuple[asyncio.Future, asyncio.TimerHandle]] = {}
+        self.outbox: List[Dict] = []
+        self.issued = 0
+        self.timedOut = 0
+        self.cancelled = 0
+
+    @property
+    def inFlight(self):
+        return len(self.requests)
+
+    def stats(self):
+        return {'in_flight': self.inFlight, 'issued': self.issued, 'timed_out': self.timedOut, 'cancelled': self.cancelled}
+
+    def request(self, data, timeout: Optional[float] = None):
+        loop = asyncio.get_running_loop()
+        request_id = self.lastId = next(self.ids)
+        future = loop.create_future()
+        handle = loop.call_later(self.timeout if timeout is None else timeout, self.expire, request_id)
+        self.requests[request_id] = (future, handle)
+        # Requesters that stop waiting release the request
+        future.add_done_callback(lambda future: self.discard(request_id))
+        if len(self.outbox) == 0:
+            loop.call_soon(self.flush)
+        self.outbox.append({'id': request_id, 'data': data})
+        self.issued += 1
         return future
-    
+
+    def flush(self):
+        outbox = self.outbox
+        self.outbox = []
+        # Requests cancelled within this tick are still registered; their done callbacks run after this
+        outbox = [request for request in outbox if request['id'] in self.requests and not self.requests[request['id']][0].done()]
+        if len(outbox) == 0:
+            return
+        message = {'event': 'request', 'data': outbox[0]} if len(outbox) == 1 else {'event': 'requests', 'data': outbox}
+        if self.sender.offer(message, 'requests', self.flush):
+            return
+        if self.sender.closed:
+            self.fail([request['id'] for request in outbox])
+        else:
+            # The send queue is full; the batch goes out, with anything requested meanwhile, once it drains
+            self.outbox = outbox + self.outbox
+
     def response(self, data):
         request_id = data['id']
         if request_id in self.requests:
-            self.requests[request_id].set_result(data['data'])
-            del self.requests[request_id]
-        else:
+            future, handle = self.requests.pop(request_id)
+            handle.cancel()
+            if not future.done():
+                future.set_result(data['data'])
+        elif not (isinstance(request_id, int) and 0 < request_id <= self.lastId):
+            # Late answers to requests that timed out or were cancelled are dropped
             raise Exception("Cannot respond to non-existent request")
 
+    def expire(self, request_id: int):
+        if request_id in self.requests:
+            future, _ = self.requests.pop(request_id)
+            self.timedOut += 1
+            if not future.done():
+                future.set_exception(TimeoutError(f"Request {request_id} was not answered in time"))
+
+    def discard(self, request_id: int):
+        if request_id in self.requests:
+            future, handle = self.requests.pop(request_id)
+            handle.cancel()
+            if future.cancelled():
+                self.cancelled += 1
+
+    def fail(self, request_ids: List[int]):
+        for request_id in request_ids:
+            if request_id in self.requests:
+                future, handle = self.requests.pop(request_id)
+                handle.cancel()
+                future.cancel()
+                self.cancelled += 1
+
+    def cancelAll(self):
+        # Called when the connection closes; everything awaiting the browser is cancelled
+        self.outbox = []
+        self.fail(list(self.requests))
+
 class Client:
-    def __init__(self, websocket: WebSocket, root: RenderableResource, resourceManager: ResourceManager):
-        self.websocket: WebSocket = websocket
+    def __init__(self, websocket: Optional[WebSocket], root: RenderableResource, resourceManager: ResourceManager, wire: Optional[WireFormat], max_calls: int = 4, request_timeout: float = 30, send_queue: int = 256, overflow: str = 'drop', quota: Optional[SessionQuota] = None):
+        # Clients rendered for an HTML response get their websocket and wire format once the browser connects
+        self.websocket: Optional[WebSocket] = websocket
+        self.wire: Optional[WireFormat] = wire
+        self.outbox = Outbox(self, send_queue, overflow)    # Single writer of the websocket
         self.root: RenderableResource = root
         self.referenceGraph: ReferenceGraph[Hash] = ReferenceGraph(root.hash)
         self.resourceManager: ResourceManager = resourceManager
-        self.requestManager: RequestManager = RequestManager(websocket)
+        self.resourceManager.subscribe(root.hash, self)
+        self.requestManager: RequestManager = RequestManager(self.outbox, request_timeout)
         self.data: Dict[str, object] = {}
+        self.local: Dict[Hash, object] = {}  # What a resource keeps per client; dropped when it leaves the graph
+        self.sent: Dict[Hash, object] = {}  # Last serialized tree sent to the browser, per resource
+        self.suspended: Set[Hash] = set()   # Resources last sent as stand-ins for a pending async render
+        self.tasks: Set[asyncio.Task] = set()
+        self.lastSeen: float = 0.0      # Loop time of the last inbound message
+        self.lastActive: float = 0.0    # Loop time of the last user event
+        self.quota: Optional[SessionQuota] = quota
+        self.sizes: Dict[Hash, int] = {}    # Approximate bytes pinned per resource in the graph
+        self.bytes = 0
+        self.wheelSlot: Optional[int] = None
+        self.callLimit = asyncio.Semaphore(max_calls)   # Concurrent handler calls running in a pool
     
     def request(self, data):
         return self.requestManager.request(data)
 
+    def run(self, coroutine: Awaitable):
+        # Work started on behalf of this client is cancelled when it disconnects
+        task = asyncio.ensure_future(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def start(self):
+        self.outbox.start()
+
+    def close(self):
+        self.outbox.close()
+        self.requestManager.cancelAll()
+        for task in list(self.tasks):
+            task.cancel()
+
+    async def send(self, message: Dict):
+        # Queued for the writer task; waits only if the overflow policy makes producers wait
+        await self.outbox.put(message)
+
     def rerender(self, element: object):
+        self.renderResources([hashResource(element)])
+
+    def prerender(self):
+        # Renders the whole tree synchronously, as if it had been sent to the browser
+        current.user = self
+        current.request = None
+        result = self._rerender(self.root.hash)
+        self.sent.update(result)
+        return result
+
+    def release(self):
+        # Gives back this client's references to the shared resources
+        for resource_hash in list(self.referenceGraph.nodes):
+            self.resourceManager.unsubscribe(resource_hash, self)
+            if resource_hash != self.root.hash:
+                self.resourceManager.decRefCount(resource_hash)
+        self.referenceGraph = ReferenceGraph(self.root.hash)
+        self.sent = {}
+        self.suspended = set()
+        self.local = {}
+        if self.quota is not None:
+            self.quota.usedBytes -= self.bytes
+        self.sizes = {}
+        self.bytes = 0
+
+    def attachQuota(self, quota: SessionQuota):
+        # Server-rendered sessions count towards the quota once their browser connects
+        self.quota = quota
+        quota.usedBytes += self.bytes
+
+    def account(self, resource_hash: Hash, size: int):
+        delta = size - self.sizes.get(resource_hash, 0)
+        if size > 0:
+            self.sizes[resource_hash] = size
+        else:
+            self.sizes.pop(resource_hash, None)
+        self.bytes += delta
+        if self.quota is not None:
+            self.quota.usedBytes += delta
+
+    def usage(self):
+        return {'nodes': len(self.referenceGraph.nodes), 'bytes': self.bytes}
+
+    def renderResources(self, resource_hashes: List[Hash]):
         current.user = self
         current.request = None
-        result = self._rerender(element)
-        asyncio.create_task(self.send_render(result))
+        result: Dict[Hash, Dict] = {}
+        for resource_hash in self.sortByDepth(resource_hashes):
+            # Skip resources already rendered as part of a dirty ancestor, or removed by its render
+            if resource_hash in result or not self.referenceGraph.hasNode(resource_hash):
+                continue
+            result.update(self._rerender(resource_hash))
+        if self.quota is not None and not self.quota.check(self):
+            return
+        message = self.createRenderMessage(result)
+        if message is not None:
+            # Flushes cannot wait for room in the send queue; the outbox merges or defers the frame
+            self.outbox.offer(message)
+
+    def sortByDepth(self, resource_hashes: List[Hash]):
+        # Ancestors first, so that their renders can cover their descendants
+        if len(resource_hashes) <= 1:
+            return resource_hashes
+        remaining = set(resource_hashes)
+        ordered: List[Hash] = []
+        visited = {self.root.hash}
+        queue = deque([self.root.hash])
+        while queue and remaining:
+            node = queue.popleft()
+            if node in remaining:
+                remaining.remove(node)
+                ordered.append(node)
+            for child in self.referenceGraph.getEdges(node):
+                if child not in visited:
+                    visited.add(child)
+                    queue.append(child)
+        return ordered + [resource_hash for resource_hash in resource_hashes if resource_hash in remaining]
     
-    async def send_render(self, result: Dict[Hash, Dict]):
-        await self.websocket.send_json({'event': 'render', 'data': result})
+    async def send_render(self, message: Dict):
+        await self.send(message)
+
+    def createRenderMessage(self, result: Dict[Hash, Dict]):
+        # Resources the browser already has are sent as patches against the last sent tree,
+        # everything else (and trees that changed at the root) as full frames
+        frames: Dict[Hash, Dict] = {}
+        patches: Dict[Hash, list] = {}
+        for resource_hash, serialized in result.items():
+            if resource_hash in self.sent:
+                ops = diffElement(self.sent[resource_hash], serialized)
+                if ops is None:
+                    frames[resource_hash] = serialized
+                elif len(ops) > 0:
+                    patches[resource_hash] = ops
+            else:
+                frames[resource_hash] = serialized
+            self.sent[resource_hash] = serialized
+        if len(frames) == 0 and len(patches) == 0:
+            return None
+        message = {'event': 'render', 'data': frames}
+        if len(patches) > 0:
+            message['patch'] = patches
+        return message
     
-    def _rerender(self, element: object):
-        resource_hash: Hash = hashResource(element)
-
+    def _rerender(self, resource_hash: Hash):
         if not self.referenceGraph.hasNode(resource_hash):
             raise Exception("Cannot rerender non-existent resource")
-        
-        target_resource: RenderableResource = self.resourceManager.resources[resource_hash]
 
-        dependencies = set()
-        original_getattr = target_resource.data.__class__.__getattribute__
-        def new_getattr(self, name):
-            dependencies.add(name)
-            return original_getattr(self, name)
-        target_resource.data.__class__.__getattribute__ = new_getattr
-        result = target_resource.data.__render__()
-        target_resource.data.__class__.__getattribute__ = original_getattr
-        self.resourceManager.addDependencies(resource_hash, dependencies)
-
-        # TODO: Update dependencies
+        total_result: Dict[Hash, Dict] = {}
+        updates: Dict[Hash, Set[Hash]] = {}
+        queued: Set[Hash] = {resource_hash}
+        stack: List[Hash] = [resource_hash]
+        while stack:
+            node_hash = stack.pop()
+            # Rendered once and shared between clients through the resource manager's render cache
+            serialized, reference_resource_list = self.resourceManager.render(node_hash) # Serializable Dict, List[Resource]
+            total_result[node_hash] = serialized
+            if self.resourceManager.isPending(node_hash, self):
+                self.suspended.add(node_hash)
+            else:
+                self.suspended.discard(node_hash)
 
-        # return serialized result and references of resources
-        serialized, reference_resource_list = self.resourceManager.serializeElement(result) # Serializable Dict, List[Resource]
+            hashes: Set[Hash] = set()
+            for reference_resource in reference_resource_list:
+                hashes.add(reference_resource.hash)
+                # Renderables new to this client are rendered within the same batch
+                if isinstance(reference_resource, RenderableResource) and reference_resource.hash not in queued and not self.referenceGraph.hasNode(reference_resource.hash):
+                    queued.add(reference_resource.hash)
+                    stack.append(reference_resource.hash)
+            updates[node_hash] = hashes
 
         # SERIALIZE function adds Resources with 0 refCount to resourceManager
         # incRefCount function must be called for resources with 0 refCount
 
-        hashes: Set[Hash] = set()
-        for reference_resource in reference_resource_list:
-            hashes.add(reference_resource.hash)
-
-        created_nodes_hash, deleted_nodes_hash = self.referenceGraph.updateGraph(resource_hash, hashes)
+        start = time.perf_counter()
+        created_nodes_hash, deleted_nodes_hash = self.referenceGraph.applyUpdates(updates)
 
         for created_node_hash in created_nodes_hash:
             self.resourceManager.incRefCount(created_node_hash)
+            self.resourceManager.subscribe(created_node_hash, self)
 
         for deleted_node_hash in deleted_nodes_hash:
+            self.account(deleted_node_hash, 0)
+            self.resourceManager.unsubscribe(deleted_node_hash, self)
             self.resourceManager.decRefCount(deleted_node_hash)
-        
-        assert all(self.resourceManager.resources[resource_hash].refCount > 0 for resource_hash in self.resourceManager.resources), "All resources in resourceManager must have refCount > 0"
+            self.sent.pop(deleted_node_hash, None)
+            self.suspended.discard(deleted_node_hash)
+            self.local.pop(deleted_node_hash, None)
+            total_result.pop(deleted_node_hash, None)
 
-        total_result = { resource_hash: serialized }
-        
-        for created_node_hash in created_nodes_hash:
-            if isinstance(self.resourceManager.resources[created_node_hash], RenderableResource):
-                rerender_result = self._rerender(self.resourceManager.resources[created_node_hash].data)
-                total_result.update(rerender_result)
-        
+        for node_hash in created_nodes_hash.union(total_result):
+            self.account(node_hash, self.resourceManager.resourceSize(node_hash))
+
+        if self.resourceManager.metrics is not None:
+            self.resourceManager.metrics.graphUpdated(time.perf_counter() - start, len(created_nodes_hash), len(deleted_nodes_hash))
         return total_result
         
 
 class PyXWebSocketEndpoint(WebSocketEndpoint):
-    encoding = 'json'
+    encoding = None     # Messages are decoded with the codec negotiated for the connection
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.application: PyX = self.scope['app']
         self.client: Client = None
     
     async def on_connect(self, websocket):
-        await websocket.accept()
-        self.client = Client(websocket, self.application.resource_manager.root, self.application.resource_manager)
+        wire, subprotocol = negotiate(websocket.scope.get('subprotocols', []), self.application.codec, self.application.compression)
+        await websocket.accept(subprotocol=subprotocol)
+        # Pages rendered on the server connect with the token of the session that rendered them
+        adopted = self.application.sessions.adopt(websocket.query_params.get('session'))
+        if adopted is not None:
+            self.client, versions = adopted
+            self.client.websocket = websocket
+            self.client.wire = wire
+            self.client.attachQuota(self.application.quota)
+        else:
+            self.client = self.application.createClient(websocket, wire)
+        self.client.start()
         self.application.clients.add(self.client)
+        self.application.supervisor.add(self.client)
+        self.client.lastActive = self.client.lastSeen
 
         current.user = self.client
-        self.application.onConnect()
-
-        # Send root resource hash
-        await websocket.send_json({'event': 'root', 'data': self.client.root.hash})
+        if adopted is None:
+            # Adopted sessions ran the hook before they were rendered
+            self.application.onConnect()
 
-        # Send initial render
-        self.client.rerender(self.application.component)
+            # Send root resource hash
+            await self.client.send({'event': 'root', 'data': self.client.root.hash})
 
-        # Start heartbeat
-        asyncio.create_task(self.heartbeat())
-
-    async def heartbeat(self):
-        while True:
-            await asyncio.sleep(10)
-            try:
-                await self.websocket.send_json({'event': 'heartbeat'})
-            except:
-                break
+            # Send initial render
+            self.client.rerender(self.application.component)
+        else:
+            # The browser already has the server-rendered tree; only resources that changed since are sent
+            resources = self.application.resource_manager.resources
+            stale = [resource_hash for resource_hash, version in versions.items() if resource_hash in resources and resources[resource_hash].version != version]
+            # So are async renders that settled after the page was rendered
+            stale += [resource_hash for resource_hash in self.client.suspended if resource_hash not in stale]
+            if len(stale) > 0:
+                self.client.renderResources(stale)
+            else:
+                self.application.quota.check(self.client)
 
     async def on_receive(self, websocket, data):
+        self.client.lastSeen = asyncio.get_running_loop().time()
+        start = time.perf_counter()
+        event = 'invalid'
         try:
-            if data['event'] == 'resource_event':
+            data = self.client.wire.decode(data)
+            # Metrics are labelled by event; anything else the client sends is counted as invalid
+            event = data['event'] if data['event'] in EVENTS else 'invalid'
+            if data['event'] == 'pong':
+                pass
+            elif data['event'] == 'resource_event':
+                self.client.lastActive = self.client.lastSeen
                 resource_hash: Hash = data['data']['id']
                 if resource_hash not in self.client.referenceGraph.nodes:
                     # Resource should be in referenceGraph to be accessible (for security reasons)
@@ -151,71 +395,263 @@ class PyXWebSocketEndpoint(WebSocketEndpoint):
                 resource.event(data['data']['data'], self.client)
             elif data['event'] == 'response':
                 self.client.requestManager.response(data['data'])
+            elif data['event'] == 'responses':
+                for response in data['data']:
+                    self.client.requestManager.response(response)
             else:
                 raise Exception("Invalid event")
         except Exception as e:
             import traceback
             traceback.print_exc()
+        if self.application.metrics is not None:
+            self.application.metrics.dispatched(event, time.perf_counter() - start)
 
 
     async def on_disconnect(self, websocket, close_code):
-        current.user = self.client
-        self.application.onDisconnect()
-        self.application.clients.remove(self.client)
+        if self.client is not None:
+            self.application.dropClient(self.client)
 
 
 class PyX(Starlette):
-    def __init__(self, component):
+    def __init__(self, component, frame_budget: float = 0, codec: Union[str, Codec] = 'json', compression: Union[str, DeflateCompression, None] = None, ssr: bool = True, session_ttl: float = 30, max_pending_sessions: Optional[int] = 256, executor: str = 'inline', max_workers: Optional[int] = None, max_client_calls: int = 4, request_timeout: float = 30, send_queue: int = 256, overflow: str = 'drop', bus: Optional[Bus] = None, ping_interval: float = 10, ping_timeout: float = 30,
+                 max_session_nodes: Optional[int] = None, max_session_bytes: Optional[int] = None, session_idle_timeout: Optional[float] = None, max_total_bytes: Optional[int] = None,
+                 metrics: Union[bool, Metrics, None] = None, reload: bool = False, reload_paths: Optional[List[str]] = None):
         super().__init__()
         self.component = component
+        self.codec: Codec = getCodec(codec)
+        self.compression: Optional[DeflateCompression] = DeflateCompression() if compression == 'deflate' else compression
         self.resource_manager = ResourceManager(component)
+        self.resource_manager.onStateUpdated = self.rerenderLocal
+        self.resource_manager.onRenderSettled = self.renderSettled
         self.clients = set()
+        self.scheduler = RenderScheduler(self, frame_budget)
+        self.ssr = ssr
+        self.sessions = PendingSessions(session_ttl, max_pending_sessions, self.releaseSession)
+        # Where synchronous event handlers run by default: 'inline', 'thread' or 'process'
+        self.executor = HandlerExecutor(executor, max_workers)
+        self.max_client_calls = max_client_calls
+        self.request_timeout = request_timeout     # Seconds the browser has to answer a request
+        # Messages queued per client, and what happens when a slow browser fills the queue:
+        # 'disconnect', 'drop' (renders are resent in full later) or 'block'
+        if overflow not in OVERFLOW_POLICIES:
+            raise Exception(f"Unknown overflow policy {overflow}")
+        self.send_queue = send_queue
+        self.overflow = overflow
+
+        # What one session may pin in the resource manager, and when idle sessions are evicted
+        self.quota = SessionQuota(self, max_session_nodes, max_session_bytes, session_idle_timeout, max_total_bytes)
+
+        # Pings quiet connections and tears down the ones that stop answering
+        self.supervisor = ConnectionSupervisor(self, ping_interval, ping_timeout)
+        self.router.on_shutdown.append(self.supervisor.stop)
+
+        # With a bus, this app is one of several workers sharing the objects registered with share()
+        self.broadcaster: Optional[Broadcaster] = Broadcaster(self, bus) if bus is not None else None
+        if self.broadcaster is not None:
+            self.router.on_startup.append(self.broadcaster.start)
+            self.router.on_shutdown.append(self.broadcaster.close)
+        self.router.on_shutdown.append(self.executor.shutdown)
+        self.router.on_shutdown.append(self.resource_manager.pendingRenders.cancelAll)
+
+        # Counters and histograms served at /metrics; pass Metrics(profile=True) to also sample render time
+        self.metrics: Optional[Metrics] = Metrics() if metrics is True else (metrics or None)
+        if self.metrics is not None:
+            self.metrics.attach(self)
+            self.resource_manager.metrics = self.metrics
+            self.router.on_startup.append(self.metrics.start)
+            self.router.on_shutdown.append(self.metrics.stop)
+
+        # Development mode: edited modules are reloaded and the affected components rerendered
+        self.reloader: Optional[HotReloader] = HotReloader(self, reload_paths) if reload else None
+        if self.reloader is not None:
+            self.router.on_startup.append(self.reloader.start)
+            self.router.on_shutdown.append(self.reloader.stop)
+
+        self.assets: AssetPipeline = None
+        self.initialize_public_directory()
 
         @self.route('/')
         async def homepage(request):
-            # If ./public/index.html exists, serve it
-            # Otherwise, serve the default index.html
-            if os.path.exists('./public/index.html'):
-                return HTMLResponse(open('./public/index.html').read())
-            else:
-                module_dir = os.path.dirname(os.path.realpath(__file__))
-                return HTMLResponse(open(f'{module_dir}/assets/index.html').read())
-        
-        @self.route('/pyx2.js')
-        async def pyx2js(request):
-            module_dir = os.path.dirname(os.path.realpath(__file__))
-            return FileResponse(f'{module_dir}/assets/pyx2.js')
+            # ./public/index.html overrides the default index.html
+            index = self.assets.assets['/index.html']
+            if not self.ssr:
+                return index.response(request)
+            page = index.encodings['identity'].decode()
+            # Pages without a root to render into, and page loads beyond the pending session cap,
+            # are rendered by the browser instead
+            if ROOT_ELEMENT not in page or self.sessions.full():
+                return index.response(request)
+            return HTMLResponse(self.prerender(page), headers={'Cache-Control': 'no-store'})
         
         @self.route('/images/{filename}')
         async def images(request):
-            # filename: RESOURCE_HASH.png
+            # filename: RESOURCE_HASH, optionally followed by an extension; ?t=TOKEN is the
+            # resource's access token and ?v=VERSION busts caches
             filename = request.path_params['filename']
-            resource_hash = filename.split('.')[0]
-            if resource_hash in self.resource_manager.resources:
-                pil_img = self.resource_manager.resources[resource_hash].data
-                # Do not save the image to disk, serve it directly.
-                # Change PIL.Image to png bytes
-                img_bytes = io.BytesIO()
-                pil_img.save(img_bytes, format='PNG')
-                img_bytes = img_bytes.getvalue()
-                return Response(content=img_bytes, media_type="image/png")
-            else:
+            try:
+                resource_hash = int(filename.split('.')[0])
+            except ValueError:
+                return HTMLResponse("Image not found", status_code=404)
+            resource = self.resource_manager.resources.get(resource_hash)
+            if not isinstance(resource, ImageResource) or not resource.allows(request.query_params.get('t')):
                 return HTMLResponse("Image not found", status_code=404)
 
+            format, quality = negotiateFormat(resource.data, request.headers.get('accept', ''))
+            version = resource.version
+            etag = f'"{resource_hash}-{version}-{format}-{quality}"'
+            headers = {
+                'ETag': etag,
+                'Vary': 'Accept',
+                # Versioned URLs never change content; unversioned or outdated ones must revalidate
+                'Cache-Control': 'public, max-age=31536000, immutable' if request.query_params.get('v') == str(version) else 'no-cache',
+            }
+            if etag in request.headers.get('if-none-match', ''):
+                return Response(status_code=304, headers=headers)
+
+            content = await self.resource_manager.imageCache.get(resource_hash, version, resource.data, format, quality)
+            return Response(content=content, media_type=MEDIA_TYPES[format], headers=headers)
+
+        @self.route('/arrays/{filename}')
+        async def arrays(request):
+            # Raw little-endian bytes of an array resource. Browsers holding part of a growing
+            # Series request the rest with `Range: bytes=START-`.
+            filename = request.path_params['filename']
+            try:
+                resource_hash = int(filename.split('.')[0])
+            except ValueError:
+                return HTMLResponse("Array not found", status_code=404)
+            resource = self.resource_manager.resources.get(resource_hash)
+            if not isinstance(resource, ArrayResource) or not resource.allows(request.query_params.get('t')):
+                return HTMLResponse("Array not found", status_code=404)
+
+            dtype, shape, size = arrayInfo(resource.data)
+            # The version of the last render that referenced the array; the bytes are not hashed again here
+            immutable = not isinstance(resource.data, Series) and request.query_params.get('v') == str(resource.version)
+            headers = {
+                'Accept-Ranges': 'bytes',
+                'X-PyX-Dtype': dtype,
+                'X-PyX-Shape': ','.join(str(dimension) for dimension in shape),
+                'Cache-Control': 'public, max-age=31536000, immutable' if immutable else 'no-cache',
+            }
+            start, end = 0, size
+            if 'range' in request.headers:
+                byte_range = parseRange(request.headers['range'], size)
+                if byte_range is None:
+                    return Response(status_code=416, headers={'Content-Range': f'bytes */{size}'})
+                start, end = byte_range
+                headers['Content-Range'] = f'bytes {start}-{end - 1}/{size}'
+            headers['Content-Length'] = str(end - start)
+            status_code = 206 if 'Content-Range' in headers else 200
+            return StreamingResponse(resource.chunks(start, end), status_code=status_code, media_type='application/octet-stream', headers=headers)
+
+        if self.metrics is not None:
+            @self.route('/metrics')
+            async def metrics(request):
+                return Response(self.metrics.export(), media_type='text/plain; version=0.0.4; charset=utf-8')
+
         self.add_websocket_route('/ws', PyXWebSocketEndpoint)
 
+        # Assets are served when no route matched, so routes added to the app later take precedence
+        self.router.default = self.serveAsset
+
     async def __call__(self, scope, receive, send):
         current.app = self
-        self.initialize_public_directory()
+        self.scheduler.loop = asyncio.get_running_loop()
         await super().__call__(scope, receive, send)
 
+    async def serveAsset(self, scope, receive, send):
+        if scope['type'] == 'http':
+            # The path within the app, as routes see it when the app is mounted under a prefix
+            path, root_path = scope['path'], scope.get('root_path', '')
+            if root_path and path.startswith(root_path + '/'):
+                path = path[len(root_path):]
+            asset, immutable = self.assets.get(path)
+            if asset is not None:
+                await asset.response(Request(scope, receive), immutable)(scope, receive, send)
+                return
+        await self.router.not_found(scope, receive, send)
+
     def initialize_public_directory(self):
-        pass
+        # Loaded once at startup; files in ./public override the bundled assets
+        module_dir = os.path.dirname(os.path.realpath(__file__))
+        self.assets = AssetPipeline([f'{module_dir}/assets', './public'])
+
+    def dropClient(self, client: Client, close_code: Optional[int] = None):
+        # Tears a client down once, whether it disconnected, was found dead or was evicted,
+        # and releases everything its graph pinned in the resource manager
+        if client not in self.clients:
+            return
+        current.user = client
+        self.onDisconnect()
+        self.clients.remove(client)
+        self.supervisor.remove(client)
+        client.close()
+        client.release()
+        if close_code is not None and client.websocket is not None:
+            asyncio.ensure_future(self.closeWebSocket(client.websocket, close_code))
+
+    async def closeWebSocket(self, websocket: WebSocket, close_code: int):
+        # Half-open connections may never complete the closing handshake
+        try:
+            await asyncio.wait_for(websocket.close(code=close_code), 5)
+        except Exception:
+            pass
+
+    def createClient(self, websocket: Optional[WebSocket], wire: Optional[WireFormat], pending: bool = False):
+        # Pending (server-rendered) sessions are left out of the quota until they are adopted,
+        # since only connected sessions can be evicted to make room
+        return Client(websocket, self.resource_manager.root, self.resource_manager, wire, self.max_client_calls, self.request_timeout, self.send_queue, self.overflow, None if pending else self.quota)
+
+    def prerender(self, page: str):
+        # Renders the root for a new session and embeds the tree, so the browser can hydrate it
+        # and attach its WebSocket to the session instead of waiting for the initial render.
+        # The connect hook runs first, so the render sees whatever it sets up for the user.
+        client = self.createClient(None, None, pending=True)
+        current.user = client
+        self.onConnect()
+        frames = client.prerender()
+        resources = self.resource_manager.resources
+        versions = {resource_hash: resources[resource_hash].version for resource_hash in frames}
+        token = self.sessions.create(client, versions)
+        markup = renderToHTML(frames, client.root.hash)
+        return embedState(page, markup, {'session': token, 'root': client.root.hash, 'resources': frames})
+
+    def releaseSession(self, client: Client):
+        # A server-rendered session the browser never connected to
+        current.user = client
+        self.onDisconnect()
+        client.release()
 
     def rerender(self, element: object):
-        for client in self.clients:
-            if client.referenceGraph.hasNode(hashResource(element)):
-                client.rerender(element)
+        self.rerenderLocal(element)
+        if self.broadcaster is not None:
+            self.broadcaster.rerendered(element)
+
+    def rerenderLocal(self, element: object):
+        # Renders are deferred to the scheduler, which flushes every dirty resource once per tick
+        resource_hash = hashResource(element)
+        self.resource_manager.invalidate(resource_hash)
+        self.scheduler.markDirty(resource_hash)
+
+    def renderSettled(self, resource_hash: Hash, owner: Optional[Client]):
+        # An async render finished. Shared results are in the render cache under the current
+        # version, so the subscribers pick them up without invalidating it
+        if owner is None:
+            self.scheduler.markDirty(resource_hash)
+        elif owner in self.clients:
+            owner.renderResources([resource_hash])
+
+    def subscriberCount(self, element: object):
+        # Number of sessions currently showing the element
+        return self.resource_manager.subscriberCount(hashResource(element))
+
+    def share(self, name: str, obj: object):
+        # Registers an object that exists in every worker under `name`. Attribute writes and
+        # rerenders are broadcast to the other workers, which rerender their own clients.
+        if self.broadcaster is None:
+            trackInstance(obj)
+            return obj
+        return self.broadcaster.share(name, obj)
 
     def onConnect(self):
         pass
@@ -0,0 +1,110 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from typing import Dict, List
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml', 'application/xml')
+MIN_COMPRESS_SIZE = 256
+
+
+class Asset:
+    __slots__ = ('path', 'mediaType', 'digest', 'hashedPath', 'encodings')
+
+    def __init__(self, path: str, content: bytes, mediaType: str):
+        self.path = path
+        self.mediaType = mediaType
+        self.digest = hashlib.sha256(content).hexdigest()[:16]
+        root, extension = os.path.splitext(path)
+        self.hashedPath = f'{root}.{self.digest[:8]}{extension}'
+        self.encodings: Dict[str, bytes] = {'identity': content}
+        if len(content) >= MIN_COMPRESS_SIZE and mediaType.startswith(COMPRESSIBLE_TYPES):
+            gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+            if len(gzipped) < len(content):
+                self.encodings['gzip'] = gzipped
+            if brotli is not None:
+                compressed = brotli.compress(content, quality=11)
+                if len(compressed) < len(content):
+                    self.encodings['br'] = compressed
+
+    def pickEncoding(self, acceptEncoding: str):
+        accepted = {token.split(';')[0].strip() for token in acceptEncoding.split(',')}
+        for encoding in ('br', 'gzip'):
+            if encoding in self.encodings and encoding in accepted:
+                return encoding
+        return 'identity'
+
+    def response(self, request: Request, immutable: bool = False):
+        encoding = self.pickEncoding(request.headers.get('accept-encoding', ''))
+        etag = f'"{self.digest}"' if encoding == 'identity' else f'"{self.digest}-{encoding}"'
+        headers = {
+            'ETag': etag,
+            'Vary': 'Accept-Encoding',
+            'Cache-Control': 'public, max-age=31536000, immutable' if immutable else 'no-cache',
+        }
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        if etag in request.headers.get('if-none-match', ''):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.encodings[encoding], media_type=self.mediaType, headers=headers)
+
+
+class AssetPipeline:
+    # Loads every file of the given directories once, precompresses them and serves them from
+    # memory. Later directories override earlier ones. References to other assets in index.html
+    # are rewritten to content-hashed URLs, which are served as immutable.
+    def __init__(self, directories: List[str]):
+        self.assets: Dict[str, Asset] = {}
+        self.hashed: Dict[str, Asset] = {}
+        files: Dict[str, str] = {}
+        for directory in directories:
+            if not os.path.isdir(directory):
+                continue
+            for dirpath, _, filenames in os.walk(directory):
+                for filename in filenames:
+                    filepath = os.path.join(dirpath, filename)
+                    path = '/' + os.path.relpath(filepath, directory).replace(os.sep, '/')
+                    files[path] = filepath
+
+        for path, filepath in files.items():
+            if path == '/index.html':
+                continue
+            with open(filepath, 'rb') as file:
+                self.add(path, file.read())
+
+        if '/index.html' in files:
+            with open(files['/index.html'], 'rb') as file:
+                self.add('/index.html', self.rewrite(file.read().decode()).encode())
+
+    def add(self, path: str, content: bytes):
+        mediaType = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if mediaType.startswith('text/') or mediaType == 'application/javascript':
+            mediaType += '; charset=utf-8'
+        asset = Asset(path, content, mediaType)
+        self.assets[path] = asset
+        self.hashed[asset.hashedPath] = asset
+        return asset
+
+    def rewrite(self, html: str):
+        def replace(match):
+            path = '/' + match.group(3)
+            if path not in self.assets:
+                return match.group(0)
+            # Keep the reference relative if it was, so apps mounted under a prefix keep working
+            return f'{match.group(1)}="{match.group(2) or ""}{self.assets[path].hashedPath[1:]}"'
+        return re.sub(r'(src|href)="(\./|/)?([^"/:?#][^":?#]*)"', replace, html)
+
+    def get(self, path: str):
+        # Returns (asset, immutable)
+        if path in self.hashed and path not in self.assets:
+            return self.hashed[path], True
+        return self.assets.get(path), False
@@ -0,0 +1,332 @@
+import asyncio
+import fcntl
+import os
+import pickle
+import socket
+import stat
+import struct
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .tracking import addWriteListener, trackInstance, unwatchContainer, watchContainer
+
+# Scale-out: every worker runs its own copy of the app and serves its own (sticky) clients.
+# Objects registered with `app.share(name, obj)` exist in every worker under the same name;
+# writes to their attributes and `app.rerender(obj)` calls are published on a bus, and every
+# worker applies them to its copy and rerenders its own subscribed clients.
+
+MAX_PEER_BUFFER = 16 * 1024 * 1024
+
+
+class Bus:
+    # Transport between the workers of one app. `publish` must not block and must keep order;
+    # every message published by another worker is passed to the handler given to `start`, on
+    # the event loop. A Redis-like backend implements these three methods.
+    async def start(self, handler: Callable[[Dict], None]):
+        raise NotImplementedError
+
+    def publish(self, message: Dict):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class LocalBus(Bus):
+    # Connects apps within one process (tests, several apps on one loop). Messages are copied
+    # through pickle so that apps never share objects, as with real workers.
+    channels: Dict[str, List['LocalBus']] = {}
+
+    def __init__(self, channel: str = 'default'):
+        self.channel = channel
+        self.handler: Optional[Callable[[Dict], None]] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self, handler: Callable[[Dict], None]):
+        self.handler = handler
+        self.loop = asyncio.get_running_loop()
+        self.channels.setdefault(self.channel, []).append(self)
+
+    def publish(self, message: Dict):
+        data = pickle.dumps(message)
+        for bus in self.channels.get(self.channel, []):
+            if bus is not self:
+                bus.loop.call_soon_threadsafe(bus.handler, pickle.loads(data))
+
+    async def close(self):
+        members = self.channels.get(self.channel, [])
+        if self in members:
+            members.remove(self)
+
+
+def privateDirectory():
+    # $XDG_RUNTIME_DIR, or a directory of our own in the temporary directory. Either way only this
+    # user may create, replace or connect to the files in it.
+    directory = os.environ.get('XDG_RUNTIME_DIR') or os.path.join(tempfile.gettempdir(), f'pyx2-{os.getuid()}')
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise Exception(f"Cannot use {directory} for the bus: it must be a directory only its owner can access")
+    return directory
+
+
+def peerUid(writer: asyncio.StreamWriter):
+    # The uid of the process at the other end of a unix socket, or None where the platform cannot tell
+    sock = writer.get_extra_info('socket')
+    if sock is None or not hasattr(socket, 'SO_PEERCRED'):
+        return None
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    return struct.unpack('3i', credentials)[1]
+
+
+class UnixSocketBus(Bus):
+    # Workers on one host. The worker holding the lock file accepts connections on `path` and
+    # relays every frame to the other workers; the others connect to it, and take over when it
+    # exits. Frames are length-prefixed pickles, so the socket and its lock live in a private
+    # directory by default, the socket is created accessible to its owner only, and peers running
+    # as another user are refused on both ends.
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.handler: Optional[Callable[[Dict], None]] = None
+        self.lock: Optional[int] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.peers: Set[asyncio.StreamWriter] = set()
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.tasks: Set[asyncio.Task] = set()
+        self.closed = False
+
+    async def start(self, handler: Callable[[Dict], None]):
+        self.handler = handler
+        if self.path is None:
+            self.path = os.path.join(privateDirectory(), 'pyx2.sock')
+        await self.connect()
+
+    async def connect(self):
+        for attempt in range(50):
+            if self.closed:
+                return
+            if self.acquire():
+                if os.path.exists(self.path):
+                    os.unlink(self.path)    # Left behind by a relay that is gone
+                # Bound under a restrictive umask, so the socket is never accessible to others
+                umask = os.umask(0o177)
+                try:
+                    self.server = await asyncio.start_unix_server(self.accept, path=self.path)
+                finally:
+                    os.umask(umask)
+                return
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+                if not self.trusted(writer):
+                    writer.close()
+                    raise Exception(f"The bus at {self.path} is run by another user")
+                self.writer = writer
+                self.spawn(self.read(reader, None))
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                # The relay is starting up or shutting down
+                await asyncio.sleep(0.02 * (attempt + 1))
+        raise Exception(f"Cannot connect to the bus at {self.path}")
+
+    def acquire(self):
+        try:
+            fd = os.open(self.path + '.lock', os.O_CREAT | os.O_RDWR | os.O_NOFOLLOW, 0o600)
+        except OSError as error:
+            raise Exception(f"Cannot open the bus lock file {self.path}.lock: {error}")
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self.lock = fd
+        return True
+
+    def spawn(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def trusted(self, writer: asyncio.StreamWriter):
+        uid = peerUid(writer)
+        return uid is None or uid == os.getuid()
+
+    async def accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        if not self.trusted(writer):
+            writer.close()
+            return
+        self.peers.add(writer)
+        try:
+            await self.read(reader, writer)
+        except asyncio.CancelledError:
+            pass    # Shutting down; asyncio's stream callback does not expect a cancelled handler
+        finally:
+            self.peers.discard(writer)
+            writer.close()
+
+    async def read(self, reader: asyncio.StreamReader, source: Optional[asyncio.StreamWriter]):
+        try:
+            while True:
+                header = await reader.readexactly(4)
+                data = await reader.readexactly(int.from_bytes(header, 'big'))
+                if self.server is not None:
+                    self.relay(header + data, source)
+                self.handler(pickle.loads(data))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        if source is None and not self.closed:
+            # Lost the relay; one of the remaining workers takes over
+            self.writer = None
+            self.spawn(self.connect())
+
+    def relay(self, frame: bytes, source: Optional[asyncio.StreamWriter]):
+        for peer in list(self.peers):
+            if peer is source:
+                continue
+            if peer.transport.get_write_buffer_size() > MAX_PEER_BUFFER:
+                # A worker that stopped reading is dropped rather than buffered without bound
+                self.peers.discard(peer)
+                peer.close()
+                continue
+            peer.write(frame)
+
+    def publish(self, message: Dict):
+        # Messages published while reconnecting to a new relay are lost
+        data = pickle.dumps(message)
+        frame = len(data).to_bytes(4, 'big') + data
+        if self.server is not None:
+            self.relay(frame, None)
+        elif self.writer is not None:
+            self.writer.write(frame)
+
+    async def close(self):
+        self.closed = True
+        for task in list(self.tasks):
+            task.cancel()
+        if self.writer is not None:
+            self.writer.close()
+        for peer in list(self.peers):
+            peer.close()
+        if self.server is not None:
+            self.server.close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+        if self.lock is not None:
+            os.close(self.lock)
+            self.lock = None
+
+
+class Broadcaster:
+    # Publishes writes to shared objects and rerenders of them, coalesced once per event-loop
+    # tick, and applies the ones received from other workers
+    def __init__(self, app: Any, bus: Bus):
+        self.app = app
+        self.bus = bus
+        self.objects: Dict[str, object] = {}
+        self.names: Dict[int, str] = {}
+        self.containers: Dict[int, Tuple[str, str]] = {}   # Containers held by shared attributes
+        self.held: Dict[Tuple[str, str], object] = {}     # And the other way around
+        self.changes: Dict[Tuple[str, str], None] = {}
+        self.rerenders: Dict[str, None] = {}
+        self.handle: Any = None
+        self.applying = False
+        self.published = 0
+        self.received = 0
+        addWriteListener(self.written)
+
+    async def start(self):
+        await self.bus.start(self.receive)
+
+    async def close(self):
+        await self.bus.close()
+
+    def share(self, name: str, obj: object):
+        if name in self.objects and self.objects[name] is not obj:
+            raise Exception(f"Shared name {name} is already in use")
+        if not hasattr(obj, '__dict__') or not trackInstance(obj):
+            raise Exception(f"Cannot share {type(obj)} objects")
+        self.objects[name] = obj
+        self.names[id(obj)] = name
+        for attr, value in vars(obj).items():
+            self.adopt(name, attr, value)
+        return obj
+
+    def adopt(self, name: str, attr: str, value: object):
+        # In-place mutations of top-level containers are published as the whole attribute
+        previous = self.held.pop((name, attr), None)
+        if previous is not None:
+            if previous is value:
+                self.held[(name, attr)] = value
+                return
+            self.containers.pop(id(previous), None)
+            unwatchContainer(previous)
+        if isinstance(value, (list, dict, set)):
+            self.containers[id(value)] = (name, attr)
+            self.held[(name, attr)] = value
+            watchContainer(value)
+
+    def written(self, obj: object, attr: str):
+        if self.applying:
+            return
+        key = id(obj)
+        if key in self.names and self.objects.get(self.names[key]) is obj:
+            name = self.names[key]
+            self.adopt(name, attr, vars(obj).get(attr))
+            self.queue(self.changes, (name, attr))
+        elif key in self.containers:
+            name, attr = self.containers[key]
+            if vars(self.objects[name]).get(attr) is obj:
+                self.queue(self.changes, (name, attr))
+
+    def rerendered(self, element: object):
+        name = self.names.get(id(element))
+        if name is not None and self.objects[name] is element and not self.applying:
+            self.queue(self.rerenders, name)
+
+    def queue(self, pending: Dict, key: Any):
+        scheduler = self.app.scheduler
+        if scheduler.loop is not None and not scheduler.loop.is_closed() and not scheduler.inLoop():
+            # Written from a handler running in a pool thread
+            scheduler.loop.call_soon_threadsafe(self.queue, pending, key)
+            return
+        pending[key] = None
+        if self.handle is None:
+            try:
+                self.handle = asyncio.get_running_loop().call_soon(self.flush)
+            except RuntimeError:
+                self.flush()
+
+    def flush(self):
+        self.handle = None
+        changes, self.changes = self.changes, {}
+        rerenders, self.rerenders = self.rerenders, {}
+        state = []
+        deleted = []
+        for name, attr in changes:
+            values = vars(self.objects[name])
+            if attr in values:
+                state.append((name, attr, values[attr]))
+            else:
+                deleted.append((name, attr))
+        self.published += 1
+        self.bus.publish({'state': state, 'deleted': deleted, 'rerender': list(rerenders)})
+
+    def receive(self, message: Dict):
+        # Writes go through the tracked attributes, so local renders that read them are scheduled
+        self.received += 1
+        self.applying = True
+        try:
+            for name, attr, value in message['state']:
+                if name in self.objects:
+                    setattr(self.objects[name], attr, value)
+                    self.adopt(name, attr, vars(self.objects[name])[attr])
+            for name, attr in message['deleted']:
+                if name in self.objects and attr in vars(self.objects[name]):
+                    delattr(self.objects[name], attr)
+            for name in message['rerender']:
+                if name in self.objects:
+                    self.app.rerenderLocal(self.objects[name])
+        finally:
+            self.applying = False
@@ -0,0 +1,133 @@
+import json
+import zlib
+from typing import List, Optional, Union
+
+# Codecs are negotiated through the WebSocket subprotocol header: the browser offers
+# `pyx2.<format>` and `pyx2.<format>+deflate` variants, and the server accepts the one matching
+# its configuration. Clients that offer no subprotocol get plain JSON text frames.
+PROTOCOL_PREFIX = 'pyx2.'
+
+
+class Codec:
+    name = 'json'       # Wire format understood by pyx2.js
+    binary = False
+
+    def encode(self, message: object) -> Union[str, bytes]:
+        raise NotImplementedError
+
+    def decode(self, data: Union[str, bytes]) -> object:
+        raise NotImplementedError
+
+
+class JSONCodec(Codec):
+    name = 'json'
+
+    def encode(self, message: object):
+        return json.dumps(message, separators=(',', ':'))
+
+    def decode(self, data: Union[str, bytes]):
+        return json.loads(data)
+
+
+class FastJSONCodec(Codec):
+    # Same wire format as JSONCodec, encoded with orjson
+    name = 'json'
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise Exception("FastJSONCodec requires the orjson package")
+        self.orjson = orjson
+
+    def encode(self, message: object):
+        return self.orjson.dumps(message, option=self.orjson.OPT_NON_STR_KEYS).decode()
+
+    def decode(self, data: Union[str, bytes]):
+        return self.orjson.loads(data)
+
+
+class MessagePackCodec(Codec):
+    name = 'msgpack'
+    binary = True
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError:
+            raise Exception("MessagePackCodec requires the msgpack package")
+        self.msgpack = msgpack
+
+    def encode(self, message: object):
+        return self.msgpack.packb(message, use_bin_type=True)
+
+    def decode(self, data: Union[str, bytes]):
+        return self.msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+codecs = {
+    'json': JSONCodec,
+    'orjson': FastJSONCodec,
+    'msgpack': MessagePackCodec,
+}
+
+
+def getCodec(codec: Union[str, Codec]) -> Codec:
+    if isinstance(codec, Codec):
+        return codec
+    if codec not in codecs:
+        raise Exception(f"Unknown codec {codec}")
+    return codecs[codec]()
+
+
+class DeflateCompression:
+    # A raw deflate stream per connection, flushed after every frame. The compression window is
+    # kept across frames, so keys like __type__ and PyXElement that repeat from frame to frame
+    # shrink to back-references. Every frame is prefixed with its uncompressed length.
+    name = 'deflate'
+
+    def __init__(self, level: int = 6, window_bits: int = 13, mem_level: int = 5):
+        self.level = level
+        self.window_bits = window_bits
+        self.mem_level = mem_level
+
+    def compressor(self):
+        return zlib.compressobj(self.level, zlib.DEFLATED, -self.window_bits, self.mem_level)
+
+
+class WireFormat:
+    # The negotiated codec of one connection, with its own compression state
+    def __init__(self, codec: Codec, compression: Optional[DeflateCompression] = None):
+        self.codec = codec
+        self.compressor = compression.compressor() if compression is not None else None
+        self.binary = codec.binary or self.compressor is not None
+        self.protocol = protocolName(codec, compression)
+
+    def encode(self, message: object) -> Union[str, bytes]:
+        data = self.codec.encode(message)
+        if self.compressor is None:
+            return data
+        if isinstance(data, str):
+            data = data.encode()
+        return self.compressor.compress(len(data).to_bytes(4, 'big') + data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def decode(self, data: Union[str, bytes]) -> object:
+        # Browsers send uncompressed frames
+        return self.codec.decode(data)
+
+
+def protocolName(codec: Codec, compression: Optional[DeflateCompression] = None):
+    return PROTOCOL_PREFIX + codec.name + ('+' + compression.name if compression is not None else '')
+
+
+def negotiate(offered: List[str], codec: Codec, compression: Optional[DeflateCompression]):
+    # Returns the wire format for the connection and the subprotocol to accept.
+    # Clients without a common subprotocol fall back to plain JSON.
+    candidates = [(codec, compression), (codec, None)]
+    if codec.name != 'json':
+        candidates.append((JSONCodec(), None))
+    for candidate_codec, candidate_compression in candidates:
+        if protocolName(candidate_codec, candidate_compression) in offered:
+            wire = WireFormat(candidate_codec, candidate_compression)
+            return wire, wire.protocol
+    return WireFormat(JSONCodec()), None
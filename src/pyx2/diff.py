@@ -0,0 +1,117 @@
+from typing import List, Optional
+
+# Patch operations, applied in order by pyx2.js. `path` is the list of child indices leading
+# from the root element of a resource to the element the operation applies to.
+#   ['r', path, value]          replace the node at path
+#   ['p', path, key, value]     set a prop
+#   ['d', path, key]            delete a prop
+#   ['i', path, index, value]   insert a child
+#   ['x', path, index]          remove a child
+#   ['m', path, from, to]       move a child (keyed children)
+Patch = List[list]
+
+
+def isElement(node: object):
+    return isinstance(node, dict) and node.get('__type__') == 'PyXElement'
+
+
+def elementKey(node: object):
+    if isElement(node) and isinstance(node['props'], dict):
+        return node['props'].get('key')
+    return None
+
+
+def diffElement(old: object, new: object) -> Optional[Patch]:
+    # Returns None when the whole tree has to be replaced, so that a full frame is sent instead
+    if not isElement(old) or not isElement(new) or old['tag'] != new['tag'] or elementKey(old) != elementKey(new):
+        return None if old != new else []
+    ops: Patch = []
+    _diffElement(old, new, [], ops)
+    return ops
+
+
+def _diffNode(old: object, new: object, path: list, ops: Patch):
+    if isElement(old) and isElement(new) and old['tag'] == new['tag'] and elementKey(old) == elementKey(new):
+        _diffElement(old, new, path, ops)
+    elif old != new:
+        ops.append(['r', path, new])
+
+
+def _diffElement(old: dict, new: dict, path: list, ops: Patch):
+    oldProps, newProps = old['props'], new['props']
+    if oldProps is not newProps:
+        if isinstance(oldProps, dict) and isinstance(newProps, dict):
+            for key, value in newProps.items():
+                if key not in oldProps or oldProps[key] != value:
+                    ops.append(['p', path, key, value])
+            for key in oldProps:
+                if key not in newProps:
+                    ops.append(['d', path, key])
+        elif oldProps != newProps:
+            ops.append(['r', path, new])
+            return
+
+    oldChildren, newChildren = old['children'], new['children']
+    if oldChildren is newChildren:
+        return
+    if any(elementKey(child) is not None for child in newChildren):
+        _diffKeyedChildren(oldChildren, newChildren, path, ops)
+    else:
+        _diffIndexedChildren(oldChildren, newChildren, path, ops)
+
+
+def _diffIndexedChildren(oldChildren, newChildren, path: list, ops: Patch):
+    common = min(len(oldChildren), len(newChildren))
+    for index in range(common):
+        _diffNode(oldChildren[index], newChildren[index], path + [index], ops)
+    for index in range(len(oldChildren) - 1, common - 1, -1):
+        ops.append(['x', path, index])
+    for index in range(common, len(newChildren)):
+        ops.append(['i', path, index, newChildren[index]])
+
+
+def _childKeys(children):
+    # Unkeyed children are matched by their position among the other unkeyed children
+    keys = []
+    position = 0
+    for child in children:
+        key = elementKey(child)
+        if key is None:
+            keys.append(('#', position))
+            position += 1
+        else:
+            keys.append(('key', key))
+    return keys
+
+
+def _diffKeyedChildren(oldChildren, newChildren, path: list, ops: Patch):
+    newKeys = _childKeys(newChildren)
+    wanted = set(newKeys)
+
+    children = list(oldChildren)
+    keys = _childKeys(oldChildren)
+    for index in range(len(children) - 1, -1, -1):
+        if keys[index] not in wanted:
+            ops.append(['x', path, index])
+            del children[index]
+            del keys[index]
+
+    for index, (key, child) in enumerate(zip(newKeys, newChildren)):
+        if index < len(keys) and keys[index] == key:
+            _diffNode(children[index], child, path + [index], ops)
+            continue
+        try:
+            source = keys.index(key, index + 1)
+        except ValueError:
+            ops.append(['i', path, index, child])
+            children.insert(index, child)
+            keys.insert(index, key)
+            continue
+        ops.append(['m', path, source, index])
+        children.insert(index, children.pop(source))
+        keys.insert(index, keys.pop(source))
+        _diffNode(children[index], child, path + [index], ops)
+
+    # Leftovers can only remain when keys are duplicated
+    for index in range(len(children) - 1, len(newChildren) - 1, -1):
+        ops.append(['x', path, index])
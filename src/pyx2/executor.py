@@ -0,0 +1,86 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+MODES = ('inline', 'thread', 'process')
+
+
+def offload(mode: str = 'thread'):
+    # Runs a synchronous handler outside of the event loop:
+    #   @offload()            -> the app's bounded thread pool
+    #   @offload('process')   -> the app's process pool, for picklable functions
+    #   @offload('inline')    -> on the event loop, even if the app offloads by default
+    if mode not in MODES:
+        raise Exception(f"Unknown executor mode {mode}")
+
+    def decorate(func):
+        func.__pyx_executor__ = mode
+        return func
+    return decorate
+
+
+class Snapshot(dict):
+    # Picklable copy of the preloaded argument values, readable as attributes (e.target.value)
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+def snapshotArguments(values: Dict[tuple, object], count: int):
+    # Handlers running in a pool cannot await their arguments; they get the values of their
+    # @preload paths instead
+    args = [None] * count
+    for path, value in sorted(values.items(), key=lambda item: len(item[0])):
+        index = path[0]
+        if index >= count:
+            continue
+        if len(path) == 1:
+            args[index] = value
+            continue
+        if not isinstance(args[index], Snapshot):
+            args[index] = Snapshot()
+        node = args[index]
+        for key in path[1:-1]:
+            if not isinstance(node.get(key), Snapshot):
+                node[key] = Snapshot()
+            node = node[key]
+        node[path[-1]] = value
+    return args
+
+
+class HandlerExecutor:
+    # The pools synchronous handlers run in. 'inline' handlers run on the event loop; the pools
+    # are created on first use and shared by every client.
+    def __init__(self, mode: str = 'inline', max_workers: Optional[int] = None):
+        if mode not in MODES:
+            raise Exception(f"Unknown executor mode {mode}")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.pools: Dict[str, Executor] = {}
+
+    def pool(self, mode: str):
+        if mode not in self.pools:
+            if mode == 'thread':
+                self.pools[mode] = ThreadPoolExecutor(self.max_workers, thread_name_prefix='pyx2-handler')
+            elif mode == 'process':
+                self.pools[mode] = ProcessPoolExecutor(self.max_workers)
+            else:
+                raise Exception(f"No pool for executor mode {mode}")
+        return self.pools[mode]
+
+    async def run(self, mode: str, func: Callable, args: list):
+        # Cancelling the returned awaitable drops calls that have not started yet
+        call = functools.partial(func, *args)
+        if mode == 'thread':
+            # Threads see the caller's context, as tasks do
+            call = functools.partial(contextvars.copy_context().run, call)
+        return await asyncio.get_running_loop().run_in_executor(self.pool(mode), call)
+
+    def shutdown(self):
+        for pool in self.pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self.pools = {}
@@ -0,0 +1,61 @@
+import itertools
+import weakref
+from functools import partial
+from types import MethodType
+from typing import Dict, Hashable, Tuple
+
+
+class _StrongRef:
+    # Stand-in for objects that cannot be weakly referenced; they stay pinned until released
+    __slots__ = ('obj',)
+
+    def __init__(self, obj: object):
+        self.obj = obj
+
+    def __call__(self):
+        return self.obj
+
+
+class IdentityRegistry:
+    # Hands out compact, monotonically increasing integer ids that are never reused, so an id
+    # held by a stale client can never address a different object after garbage collection
+    def __init__(self):
+        self.counter = itertools.count(1)
+        self.entries: Dict[Hashable, Tuple[int, object]] = {}
+
+    def _key(self, obj: object):
+        # Bound methods are recreated on every attribute access; identify them by instance and function
+        if type(obj) is MethodType:
+            return (id(obj.__self__), id(obj.__func__)), obj.__self__
+        return id(obj), obj
+
+    def identify(self, obj: object) -> int:
+        key, owner = self._key(obj)
+        entry = self.entries.get(key)
+        if entry is not None and entry[1]() is owner:
+            return entry[0]
+        ident = next(self.counter)
+        try:
+            ref = weakref.ref(owner, partial(self._collected, key, ident))
+        except TypeError:
+            ref = _StrongRef(owner)
+        self.entries[key] = (ident, ref)
+        return ident
+
+    def release(self, obj: object):
+        # Only needed for objects that could not be weakly referenced
+        key, owner = self._key(obj)
+        entry = self.entries.get(key)
+        if entry is not None and isinstance(entry[1], _StrongRef) and entry[1]() is owner:
+            del self.entries[key]
+
+    def _collected(self, key: Hashable, ident: int, ref: weakref.ref):
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == ident:
+            del self.entries[key]
+
+    def __len__(self):
+        return len(self.entries)
+
+
+identities = IdentityRegistry()
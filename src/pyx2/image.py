@@ -0,0 +1,104 @@
+import asyncio
+import io
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from PIL import Image, features
+from starlette.concurrency import run_in_threadpool
+
+WEBP_SUPPORTED = features.check('webp')
+
+MEDIA_TYPES = {
+    'png': 'image/png',
+    'jpeg': 'image/jpeg',
+    'webp': 'image/webp',
+}
+
+
+def imageHints(image: Image.Image, format: Optional[str] = None, quality: Optional[int] = None):
+    # Per-image encoding hints, e.g. imageHints(photo, format='jpeg', quality=80)
+    if format is not None:
+        if format not in MEDIA_TYPES:
+            raise Exception(f"Unsupported image format {format}")
+        image.info['pyx2_format'] = format
+    if quality is not None:
+        image.info['pyx2_quality'] = quality
+    return image
+
+
+def imageChanged(image: Image.Image):
+    # Call after drawing on an image in place; browsers and the encoded cache then get the new
+    # pixels. Pixels are not hashed to find out, as that would stall the event loop on large images.
+    image.info['pyx2_version'] = image.info.get('pyx2_version', 0) + 1
+    return image
+
+
+def negotiateFormat(image: Image.Image, accept: str) -> Tuple[str, Optional[int]]:
+    # Per-image hints win; otherwise WebP (lossless unless a quality is hinted) for browsers
+    # that accept it, and PNG for the rest
+    format = image.info.get('pyx2_format')
+    quality = image.info.get('pyx2_quality')
+    if format == 'webp' and not WEBP_SUPPORTED:
+        format = None
+    if format is None:
+        format = 'webp' if WEBP_SUPPORTED and 'image/webp' in accept else 'png'
+    if format == 'png':
+        quality = None
+    elif format == 'jpeg' and quality is None:
+        quality = 85
+    return format, quality
+
+
+def encodeImage(image: Image.Image, format: str, quality: Optional[int]) -> bytes:
+    output = io.BytesIO()
+    if format == 'jpeg':
+        if image.mode not in ('RGB', 'L', 'CMYK'):
+            image = image.convert('RGB')
+        image.save(output, format='JPEG', quality=quality, optimize=True)
+    elif format == 'webp':
+        if quality is None:
+            image.save(output, format='WEBP', lossless=True)
+        else:
+            image.save(output, format='WEBP', quality=quality)
+    else:
+        image.save(output, format='PNG')
+    return output.getvalue()
+
+
+class EncodedImageCache:
+    # LRU of encoded image bytes shared by all images, bounded by a total byte budget.
+    # Keys include the image's content version, so stale encodings are never served.
+    def __init__(self, maxBytes: int = 64 * 1024 * 1024):
+        self.maxBytes = maxBytes
+        self.size = 0
+        self.entries: 'OrderedDict[Hashable, bytes]' = OrderedDict()
+        self.pending: Dict[Hashable, asyncio.Task] = {}
+
+    async def get(self, resource_hash: Hashable, version: int, image: Image.Image, format: str, quality: Optional[int]):
+        key = (resource_hash, version, format, quality)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if key not in self.pending:
+            # Encode a snapshot in the thread pool so the event loop keeps serving other connections
+            task = asyncio.ensure_future(run_in_threadpool(encodeImage, image.copy(), format, quality))
+            self.pending[key] = task
+            task.add_done_callback(lambda task: self._encoded(key, task))
+        return await asyncio.shield(self.pending[key])
+
+    def _encoded(self, key: Hashable, task: asyncio.Task):
+        del self.pending[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        content = task.result()
+        if len(content) > self.maxBytes:
+            return
+        self.entries[key] = content
+        self.size += len(content)
+        while self.size > self.maxBytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def evict(self, resource_hash: Hashable):
+        for key in [key for key in self.entries if key[0] == resource_hash]:
+            self.size -= len(self.entries.pop(key))
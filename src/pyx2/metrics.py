@@ -0,0 +1,193 @@
+import bisect
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Counters and histograms for the framework's hot paths, exported in the Prometheus text format.
+# The hook methods of Metrics (rendered, serialized, graphUpdated, dispatched, sent) are called
+# by the framework when metrics are enabled; subclasses can override them to forward elsewhere.
+
+SECONDS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+BYTES_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _labels(label: str, value: str, le: Optional[str] = None):
+    pairs = []
+    if label:
+        escaped = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{label}="{escaped}"')
+    if le is not None:
+        pairs.append(f'le="{le}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter:
+    def __init__(self, name: str, help: str, label: str = ''):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.values: Dict[str, float] = {}
+
+    def inc(self, amount: float = 1, value: str = ''):
+        self.values[value] = self.values.get(value, 0) + amount
+
+    def export(self, lines: List[str]):
+        lines.append(f'# HELP {self.name} {self.help}')
+        lines.append(f'# TYPE {self.name} counter')
+        for value, total in list(self.values.items()):
+            lines.append(f'{self.name}{_labels(self.label, value)} {total}')
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: Tuple[float, ...] = SECONDS_BUCKETS, label: str = ''):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self.label = label
+        self.values: Dict[str, List] = {}   # label value -> [bucket counts..., +Inf count, sum, count]
+
+    def observe(self, amount: float, value: str = ''):
+        entry = self.values.get(value)
+        if entry is None:
+            entry = self.values[value] = [0] * (len(self.buckets) + 3)
+        entry[bisect.bisect_left(self.buckets, amount)] += 1
+        entry[-2] += amount
+        entry[-1] += 1
+
+    def export(self, lines: List[str]):
+        lines.append(f'# HELP {self.name} {self.help}')
+        lines.append(f'# TYPE {self.name} histogram')
+        for value, entry in list(self.values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{_labels(self.label, value, repr(bound))} {cumulative}')
+            lines.append(f'{self.name}_bucket{_labels(self.label, value, "+Inf")} {entry[-1]}')
+            lines.append(f'{self.name}_sum{_labels(self.label, value)} {entry[-2]}')
+            lines.append(f'{self.name}_count{_labels(self.label, value)} {entry[-1]}')
+
+
+class Gauge:
+    # Read when scraped
+    def __init__(self, name: str, help: str, read: Callable[[], float]):
+        self.name = name
+        self.help = help
+        self.read = read
+
+    def export(self, lines: List[str]):
+        lines.append(f'# HELP {self.name} {self.help}')
+        lines.append(f'# TYPE {self.name} gauge')
+        lines.append(f'{self.name} {self.read()}')
+
+
+class SamplingProfiler:
+    # Samples the event loop thread's stack every `interval` seconds and attributes the sample to
+    # the class of the innermost __render__ on it. Costs nothing on the loop itself.
+    def __init__(self, counter: Counter, interval: float = 0.005):
+        self.counter = counter
+        self.interval = interval
+        self.thread: Optional[threading.Thread] = None
+        self.target: Optional[int] = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        self.target = threading.get_ident()
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name='pyx2-profiler', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def run(self):
+        # Samples are weighted by the time since the previous one, since the GIL can delay them
+        last = time.monotonic()
+        while not self.stopped.wait(self.interval):
+            now = time.monotonic()
+            elapsed, last = now - last, now
+            frame = sys._current_frames().get(self.target)
+            component = None
+            while frame is not None:
+                code = frame.f_code
+                if code.co_name == '__render__':
+                    # co_qualname (3.11+) avoids reading the locals of a running frame
+                    qualname = getattr(code, 'co_qualname', None)
+                    component = qualname[:-len('.__render__')] if qualname is not None else type(frame.f_locals.get('self')).__qualname__
+                    break
+                frame = frame.f_back
+            if component is not None:
+                self.counter.inc(elapsed, component)
+
+
+class Metrics:
+    def __init__(self, profile: bool = False, profile_interval: float = 0.005):
+        self.app: Any = None
+        self.renderSeconds = Histogram('pyx2_render_seconds', 'Time spent in __render__, per component class', label='component')
+        self.serializeSeconds = Histogram('pyx2_serialize_seconds', 'Time spent serializing render results')
+        self.renderCache = Counter('pyx2_render_cache_total', 'Render cache lookups', label='result')
+        self.graphSeconds = Histogram('pyx2_graph_update_seconds', 'Time spent applying reference graph updates')
+        self.graphNodes = Counter('pyx2_graph_nodes_total', 'Reference graph nodes created and deleted', label='change')
+        self.eventSeconds = Histogram('pyx2_event_seconds', 'Time spent dispatching inbound messages', label='event')
+        self.frameBytes = Histogram('pyx2_frame_bytes', 'Size of WebSocket frames sent', BYTES_BUCKETS)
+        self.sendSeconds = Histogram('pyx2_send_seconds', 'Time spent encoding and writing frames')
+        self.messages = Counter('pyx2_messages_total', 'Messages sent, by event', label='event')
+        self.profileSeconds = Counter('pyx2_profile_seconds_total', 'Sampled event loop time inside __render__, per component class', label='component')
+        self.profiler: Optional[SamplingProfiler] = SamplingProfiler(self.profileSeconds, profile_interval) if profile else None
+        self.families: List[Any] = [self.renderSeconds, self.serializeSeconds, self.renderCache, self.graphSeconds, self.graphNodes,
+                                    self.eventSeconds, self.frameBytes, self.sendSeconds, self.messages, self.profileSeconds]
+
+    def attach(self, app: Any):
+        self.app = app
+        self.families += [
+            Gauge('pyx2_clients', 'Connected clients', lambda: len(app.clients)),
+            Gauge('pyx2_resources', 'Resources held by the resource manager', lambda: len(app.resource_manager.resources)),
+            Gauge('pyx2_render_cache_entries', 'Cached render results', lambda: len(app.resource_manager.renderCache)),
+            Gauge('pyx2_graph_nodes', 'Reference graph nodes over all clients', lambda: sum(len(client.referenceGraph.nodes) for client in app.clients)),
+            Gauge('pyx2_pending_requests', 'Requests to browsers awaiting an answer', lambda: sum(client.requestManager.inFlight for client in app.clients)),
+            Gauge('pyx2_outbox_messages', 'Messages queued for writing over all clients', lambda: sum(len(client.outbox.queue) for client in app.clients)),
+            Gauge('pyx2_session_bytes', 'Approximate bytes pinned by all sessions', lambda: app.quota.usedBytes),
+        ]
+
+    def start(self):
+        # Called on the event loop thread, which is the one the profiler samples
+        if self.profiler is not None:
+            self.profiler.start()
+
+    def stop(self):
+        if self.profiler is not None:
+            self.profiler.stop()
+
+    # Hooks
+
+    def rendered(self, component: object, seconds: float):
+        self.renderSeconds.observe(seconds, type(component).__qualname__)
+
+    def serialized(self, seconds: float):
+        self.serializeSeconds.observe(seconds)
+
+    def cacheLookup(self, hit: bool):
+        self.renderCache.inc(1, 'hit' if hit else 'miss')
+
+    def graphUpdated(self, seconds: float, created: int, deleted: int):
+        self.graphSeconds.observe(seconds)
+        if created:
+            self.graphNodes.inc(created, 'created')
+        if deleted:
+            self.graphNodes.inc(deleted, 'deleted')
+
+    def dispatched(self, event: str, seconds: float):
+        self.eventSeconds.observe(seconds, event)
+
+    def sent(self, messages: List[Dict], size: int, seconds: float):
+        self.frameBytes.observe(size)
+        self.sendSeconds.observe(seconds)
+        for message in messages:
+            self.messages.inc(1, message['event'])
+
+    def export(self):
+        lines: List[str] = []
+        for family in self.families:
+            family.export(lines)
+        return '\n'.join(lines) + '\n'
+
@@ -0,0 +1,205 @@
+import asyncio
+import time
+import traceback
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Set
+
+from .resource import Hash
+
+OVERFLOW_POLICIES = ('disconnect', 'drop', 'block')
+MAX_MERGED_OPS = 64     # Longer merged patches are replaced by the full tree
+
+
+class Outbox:
+    # The only writer of a client's websocket. Messages are queued and written in order by a
+    # single task; everything queued when it wakes up goes out as one `batch` frame. An unsent
+    # render absorbs newer renders instead of queueing behind them.
+    #
+    # When `limit` messages are queued, the overflow policy decides:
+    #   'disconnect'  close the connection
+    #   'drop'        drop renders and send the affected trees in full once the queue drains;
+    #                 other messages wait for room
+    #   'block'       producers wait for room
+    #
+    # Producers that cannot wait (render flushes, request batches) use offer(): their renders are
+    # deferred like dropped ones under 'block' too, and their other messages are produced again
+    # once the queue has drained.
+    def __init__(self, client: Any, limit: int = 256, policy: str = 'drop'):
+        if policy not in OVERFLOW_POLICIES:
+            raise Exception(f"Unknown overflow policy {policy}")
+        self.client = client
+        self.limit = limit
+        self.policy = policy
+        self.queue: Deque[Dict] = deque()
+        self.render: Optional[Dict] = None  # Queued render that has not been written yet
+        self.stale: Set[Hash] = set()       # Resources whose renders were dropped
+        self.retries: Dict[Hashable, Callable[[], None]] = {}  # Producers to call again once there is room
+        self.wakeup = asyncio.Event()
+        self.drained = asyncio.Event()
+        self.writer: Optional[asyncio.Task] = None
+        self.closed = False
+        self.dropped = 0
+
+    def start(self):
+        self.writer = asyncio.ensure_future(self.write())
+
+    def close(self):
+        self.closed = True
+        self.queue.clear()
+        self.retries = {}
+        self.render = None
+        self.drained.set()
+        if self.writer is not None:
+            self.writer.cancel()
+
+    async def put(self, message: Dict):
+        if self.closed:
+            return
+        if message['event'] == 'render' and self.absorb(message, self.policy == 'drop'):
+            return
+        if not await self.reserve():
+            return
+        self.enqueue(message)
+
+    def offer(self, message: Dict, key: Hashable = None, retry: Optional[Callable[[], None]] = None):
+        # Never waits. Returns False if the message was not queued; `retry` is then called once
+        # the queue has drained, at most once per key.
+        if self.closed:
+            return False
+        if message['event'] == 'render' and self.absorb(message, self.policy != 'disconnect'):
+            return True
+        if len(self.queue) >= self.limit:
+            if self.policy == 'disconnect':
+                self.overflow()
+            elif retry is not None:
+                self.retries[key] = retry
+            return False
+        self.enqueue(message)
+        return True
+
+    def absorb(self, message: Dict, drop: bool):
+        # Renders merge into an unsent render, or are dropped while the queue is full
+        if self.stale and 'patch' in message:
+            # Patches against trees the browser never got; those trees are sent in full
+            message['patch'] = {resource_hash: ops for resource_hash, ops in message['patch'].items() if resource_hash not in self.stale}
+        if self.render is not None:
+            self.merge(self.render, message)
+            return True
+        if drop and len(self.queue) >= self.limit:
+            self.dropped += 1
+            self.stale.update(message['data'])
+            self.stale.update(message.get('patch', {}))
+            return True
+        return False
+
+    def enqueue(self, message: Dict):
+        if message['event'] == 'render':
+            if self.render is not None:
+                # Another render took the slot while this one waited
+                self.merge(self.render, message)
+                return
+            self.render = message
+        self.queue.append(message)
+        self.wakeup.set()
+
+    def post(self, message: Dict):
+        # Small control messages (pings) are queued without waiting, regardless of the limit
+        if self.closed:
+            return
+        self.queue.append(message)
+        self.wakeup.set()
+
+    async def reserve(self):
+        while len(self.queue) >= self.limit and not self.closed:
+            if self.policy == 'disconnect':
+                self.overflow()
+                return False
+            self.drained.clear()
+            await self.drained.wait()
+        return not self.closed
+
+    def overflow(self):
+        self.close()
+        if self.client.websocket is not None:
+            asyncio.ensure_future(self.client.websocket.close(code=1013))
+
+    def merge(self, pending: Dict, message: Dict):
+        # `sent` already holds the newest tree of every resource, so a pending frame can simply be
+        # refreshed, and patches either chain or collapse into the newest tree
+        frames = pending['data']
+        patches = pending.setdefault('patch', {})
+        sent = self.client.sent
+        for resource_hash, frame in message['data'].items():
+            frames[resource_hash] = frame
+            patches.pop(resource_hash, None)
+        for resource_hash, ops in message.get('patch', {}).items():
+            if resource_hash in frames:
+                frames[resource_hash] = sent.get(resource_hash, frames[resource_hash])
+            elif resource_hash in patches and len(patches[resource_hash]) + len(ops) > MAX_MERGED_OPS and resource_hash in sent:
+                frames[resource_hash] = sent[resource_hash]
+                del patches[resource_hash]
+            elif resource_hash in patches:
+                patches[resource_hash] = patches[resource_hash] + ops
+            else:
+                patches[resource_hash] = ops
+        if len(patches) == 0:
+            del pending['patch']
+
+    async def write(self):
+        websocket = self.client.websocket
+        try:
+            while not self.closed:
+                await self.wakeup.wait()
+                self.wakeup.clear()
+                messages = list(self.queue)
+                self.queue.clear()
+                self.render = None
+                self.drained.set()
+                if self.retries:
+                    retries, self.retries = self.retries, {}
+                    for retry in retries.values():
+                        retry()
+                if self.stale:
+                    # Renders dropped while the queue was full; the browser gets the newest trees
+                    sent = self.client.sent
+                    frames = {resource_hash: sent[resource_hash] for resource_hash in self.stale if resource_hash in sent}
+                    self.stale = set()
+                    if len(frames) > 0:
+                        messages.append({'event': 'render', 'data': frames})
+                if len(messages) == 0:
+                    continue
+                start = time.perf_counter()
+                try:
+                    data = self.encode(messages)
+                except Exception:
+                    # Messages that cannot be encoded are dropped; the rest of the frame still goes out
+                    traceback.print_exc()
+                    messages = [queued for queued in messages if self.encodable(queued)]
+                    if len(messages) == 0:
+                        continue
+                    data = self.encode(messages)
+                if self.client.wire.binary:
+                    await websocket.send_bytes(data)
+                else:
+                    await websocket.send_text(data)
+                metrics = self.client.resourceManager.metrics
+                if metrics is not None:
+                    metrics.sent(messages, len(data), time.perf_counter() - start)
+                if self.stale:
+                    self.wakeup.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The connection is gone; the endpoint's disconnect handler cleans up the client
+            self.close()
+
+    def encode(self, messages: List[Dict]):
+        return self.client.wire.encode(messages[0] if len(messages) == 1 else {'event': 'batch', 'data': messages})
+
+    def encodable(self, message: Dict):
+        # Encoded without compression, so the connection's deflate stream is left untouched
+        try:
+            self.client.wire.codec.encode(message)
+            return True
+        except Exception:
+            return False
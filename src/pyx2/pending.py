@@ -0,0 +1,80 @@
+import asyncio
+import traceback
+from typing import Any, Coroutine, Dict, List, Tuple
+
+
+class PendingRenders:
+    # Tasks running `async def __render__` methods. Each component renders in its own task, so the
+    # async components met while rendering a tree wait on their I/O concurrently; the resource
+    # manager sends a stand-in until a task settles and the app then renders the real tree in a
+    # later frame. Shared renders are owned by the resource (owner None), renders of components
+    # with `__render_cache__ = False` by the client they are for. A task is cancelled when its
+    # component starts rendering a newer state version, when the resource is released and, for
+    # per-client renders, when the client stops showing the component.
+    def __init__(self):
+        self.tasks: Dict[int, Dict[Any, Tuple[int, asyncio.Task]]] = {}
+        self.results: Dict[int, Dict[Any, Tuple[int, object, List]]] = {}     # Last per-client result
+
+    def isPending(self, resource_hash: int, owner: Any, version: int):
+        entry = self.tasks.get(resource_hash, {}).get(owner)
+        return entry is not None and entry[0] == version
+
+    def start(self, resource_hash: int, owner: Any, version: int, coroutine: Coroutine):
+        loop = asyncio.get_running_loop()
+        self.cancel(resource_hash, owner)
+        task = loop.create_task(self.run(resource_hash, owner, coroutine))
+        self.tasks.setdefault(resource_hash, {})[owner] = (version, task)
+
+    async def run(self, resource_hash: int, owner: Any, coroutine: Coroutine):
+        try:
+            await coroutine
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The component keeps its stand-in until it renders again
+            traceback.print_exc()
+        finally:
+            self.done(resource_hash, owner)
+
+    def done(self, resource_hash: int, owner: Any):
+        # Called from the render's own task, which may have been replaced by a newer one
+        owners = self.tasks.get(resource_hash)
+        if owners is not None and owner in owners and owners[owner][1] is asyncio.current_task():
+            del owners[owner]
+            if len(owners) == 0:
+                del self.tasks[resource_hash]
+
+    def result(self, resource_hash: int, owner: Any):
+        return self.results.get(resource_hash, {}).get(owner)
+
+    def store(self, resource_hash: int, owner: Any, version: int, serialized: object, references: List):
+        self.results.setdefault(resource_hash, {})[owner] = (version, serialized, references)
+
+    def cancel(self, resource_hash: int, owner: Any):
+        owners = self.tasks.get(resource_hash)
+        if owners is not None and owner in owners:
+            owners.pop(owner)[1].cancel()
+            if len(owners) == 0:
+                del self.tasks[resource_hash]
+
+    def release(self, resource_hash: int, owner: Any):
+        # The owner no longer shows the resource
+        self.cancel(resource_hash, owner)
+        results = self.results.get(resource_hash)
+        if results is not None:
+            results.pop(owner, None)
+            if len(results) == 0:
+                del self.results[resource_hash]
+
+    def forget(self, resource_hash: int):
+        # The resource was released by every client
+        for _, task in self.tasks.pop(resource_hash, {}).values():
+            task.cancel()
+        self.results.pop(resource_hash, None)
+
+    def cancelAll(self):
+        for resource_hash in list(self.tasks):
+            self.forget(resource_hash)
+
+    def __len__(self):
+        return sum(len(owners) for owners in self.tasks.values())
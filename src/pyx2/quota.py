@@ -0,0 +1,40 @@
+from typing import Any, Optional
+
+
+class SessionQuota:
+    # Caps on what a single session may pin in the shared ResourceManager (graph nodes and
+    # approximate bytes), and eviction of idle sessions: after `idleTimeout` seconds without user
+    # events, or least recently active first while all sessions together exceed `totalBytes`
+    def __init__(self, app: Any, maxNodes: Optional[int] = None, maxBytes: Optional[int] = None, idleTimeout: Optional[float] = None, totalBytes: Optional[int] = None):
+        self.app = app
+        self.maxNodes = maxNodes
+        self.maxBytes = maxBytes
+        self.idleTimeout = idleTimeout
+        self.totalBytes = totalBytes
+        self.usedBytes = 0      # Kept up to date by the clients' accounting
+        self.evicted = 0
+
+    def check(self, client: Any):
+        # Returns False if the client was evicted
+        if client not in self.app.clients:
+            return True     # Server-rendered sessions are checked once their browser connects
+        if (self.maxNodes is not None and len(client.referenceGraph.nodes) > self.maxNodes) or (self.maxBytes is not None and client.bytes > self.maxBytes):
+            self.evict(client, 1008)
+            return False
+        if self.totalBytes is not None and self.usedBytes > self.totalBytes:
+            self.reclaim(client)
+        return True
+
+    def reclaim(self, keep: Any):
+        for client in sorted(self.app.clients, key=lambda client: client.lastActive):
+            if self.usedBytes <= self.totalBytes:
+                break
+            if client is not keep:
+                self.evict(client, 1001)
+
+    def idle(self, client: Any, now: float):
+        return self.idleTimeout is not None and now - client.lastActive > self.idleTimeout
+
+    def evict(self, client: Any, close_code: int):
+        self.evicted += 1
+        self.app.dropClient(client, close_code)
@@ -0,0 +1,197 @@
+import asyncio
+import importlib
+import os
+import sys
+import traceback
+import weakref
+from types import FunctionType, ModuleType
+from typing import Any, Dict, List, Optional, Set
+
+from .tracking import addTrackListener, retrackInstance, trackedClass
+
+PACKAGE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+class HotReloader:
+    # Development mode: reloads the modules whose files change under `paths` and moves the live
+    # instances of their classes to the reloaded classes, then rerenders just those instances.
+    #
+    # Filesystem events come from a watchdog thread and are debounced on the event loop. Changed
+    # files are resolved to modules through an index of sys.modules; modules that imported names
+    # from a reloaded module (`from module import Name`) hold stale references and are reloaded
+    # after it; classes of modules that imported a reloaded module itself only render again.
+    # Instances are collected in weak sets as they are tracked, so nothing is registered
+    # by hand and nothing is kept alive.
+    def __init__(self, app: Any, paths: Optional[List[str]] = None, debounce: float = 0.1):
+        self.app = app
+        self.paths = [os.path.realpath(path) for path in (paths if paths is not None else [os.getcwd()])]
+        self.debounce = debounce
+        self.instances: Dict[type, 'weakref.WeakSet'] = {}
+        self.changed: Set[str] = set()
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.observer: Any = None
+        self.reloads = 0
+        addTrackListener(self.track)
+        for resource in list(app.resource_manager.resources.values()):
+            self.track(resource.data)
+
+    def track(self, obj: object):
+        try:
+            self.instances.setdefault(trackedClass(obj), weakref.WeakSet()).add(obj)
+        except TypeError:
+            pass    # Not weakly referenceable; such instances are not reloaded
+
+    def start(self):
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            raise Exception("reload=True requires the watchdog package")
+        self.loop = asyncio.get_running_loop()
+        reloader = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                for path in (event.src_path, getattr(event, 'dest_path', '')):
+                    if path.endswith('.py'):
+                        reloader.loop.call_soon_threadsafe(reloader.fileChanged, os.path.realpath(path))
+
+        self.observer = Observer()
+        for path in self.paths:
+            self.observer.schedule(Handler(), path, recursive=True)
+        self.observer.start()
+
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer = None
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+
+    def fileChanged(self, path: str):
+        # Editors write a file in several steps; reload once they are done
+        self.changed.add(path)
+        if self.handle is not None:
+            self.handle.cancel()
+        self.handle = self.loop.call_later(self.debounce, self.flush)
+
+    def watched(self, path: str):
+        return not path.startswith(PACKAGE_DIR) and 'site-packages' not in path and any(path.startswith(root + os.sep) for root in self.paths)
+
+    def index(self):
+        # File path -> module, for the modules loaded from the watched paths
+        modules: Dict[str, ModuleType] = {}
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, '__file__', None)
+            if path is not None and name != '__main__':
+                path = os.path.realpath(path)
+                if self.watched(path):
+                    modules[path] = module
+        return modules
+
+    def dependencies(self, modules: Dict[str, ModuleType]):
+        # Module name -> names of the indexed modules it imported classes or functions from, and
+        # module name -> names of the indexed modules it imported as modules
+        names = {module.__name__ for module in modules.values()}
+        graph: Dict[str, Set[str]] = {}
+        uses: Dict[str, Set[str]] = {}
+        for module in modules.values():
+            imported = set()
+            used = set()
+            for value in list(vars(module).values()):
+                if isinstance(value, ModuleType):
+                    if value.__name__ in names:
+                        used.add(value.__name__)
+                elif isinstance(value, (type, FunctionType)):
+                    source = getattr(value, '__module__', None)
+                    if source != module.__name__ and source in names:
+                        imported.add(source)
+            graph[module.__name__] = imported
+            uses[module.__name__] = used
+        return graph, uses
+
+    def affected(self, changed: Set[str], graph: Dict[str, Set[str]]):
+        # Changed modules and every module importing names from them, dependencies first
+        dependents: Dict[str, Set[str]] = {}
+        for name, imported in graph.items():
+            for source in imported:
+                dependents.setdefault(source, set()).add(name)
+        reached = set(changed)
+        stack = list(changed)
+        while stack:
+            for dependent in dependents.get(stack.pop(), ()):
+                if dependent not in reached:
+                    reached.add(dependent)
+                    stack.append(dependent)
+        ordered: List[str] = []
+        visited: Set[str] = set()
+        for name in sorted(reached):
+            stack = [(name, False)]
+            while stack:
+                node, done = stack.pop()
+                if done:
+                    ordered.append(node)
+                    continue
+                if node in visited:
+                    continue
+                visited.add(node)
+                stack.append((node, True))
+                stack.extend((source, False) for source in graph.get(node, ()) if source in reached and source not in visited)
+        return ordered
+
+    def flush(self):
+        self.handle = None
+        changed, self.changed = self.changed, set()
+        modules = self.index()
+        names = {modules[path].__name__ for path in changed if path in modules}
+        if len(names) == 0:
+            return
+        graph, uses = self.dependencies(modules)
+        order = self.affected(names, graph)
+        reloaded: List[ModuleType] = []
+        for name in order:
+            try:
+                reloaded.append(importlib.reload(sys.modules[name]))
+            except Exception:
+                # Keeps running the previous code until the file is fixed
+                traceback.print_exc()
+        self.reloads += 1
+        stale = self.swap(reloaded)
+        names = {module.__name__ for module in reloaded}
+        users = {name for name, used in uses.items() if used & names}
+        for cls, instances in list(self.instances.items()):
+            if cls.__module__ in users:
+                stale.update(id(obj) for obj in instances)
+        # Only the resources whose code changed render again
+        for resource in list(self.app.resource_manager.resources.values()):
+            if id(resource.data) in stale:
+                self.app.rerenderLocal(resource.data)    # Every worker reloads on its own
+
+    def swap(self, modules: List[ModuleType]):
+        # Moves live instances of the reloaded modules' classes to the new classes
+        names = {module.__name__: module for module in modules}
+        swapped: Set[int] = set()
+        for cls, instances in list(self.instances.items()):
+            module = names.get(cls.__module__)
+            if module is None:
+                continue
+            replacement: Any = module
+            for part in cls.__qualname__.split('.'):
+                replacement = getattr(replacement, part, None)
+            if not isinstance(replacement, type) or replacement is cls:
+                continue
+            moved = weakref.WeakSet()
+            for obj in list(instances):
+                try:
+                    retrackInstance(obj, replacement)
+                except TypeError:
+                    # The layout changed (e.g. __slots__); the instance keeps the previous class
+                    traceback.print_exc()
+                    continue
+                moved.add(obj)
+                swapped.add(id(obj))
+            del self.instances[cls]
+            self.instances.setdefault(replacement, weakref.WeakSet()).update(moved)
+        return swapped
@@ -1,28 +1,38 @@
 
-import hashlib
 import inspect
 import asyncio
-import json
-from typing import Dict, Set, TypeVar
-from PIL import Image
+import secrets
+import sys
+import time
+import traceback
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple, TypeVar
 
-from .element import PyXElement
 from .utils import static_vars
 from .context import current
+from .tracking import MutationScope, ReactiveEngine, Tracker, trackInstance
+from .identity import identities
+from .image import EncodedImageCache
+from .executor import snapshotArguments
+from .serializer import Serializer
+from .pending import PendingRenders
+from .series import CHUNK_BYTES, Series, arrayInfo, bufferOf
 
 
 # Define types
-Hash = str
+Hash = int
 
 def hashResource(resource):
-    return hashlib.md5(id(resource).to_bytes(8, 'big')).hexdigest()
+    return identities.identify(resource)
 
 class Resource:
+    __slots__ = ('data', 'refCount', 'hash', 'version')
+
     def __init__(self, data):
         self.data = data
         self.refCount = 0
         self.hash = hashResource(data)
-        self.dependencies = set()
+        self.version = 0    # Bumped whenever the rendered output of this resource may have changed
     
     def event(self, data, client):
         pass
@@ -30,6 +40,7 @@ class Resource:
 T = TypeVar('T')
 class ReferenceGraph:
     def __init__(self, root: T):
+        self.root = root
         self.nodes: Dict[T, Set[T]] = {root: set()}
         self.referenceCount: Dict[T, int] = {root: 1}   # Reference count of root is always 1
     
@@ -69,154 +80,412 @@ class ReferenceGraph:
     def deleteNode(self, node: T):
         if node not in self.nodes:
             raise Exception("Cannot delete non-existent node")
-        for ref in self.nodes[node]:
-            self.referenceCount[ref] -= 1
-            if self.referenceCount[ref]== 0:
-                self.deleteNode(ref)
-        del self.nodes[node]
-        del self.referenceCount[node]
+        return self._release([node], set(), force=True)
     
     def updateGraph(self, node: T, newReferences: Set[T]):
-        # TODO: Check circular references
-        added_nodes: Set[T] = newReferences - self.nodes[node]
-        removed_nodes: Set[T] = self.nodes[node] - newReferences
+        return self.applyUpdates({node: newReferences})
 
+    def applyUpdates(self, updates: Dict[T, Set[T]]):
+        # Replaces the outgoing edges of every node in `updates` in one batch, then collects
+        # every node that became unreachable. Returns the created and deleted node sets.
         created_nodes: Set[T] = set()
+        for node in updates:
+            if node not in self.nodes:
+                self.createNode(node)
+                created_nodes.add(node)
+
+        released: List[T] = []
+        suspects: Set[T] = set()
+        for node, newReferences in updates.items():
+            edges = self.nodes[node]
+            for toNode in newReferences:
+                if toNode not in edges:
+                    if toNode not in self.nodes:
+                        self.createNode(toNode)
+                        created_nodes.add(toNode)
+                    self.referenceCount[toNode] += 1
+            for toNode in edges:
+                if toNode not in newReferences:
+                    self.referenceCount[toNode] -= 1
+                    suspects.add(toNode)
+            self.nodes[node] = set(newReferences)
+
+        for node in created_nodes:
+            if self.referenceCount[node] == 0:
+                released.append(node)
+        for node in suspects:
+            if node in self.nodes and self.referenceCount[node] == 0:
+                released.append(node)
+
+        deleted_nodes = self._release(released, suspects)
+
+        # Nodes created and collected within the same batch were never visible to anyone
+        both = created_nodes & deleted_nodes
+        return created_nodes - both, deleted_nodes - both
+
+    def _release(self, released: List[T], suspects: Set[T], force: bool = False):
+        # Iterative reference-count cascade: deletes nodes whose count dropped to zero
         deleted_nodes: Set[T] = set()
-
-        for toNode in added_nodes:
-            if not self.hasNode(toNode):
-                self.createNode(toNode)
-                created_nodes.add(toNode)
-            if not self.hasEdge(node, toNode):
-                self.createEdge(node, toNode)
-        
-        for toNode in removed_nodes:
-            if self.hasEdge(node, toNode):
-                self.deleteEdge(node, toNode)
-            if self.referenceCount[toNode] == 0:
-                self.deleteNode(toNode)
-                deleted_nodes.add(toNode)
-
-        self.nodes[node] = newReferences
-        
-        return created_nodes, deleted_nodes
+        stack = list(released)
+        while stack:
+            node = stack.pop()
+            if node not in self.nodes or (self.referenceCount[node] > 0 and not force):
+                continue
+            force = False
+            for toNode in self.nodes[node]:
+                self.referenceCount[toNode] -= 1
+                if self.referenceCount[toNode] == 0:
+                    stack.append(toNode)
+                else:
+                    suspects.add(toNode)
+            del self.nodes[node]
+            del self.referenceCount[node]
+            deleted_nodes.add(node)
+
+        suspects = {node for node in suspects if node in self.nodes}
+        if suspects:
+            deleted_nodes |= self._collectCycles(suspects)
+        return deleted_nodes
+
+    def _collectCycles(self, suspects: Set[T]):
+        # Trial deletion (Bacon-Rajan) restricted to the subgraph reachable from the suspects.
+        # After subtracting references internal to that subgraph, whatever is still referenced
+        # from outside (or reachable from such a node) is alive; the rest is garbage cycles.
+        trial: Dict[T, int] = {}
+        stack = list(suspects)
+        for node in stack:
+            trial[node] = self.referenceCount[node]
+        while stack:
+            node = stack.pop()
+            for toNode in self.nodes[node]:
+                if toNode not in trial:
+                    trial[toNode] = self.referenceCount[toNode]
+                    stack.append(toNode)
+                trial[toNode] -= 1
+
+        alive: Set[T] = set()
+        stack = [node for node, count in trial.items() if count > 0]
+        alive.update(stack)
+        while stack:
+            node = stack.pop()
+            for toNode in self.nodes[node]:
+                if toNode not in alive:
+                    alive.add(toNode)
+                    stack.append(toNode)
+
+        garbage: Set[T] = set(trial) - alive
+        for node in garbage:
+            for toNode in self.nodes[node]:
+                if toNode not in garbage:
+                    self.referenceCount[toNode] -= 1
+        for node in garbage:
+            del self.nodes[node]
+            del self.referenceCount[node]
+        return garbage
 
 
 class RenderableResource(Resource):
-    pass
+    __slots__ = ()
+
+
+def preload(*paths):
+    # Declares the argument paths a handler reads, so the browser sends them with the call:
+    #   @preload('target.value')         -> e.target.value of the first argument
+    #   @preload((1, 'detail', 'id'))    -> paths given as sequences start with the argument index
+    def decorate(func):
+        declared = list(getattr(func, '__pyx_preload__', ()))
+        for path in paths:
+            if isinstance(path, str):
+                path = [0] + [int(key) if key.isdigit() else key for key in path.split('.')]
+            declared.append(tuple(path))
+        func.__pyx_preload__ = declared
+        return func
+    return decorate
 
 
 class FunctionPreloader:
-    def __init__(self):
-        self.preload_map = {}
-    
-    def use_attr(self, preload_key: str, path: list):
-        if preload_key not in self.preload_map:
-            self.preload_map[preload_key] = dict()
-        current = self.preload_map[preload_key]
-        for key in path[:-1]:
-            key = json.dumps(key)
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-        current[json.dumps(path[-1])] = None
-    
-    def get(self, preload_key: str):
-        return self.preload_map[preload_key] if preload_key in self.preload_map else {}
+    # Argument paths the browser sends along with every call of one function resource.
+    # Declared paths are always kept; paths learned from lookups are added up to `maxPaths`.
+    def __init__(self, declared=(), maxPaths: int = 32):
+        self.paths: Dict[tuple, None] = {tuple(path): None for path in declared}
+        self.maxPaths = max(maxPaths, len(self.paths))
+
+    def learn(self, path: tuple):
+        if path in self.paths or len(self.paths) >= self.maxPaths:
+            return False
+        self.paths[path] = None
+        return True
+
+    def get(self):
+        return [list(path) for path in self.paths]
+
+
+class FunctionCall:
+    # Argument values of one call. Values that were not sent with the call are fetched from the
+    # browser; lookups made within the same event-loop tick share a single request.
+    def __init__(self, resource: 'FunctionResource', call_id: str, client, preloaded: list):
+        self.resource = resource
+        self.call_id = call_id
+        self.client = client
+        self.values: Dict[tuple, object] = {tuple(path): value for path, value in preloaded}
+        self.pending: Dict[tuple, asyncio.Future] = {}
+        self.learned = False
+
+    async def fetch(self, path: tuple):
+        if path in self.values:
+            return self.values[path]
+        preloader = self.resource.preloader
+        if preloader.learn(path) or path in preloader.paths:
+            self.learned = True
+        if path not in self.pending:
+            if len(self.pending) == 0:
+                asyncio.get_running_loop().call_soon(self.flush)
+            self.pending[path] = asyncio.get_running_loop().create_future()
+        return await self.pending[path]
+
+    def flush(self):
+        pending = self.pending
+        self.pending = {}
+        paths = list(pending)
+        if self.learned:
+            # The browser's paths are outdated; its later calls will carry these values
+            self.learned = False
+            self.resource.sendPreload(self.client)
+        request = self.client.request({'event': 'get_function_arguments', 'data': {'call_id': self.call_id, 'paths': [list(path) for path in paths]}})
+
+        def resolve(request: asyncio.Future):
+            for index, path in enumerate(paths):
+                future = pending[path]
+                if future.done():
+                    continue
+                if request.cancelled():
+                    future.cancel()
+                elif request.exception() is not None:
+                    future.set_exception(request.exception())
+                else:
+                    self.values[path] = request.result()[index]
+                    future.set_result(self.values[path])
+        request.add_done_callback(resolve)
 
 
 class FunctionArgument:
-    def __init__(self, path: list, call_id: str, client, data, preloader: FunctionPreloader, preload_key: str, parent=None):
+    # A lazy path into an argument of a browser-side call; `await` resolves its value
+    __slots__ = ('_path', '_call')
+
+    def __init__(self, path: tuple, call: FunctionCall):
         self._path = path
-        self._call_id = call_id
-        self._client = client
-        self._preloader = preloader
-        self._preload_key = preload_key
-        self._data = data
-        self._parent = parent
-    
+        self._call = call
+
     def __getitem__(self, key):
-        stringified_key = json.dumps(key)
-        return FunctionArgument(self._path + [key], self._client, self._data[stringified_key] if (self._data is not None and stringified_key in self._data) else None, self._preloader, self._preload_key, self)
-    
-    def __getattribute__(self, name):
-        if name in ['_path', '_call_id', '_client', '_preloader', '_preload_key', '_data', '_parent', 'set_data']:
-            return super().__getattribute__(name)
-        stringified_key = json.dumps(name)
-        return FunctionArgument(self._path + [name], self._call_id, self._client, self._data[stringified_key] if (self._data is not None and stringified_key in self._data) else None, self._preloader, self._preload_key, self)
-
-    def set_data(self, key, data):
-        stringified_key = json.dumps(key)
-        if self._data is None:
-            self._data = {}
-        self._data[stringified_key] = data
-        if self._parent is not None:
-            self._parent.set_data(self._path[-1], self._data)
+        return FunctionArgument(self._path + (key,), self._call)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return FunctionArgument(self._path + (name,), self._call)
 
     def __await__(self):
-        async def ftn():
-            self._preloader.use_attr(self._preload_key, self._path)
-            if self._data is not None:
-                return self._data
-            res = await self._client.request({'event': 'get_function_argument', 'data': {'path': self._path, 'call_id': self._call_id}})
-            self._data = res
-            self._parent.set_data(self._path[-1], res)
-            return res
-        return ftn().__await__()
+        return self._call.fetch(self._path).__await__()
+
+
+def _argumentRange(func):
+    # (minimum, maximum) number of positional arguments the browser may pass
+    # TODO: Add support for keyword arguments or variable arguments
+    if inspect.ismethod(func) and hasattr(func, '__code__'):
+        code, defaults, skipped = func.__code__, func.__defaults__, 1     # Skip self
+    elif inspect.isfunction(func):
+        code, defaults, skipped = func.__code__, func.__defaults__, 0
+    elif hasattr(getattr(func, '__call__', None), '__code__'):   # An object with __call__ method
+        code, defaults, skipped = func.__call__.__code__, func.__call__.__defaults__, 1
+    else:
+        # Builtins, C extensions, partials; raises ValueError if there is no signature to read
+        positional = [parameter for parameter in inspect.signature(func).parameters.values()
+                      if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        return len([parameter for parameter in positional if parameter.default is inspect.Parameter.empty]), len(positional)
+    arg_max = code.co_argcount - skipped
+    arg_min = arg_max - len(defaults) if defaults is not None else arg_max
+    return arg_min, arg_max
 
 
 class FunctionResource(Resource):
-    preloader = FunctionPreloader()
+    __slots__ = ('preloader', 'argMin', 'argMax', 'isAsync', 'mode')
+
+    def __init__(self, data):
+        super().__init__(data)
+        if not callable(data):
+            raise Exception("Cannot call non-callable resource")
+        self.preloader = FunctionPreloader(getattr(data, '__pyx_preload__', ()))
+        # Inspected once per resource rather than on every call
+        try:
+            self.argMin, self.argMax = _argumentRange(data)
+        except (TypeError, ValueError):
+            self.argMin = self.argMax = None    # Fails when called, not while the page renders
+        self.isAsync = inspect.iscoroutinefunction(data) or inspect.iscoroutinefunction(getattr(data, '__call__', None))
+        self.mode = getattr(data, '__pyx_executor__', None)    # Set by @offload, otherwise the app's default
+
     def event(self, data, client):
         if data['event'] == 'call':
-            arg_count: list = data['data']['arg_count']
+            arg_count: int = data['data']['arg_count']
             call_id: str = data['data']['call_id']
-            preloaded_data: dict = data['data']['preloaded_data'] if 'preloaded_data' in data['data'] else {}
-
-            # Check if number of arguments is valid
-            # TODO: Add support for keyword arguments or variable arguments
-            arg_min = None
-            arg_max = None
-            if not callable(self.data):
-                raise Exception("Cannot call non-callable resource")
-            if inspect.ismethod(self.data):
-                arg_max = self.data.__code__.co_argcount - 1 # Subtract 1 for self
-                arg_min = arg_max - len(self.data.__defaults__) if self.data.__defaults__ is not None else arg_max
-            elif inspect.isfunction(self.data):
-                arg_max = self.data.__code__.co_argcount
-                arg_min = arg_max - len(self.data.__defaults__) if self.data.__defaults__ is not None else arg_max
-            else:   # An object with __call__ method
-                arg_max = self.data.__call__.__code__.co_argcount - 1 # Subtract 1 for self
-                arg_min = arg_max - len(self.data.__call__.__defaults__) if self.data.__call__.__defaults__ is not None else arg_max
-
-            assert arg_count >= arg_min, f"Number of arguments must be at least {arg_min}"
+            preloaded_data: list = data['data']['preloaded_data'] if 'preloaded_data' in data['data'] else []
+
+            if self.argMin is None:
+                raise Exception(f"Cannot inspect the arguments of {self.data!r}")
+            assert arg_count >= self.argMin, f"Number of arguments must be at least {self.argMin}"
 
             # Create arguments
-            args = [
-                FunctionArgument([i], call_id, client, preloaded_data[json.dumps(i)] if json.dumps(i) in preloaded_data else {}, self.preloader, self.data.__qualname__)
-                for i in range(min(arg_count, arg_max))
-            ]
-
-            # Call function - TODO: Just call the function and if it returns a coroutine, create a task
-            if inspect.iscoroutinefunction(self.data):
-                async def ftn_call():
-                    result = await self.data(*args)
-                    await client.websocket.send_json({'event': 'function_return', 'data': {'call_id': call_id, 'return': result}})
-                asyncio.create_task(ftn_call())
-            else:
-                result = self.data(*args)
-                loop = asyncio.get_event_loop()
-                loop.create_task(client.websocket.send_json({'event': 'function_return', 'data': {'call_id': call_id, 'return': result}}))
+            call = FunctionCall(self, call_id, client, preloaded_data)
+            count = min(arg_count, self.argMax)
+
+            executor = current.app.executor
+            mode = self.mode if self.mode is not None else executor.mode
+            # Containers the handler reads from components are checked for mutations once it is done;
+            # the task and pool thread it continues in inherit the scope
+            with MutationScope() as mutations:
+                if self.isAsync:
+                    args = [FunctionArgument((i,), call) for i in range(count)]
+                    client.run(self.complete(client, call_id, mutations, self.data(*args)))
+                elif mode == 'inline':
+                    args = [FunctionArgument((i,), call) for i in range(count)]
+                    result = self.data(*args)
+                    client.run(self.complete(client, call_id, mutations, None, result))
+                else:
+                    # Off the event loop, bounded per client so one user cannot occupy the whole pool
+                    async def offloaded():
+                        async with client.callLimit:
+                            return await executor.run(mode, self.data, snapshotArguments(call.values, count))
+                    client.run(self.complete(client, call_id, mutations, offloaded()))
+
+    async def complete(self, client, call_id: str, mutations: MutationScope, work=None, result=None):
+        # function_return is sent once the handler's work has completed
+        if work is not None:
+            try:
+                result = await work
+            except Exception:
+                traceback.print_exc()
+                result = None
+        mutations.check()
+        try:
+            result = client.resourceManager.serializeValue(result)
+        except Exception:
+            traceback.print_exc()
+            result = None
+        await client.send({'event': 'function_return', 'data': {'call_id': call_id, 'return': result}})
 
     def get_preload_args(self):
-        return self.preloader.get(self.data.__qualname__)
+        return self.preloader.get()
+
+    def sendPreload(self, client):
+        # The newest paths are sent again if the client's send queue is full
+        message = {'event': 'preload', 'data': {'id': self.hash, 'paths': self.preloader.get()}}
+        client.outbox.offer(message, ('preload', self.hash), lambda: self.sendPreload(client))
+
+class ServedResource(Resource):
+    # Resources the browser fetches over HTTP. Ids are sequential and those requests carry no
+    # session, so URLs also carry an unguessable token that only renders referencing the resource hand out.
+    __slots__ = ('token',)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.token = secrets.token_urlsafe(16)
+
+    def allows(self, token: Optional[str]):
+        return token is not None and secrets.compare_digest(token, self.token)
+
+class ImageResource(ServedResource):
+    __slots__ = ('fingerprint',)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.fingerprint = None
+
+    def refresh(self):
+        # Versioned by imageChanged() and by changes of mode or size, all cheap to read
+        fingerprint = (self.data.mode, self.data.size, self.data.info.get('pyx2_version', 0))
+        if self.fingerprint is not None and fingerprint != self.fingerprint:
+            self.version += 1
+        self.fingerprint = fingerprint
+        return self.version
 
-class ImageResource(Resource):
-    pass
+class ArrayResource(ServedResource):
+    # NumPy arrays, bytes-like objects and Series, served raw by the /arrays route
+    __slots__ = ('fingerprint', 'checked')
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.fingerprint = None
+        self.checked = None     # Serialization pass that last fingerprinted the buffer
+
+    def refresh(self, generation: Optional[int] = None):
+        # Content-versioned. bytes never change, and a Series only grows: browsers holding a
+        # shorter copy fetch the appended bytes under the same version. Other buffers are hashed
+        # once per serialization pass that references them, however often they appear in it.
+        if isinstance(self.data, (bytes, Series)):
+            return self.version
+        if generation is not None and generation == self.checked:
+            return self.version
+        self.checked = generation
+        dtype, shape, nbytes = arrayInfo(self.data)
+        fingerprint = (dtype, tuple(shape), zlib.crc32(bufferOf(self.data)))
+        if self.fingerprint is not None and fingerprint != self.fingerprint:
+            self.version += 1
+        self.fingerprint = fingerprint
+        return self.version
+
+    def chunks(self, start: int, end: int):
+        # Views of the buffer, so nothing is copied on the way to the socket
+        if isinstance(self.data, Series):
+            yield from self.data.chunks(start, end)
+            return
+        view = bufferOf(self.data)[start:end]
+        for position in range(0, len(view), CHUNK_BYTES):
+            yield view[position:position + CHUNK_BYTES]
 
 class TextResource(Resource):
-    pass
+    __slots__ = ()
+
+
+NODE_BYTES = 256    # Approximate cost of one resource in a client's graph, besides its render
+
+
+def estimateSize(tree: object):
+    # Approximate memory held by a serialized tree, in bytes
+    size = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        size += sys.getsizeof(node)
+        if isinstance(node, dict):
+            stack.extend(node.values())     # Keys are mostly shared strings
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return size
+
+
+class RenderCache:
+    # Serialized render results shared by every client, keyed by resource hash and state version
+    def __init__(self):
+        self.entries: Dict[Hash, Tuple[int, object, List[Resource]]] = {}
+
+    def get(self, resource_hash: Hash, version: int):
+        entry = self.entries.get(resource_hash)
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1], entry[2]
+
+    def latest(self, resource_hash: Hash):
+        # Entry of any version, shown while a newer render is pending
+        entry = self.entries.get(resource_hash)
+        return None if entry is None else (entry[1], entry[2])
+
+    def put(self, resource_hash: Hash, version: int, serialized: object, references: List[Resource]):
+        self.entries[resource_hash] = (version, serialized, references)
+
+    def evict(self, resource_hash: Hash):
+        self.entries.pop(resource_hash, None)
+
+    def __len__(self):
+        return len(self.entries)
 
 
 class ResourceManager:
@@ -228,33 +497,153 @@ class ResourceManager:
         }
         self.incRefCount(self.root.hash)    # Root resource has refCount of 1
         
-        self._references = []   # Temporary variable for serialization
-
-        self.originalSetattrs = {}
-        self.registerSetattr(self.root)
-
-    def stateUpdated(self, resource_hash: Hash, attr: str):
+        self.serializer = Serializer(self)
+        self.generation = 0     # Counts serialization passes
+
+        self.renderCache = RenderCache()
+        self.renderSizes: Dict[Hash, int] = {}  # Approximate size of the last render of each renderable
+        self.imageCache = EncodedImageCache()
+        self.subscribers: Dict[Hash, Set[Any]] = {}     # Clients whose graph holds each resource
+
+        # Tracks which instance attributes each renderable read during its last render
+        self.engine = ReactiveEngine(self.stateUpdated)
+        self.onStateUpdated = None     # Set by the app owning this manager
+        self.pendingRenders = PendingRenders()
+        self.onRenderSettled = None    # Called with (resource hash, owner) when an async render finishes
+        self.metrics = None            # Instrumentation hooks, set by the app when enabled
+        trackInstance(self.root.data)
+
+    def stateUpdated(self, resource_hash: Hash):
+        # Called by the reactive engine when a value read by the resource's last render changes
         if resource_hash not in self.resources:
             raise Exception("Cannot update state of non-existent resource")
-        if attr in self.resources[resource_hash].dependencies:
+        if self.onStateUpdated is not None:
+            self.onStateUpdated(self.resources[resource_hash].data)
+        else:
             current.app.rerender(self.resources[resource_hash].data)
 
-    def registerSetattr(self, resource: object):
-        if resource.data.__class__ not in self.originalSetattrs:
+    def invalidate(self, resource_hash: Hash):
+        # Cached renders of the resource become stale once its version changes
+        if resource_hash in self.resources:
+            self.resources[resource_hash].version += 1
+
+    def render(self, resource_hash: Hash):
+        if resource_hash not in self.resources:
+            raise Exception("Cannot render non-existent resource")
+        resource: RenderableResource = self.resources[resource_hash]
+
+        metrics = self.metrics
+        cached = self.renderCache.get(resource_hash, resource.version)
+        if metrics is not None:
+            metrics.cacheLookup(cached is not None)
+        if cached is not None:
+            return self.reuse(*cached)
+
+        version = resource.version
+        # Components rendering per-user content can opt out with `__render_cache__ = False`
+        shared = getattr(resource.data, '__render_cache__', True)
+        owner = None if shared else current.user
+        if not shared:
+            settled = self.pendingRenders.result(resource_hash, owner)
+            if settled is not None and settled[0] == version:
+                return self.reuse(settled[1], settled[2])
+        if self.pendingRenders.isPending(resource_hash, owner, version):
+            return self.standIn(resource, owner)
+
+        # Serialization is tracked as well, since containers returned by __render__ are only iterated there
+        with Tracker() as reads:
+            start = time.perf_counter()
+            result = resource.data.__render__()
+            if not inspect.iscoroutine(result):
+                rendered = time.perf_counter()
+                # return serialized result and references of resources
+                serialized, references = self.serializeElement(result) # Serializable Dict, List[Resource]
+        if inspect.iscoroutine(result):
+            # `async def __render__` runs in a task and its tree is sent in a later frame
             try:
-                self.originalSetattrs[resource.data.__class__] = resource.data.__class__.__setattr__
-                outer_self = self
-                def new_setattr(self, name, value):
-                    outer_self.originalSetattrs[self.__class__](self, name, value)
-                    outer_self.stateUpdated(resource.hash, name)
-                resource.data.__class__.__setattr__ = new_setattr
-            except Exception as e:
-                pass
+                asyncio.get_running_loop()
+            except RuntimeError:
+                result.close()
+                raise Exception("Cannot render async component outside of the event loop")
+            self.pendingRenders.start(resource_hash, owner, version, self.renderAsync(resource, owner, version, result))
+            return self.standIn(resource, owner)
+        if metrics is not None:
+            metrics.rendered(resource.data, rendered - start)
+            metrics.serialized(time.perf_counter() - rendered)
+        self.engine.setDependencies(resource_hash, reads)
+        self.renderSizes[resource_hash] = estimateSize(serialized)
+
+        if shared:
+            self.renderCache.put(resource_hash, version, serialized, references)
+        return serialized, references
+
+    async def renderAsync(self, resource: RenderableResource, owner: Any, version: int, coroutine):
+        with Tracker() as reads:
+            start = time.perf_counter()
+            result = await coroutine
+            rendered = time.perf_counter()
+            serialized, references = self.serializeElement(result)
+        if self.resources.get(resource.hash) is not resource or resource.version != version:
+            return      # Released or changed while awaiting; a newer render is on its way
+        if self.metrics is not None:
+            self.metrics.rendered(resource.data, rendered - start)
+            self.metrics.serialized(time.perf_counter() - rendered)
+        self.engine.setDependencies(resource.hash, reads)
+        self.renderSizes[resource.hash] = estimateSize(serialized)
+        if owner is None and getattr(resource.data, '__render_cache__', True):
+            self.renderCache.put(resource.hash, version, serialized, references)
+        else:
+            self.pendingRenders.store(resource.hash, owner, version, serialized, references)
+        self.pendingRenders.done(resource.hash, owner)
+        if self.onRenderSettled is not None:
+            self.onRenderSettled(resource.hash, owner)
+
+    def standIn(self, resource: RenderableResource, owner: Any):
+        # Sent while an async render is pending: the previous result if there is one, so content
+        # does not flash, otherwise the component's __placeholder__ (an element or a method returning one)
+        if getattr(resource.data, '__render_cache__', True):
+            previous = self.renderCache.latest(resource.hash)
+        else:
+            previous = self.pendingRenders.result(resource.hash, owner)
+            previous = previous[1:] if previous is not None else None
+        if previous is not None:
+            return self.reuse(*previous)
+        placeholder = getattr(resource.data, '__placeholder__', None)
+        if callable(placeholder):
+            placeholder = placeholder()
+        return self.serializeElement(placeholder)
+
+    def isPending(self, resource_hash: Hash, client: Any):
+        # Whether the client was last sent a stand-in for the resource
+        resource = self.resources.get(resource_hash)
+        if resource is None:
+            return False
+        owner = None if getattr(resource.data, '__render_cache__', True) else client
+        return self.pendingRenders.isPending(resource_hash, owner, resource.version)
+
+    def reuse(self, serialized: object, references: List[Resource]):
+        # Referenced resources may have been released since the render was stored
+        for reference in references:
+            if reference.hash not in self.resources:
+                self.registerResource(reference)
+        return serialized, references
+
+    def resourceSize(self, resource_hash: Hash):
+        # Approximate bytes a client pins by referencing the resource
+        resource = self.resources.get(resource_hash)
+        if resource is None:
+            return 0
+        if isinstance(resource, ImageResource):
+            return NODE_BYTES + resource.data.width * resource.data.height * len(resource.data.getbands())
+        if isinstance(resource, ArrayResource):
+            return NODE_BYTES + arrayInfo(resource.data)[2]
+        return NODE_BYTES + self.renderSizes.get(resource_hash, 0)
 
     def registerResource(self, resource: object):
         if resource.hash in self.resources:
             raise Exception("Cannot register existing resource")
-        self.registerSetattr(resource)
+        if isinstance(resource, RenderableResource):
+            trackInstance(resource.data)
         self.resources[resource.hash] = resource
 
     def incRefCount(self, resource_hash: Hash):
@@ -267,77 +656,76 @@ class ResourceManager:
             raise Exception("Cannot decrement refCount of non-existent resource")
         self.resources[resource_hash].refCount -= 1
         if self.resources[resource_hash].refCount == 0:
-            del self.resources[resource_hash]
+            self.releaseResource(resource_hash)
+
+    def releaseResource(self, resource_hash: Hash):
+        resource = self.resources.pop(resource_hash)
+        identities.release(resource.data)
+        self.renderCache.evict(resource_hash)
+        self.renderSizes.pop(resource_hash, None)
+        if isinstance(resource, ImageResource):
+            self.imageCache.evict(resource_hash)
+        self.engine.forget(resource_hash)
+        self.pendingRenders.forget(resource_hash)
     
-    def addDependencies(self, resource_hash: Hash, dependencies: Set[Hash]):
-        if resource_hash not in self.resources:
-            raise Exception("Cannot add dependencies to non-existent resource")
-        if not isinstance(self.resources[resource_hash], RenderableResource):
-            raise Exception("Cannot add dependencies to non-renderable resource")
-        self.resources[resource_hash].dependencies = dependencies | self.resources[resource_hash].dependencies
-
-    def serializeElement(self, element: PyXElement):
-        self._references = []
-        serialized = self._serialize(element)
-        refernces = self._references
-        self._references = []
-        return serialized, refernces
-    
-    def _serialize(self, element: object):
-        if isinstance(element, PyXElement):
-            return {
-                '__type__': 'PyXElement',
-                'tag': element.tag,
-                'props': self._serialize(element.props),
-                'children': self._serialize(element.children),
-            }
-        elif type(element) in [str, int, float, bool, type(None)]:
-            return element
-        elif isinstance(element, dict):
-            return {key: self._serialize(value) for key, value in element.items()}
-        elif isinstance(element, list):
-            return [self._serialize(value) for value in element]
-        elif isinstance(element, tuple):
-            return tuple(self._serialize(value) for value in element)
-        elif isinstance(element, set):
-            return {self._serialize(value) for value in element}
-        elif hasattr(element, '__render__'):
-            resource_hash = hashResource(element)
-            resource = None
-            if resource_hash not in self.resources:
-                resource = RenderableResource(element)
-                self.registerResource(resource)
-            else:
-                resource = self.resources[resource_hash]
-            self._references.append(resource)
-            return {
-                '__type__': 'Renderable',
-                'id': hashResource(element),
-            }
-        elif callable(element):
-            resource_hash = hashResource(element)
-            resource = None
-            if resource_hash not in self.resources:
-                resource = FunctionResource(element)
-                self.registerResource(resource)
-            else:
-                resource = self.resources[resource_hash]
-            self._references.append(resource)
-            return {
-                '__type__': 'Function',
-                'id': hashResource(element),
-                'preload_args': self.resources[resource_hash].get_preload_args(),
-            }
-        elif isinstance(element, Image.Image):
-            resource_hash = hashResource(element)
-            resource = None
-            if resource_hash not in self.resources:
-                resource = ImageResource(element)
-                self.registerResource(resource)
-            else:
-                resource = self.resources[resource_hash]
-            self._references.append(resource)
-            return f"images/{resource_hash}.png"
-        else:
-            raise Exception(f"Cannot serialize unknown element type {type(element)}")
+    def subscribe(self, resource_hash: Hash, client: Any):
+        self.subscribers.setdefault(resource_hash, set()).add(client)
+
+    def unsubscribe(self, resource_hash: Hash, client: Any):
+        self.pendingRenders.release(resource_hash, client)
+        clients = self.subscribers.get(resource_hash)
+        if clients is not None:
+            clients.discard(client)
+            if len(clients) == 0:
+                del self.subscribers[resource_hash]
+
+    def getSubscribers(self, resource_hash: Hash):
+        return self.subscribers.get(resource_hash, ())
+
+    def subscriberCount(self, resource_hash: Hash):
+        return len(self.subscribers.get(resource_hash, ()))
+
+    def serializeElement(self, element: object):
+        # Serializable tree and the resources it references
+        self.generation += 1
+        return self.serializer.serialize(element)
+
+    def serializeValue(self, value: object):
+        # Plain data sent outside of a render (handler return values). Values that would need
+        # resources of their own have no graph to live in, so they are rejected.
+        serialized, references = self.serializer.serialize(value)
+        if len(references) > 0:
+            for reference in references:
+                if reference.refCount == 0 and self.resources.get(reference.hash) is reference:
+                    self.releaseResource(reference.hash)
+            raise Exception(f"Cannot send {type(references[0].data)} outside of a render")
+        return serialized
+
+    def reference(self, resource_type: type, data: object, references: List[Resource]):
+        resource_hash = hashResource(data)
+        resource = self.resources.get(resource_hash)
+        if resource is None:
+            resource = resource_type(data)
+            self.registerResource(resource)
+        references.append(resource)
+        return resource
+
+    def referenceRenderable(self, data: object, references: List[Resource]):
+        resource = self.reference(RenderableResource, data, references)
+        return {'__type__': 'Renderable', 'id': resource.hash}
+
+    def referenceFunction(self, data: object, references: List[Resource]):
+        resource = self.reference(FunctionResource, data, references)
+        return {'__type__': 'Function', 'id': resource.hash, 'preload_args': resource.get_preload_args()}
+
+    def referenceImage(self, data: object, references: List[Resource]):
+        resource = self.reference(ImageResource, data, references)
+        return f"images/{resource.hash}?t={resource.token}&v={resource.refresh()}"
+
+    def referenceArray(self, data: object, references: List[Resource]):
+        # The browser fetches the bytes separately; the tree only carries what it needs to do so.
+        # Reading the length of a Series subscribes the render to its growth.
+        resource = self.reference(ArrayResource, data, references)
+        dtype, shape, nbytes = arrayInfo(data)
+        return {'__type__': 'Array', 'id': resource.hash, 'dtype': dtype, 'shape': shape, 'length': nbytes, 'v': resource.refresh(self.generation), 'token': resource.token}
 
@@ -0,0 +1,68 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from .resource import Hash
+
+
+class RenderScheduler:
+    # Collects dirty resources and flushes them once per event-loop tick (or once per frame budget),
+    # so every client gets at most one render message per flush
+    def __init__(self, app: Any, frameBudget: float = 0):
+        self.app = app
+        self.frameBudget = frameBudget
+        self.dirty: Dict[Hash, None] = {}   # Insertion-ordered set
+        self.local: Dict[Any, Dict[Hash, None]] = {}    # Resources dirty for one client only
+        self.handle: Any = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None    # The loop serving the app
+
+    def markDirty(self, resource_hash: Hash, client: Any = None):
+        # With a client, only that client renders the resource again (per-client state changed)
+        if self.loop is not None and not self.loop.is_closed() and not self.inLoop():
+            # State changed by a handler running in a pool thread; flushed by the serving loop
+            self.loop.call_soon_threadsafe(self.markDirty, resource_hash, client)
+            return
+        if client is None:
+            self.dirty[resource_hash] = None
+        else:
+            self.local.setdefault(client, {})[resource_hash] = None
+        if self.handle is None:
+            self.schedule()
+
+    def inLoop(self):
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def schedule(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Outside of the event loop there is no tick to wait for
+            self.flush()
+            return
+        if self.frameBudget > 0:
+            self.handle = loop.call_later(self.frameBudget, self.flush)
+        else:
+            self.handle = loop.call_soon(self.flush)
+
+    def flush(self):
+        self.handle = None
+        dirty = self.dirty
+        self.dirty = {}
+        local = self.local
+        self.local = {}
+        # Only the clients subscribed to a dirty resource are visited
+        subscribers = self.app.resource_manager.getSubscribers
+        pending: Dict[Any, List[Hash]] = {}
+        for resource_hash in dirty:
+            for client in subscribers(resource_hash):
+                pending.setdefault(client, []).append(resource_hash)
+        for client, resource_hashes in local.items():
+            queued = pending.setdefault(client, [])
+            queued.extend(resource_hash for resource_hash in resource_hashes if resource_hash not in dirty)
+        clients = self.app.clients
+        for client, resource_hashes in pending.items():
+            # Server-rendered sessions waiting for their browser catch up when adopted
+            if client in clients:
+                client.renderResources(resource_hashes)
@@ -0,0 +1,151 @@
+import dataclasses
+import datetime
+import enum
+from collections.abc import Iterator, KeysView, ValuesView
+from typing import Any, Callable, Dict, List, Tuple
+
+from PIL import Image
+
+from .element import PyXElement
+from .series import Series
+
+# Render results are turned into plain trees of dicts, lists and primitives. How a value is
+# converted is decided once per type and cached. Builtin containers and elements are copied by the
+# walker itself; every other type has a converter returning a replacement that is walked in turn.
+# Renderables, functions, images and arrays become references to resources of the ResourceManager.
+
+PRIMITIVES = frozenset((str, int, float, bool, type(None)))
+MAPPING = 'mapping'
+SEQUENCE = 'sequence'
+ELEMENT = 'element'
+
+Converter = Callable[[Any, Any, List], object]     # (manager, value, references) -> replacement
+
+_converters: Dict[type, Callable[[Any], object]] = {}
+_dispatch: Dict[type, Any] = {}
+
+
+def registerConverter(cls: type, converter: Callable[[Any], object]):
+    # Values of `cls` (and its subclasses) are rendered as `converter(value)`. Builtin primitive and
+    # container types cannot be overridden.
+    if cls in PRIMITIVES or cls in (dict, list, tuple):
+        raise Exception(f"Cannot register a converter for {cls}")
+    _converters[cls] = converter
+    _dispatch.clear()
+
+
+def _renderable(manager, value, references):
+    return manager.referenceRenderable(value, references)
+
+
+def _function(manager, value, references):
+    return manager.referenceFunction(value, references)
+
+
+def _image(manager, value, references):
+    return manager.referenceImage(value, references)
+
+
+def _array(manager, value, references):
+    return manager.referenceArray(value, references)
+
+
+def _unknown(manager, value, references):
+    # Types are resolved once, but __render__ may also be set on a single instance
+    if hasattr(value, '__render__'):
+        return manager.referenceRenderable(value, references)
+    raise Exception(f"Cannot serialize unknown element type {type(value)}")
+
+
+def _user(converter: Callable[[Any], object]) -> Converter:
+    return lambda manager, value, references: converter(value)
+
+
+def _lookup(cls: type):
+    for base in cls.__mro__:
+        if base in _converters:
+            return _user(_converters[base])
+    if issubclass(cls, PyXElement):
+        return ELEMENT
+    if issubclass(cls, dict):
+        return MAPPING
+    if issubclass(cls, (list, tuple, set, frozenset, range, KeysView, ValuesView)):
+        return SEQUENCE
+    if hasattr(cls, '__render__'):
+        return _renderable
+    if issubclass(cls, (bytes, bytearray, memoryview, Series)):
+        return _array
+    if issubclass(cls, enum.Enum):
+        return lambda manager, value, references: value.value
+    for primitive in (bool, int, float, str):
+        if issubclass(cls, primitive):
+            return lambda manager, value, references, primitive=primitive: primitive(value)
+    if dataclasses.is_dataclass(cls):
+        return lambda manager, value, references: {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if issubclass(cls, (datetime.date, datetime.time)):     # datetime is a subclass of date
+        return lambda manager, value, references: value.isoformat()
+    if cls.__module__ == 'numpy':
+        if cls.__name__ == 'ndarray':
+            return _array
+        if hasattr(cls, 'item'):
+            return lambda manager, value, references: value.item()
+    if issubclass(cls, Image.Image):
+        return _image
+    if issubclass(cls, Iterator):
+        # Generators and other iterators are consumed once, while rendering
+        return SEQUENCE
+    if any('__call__' in vars(base) for base in cls.__mro__):
+        return _function
+    return _unknown
+
+
+def _resolve(cls: type):
+    handler = _dispatch.get(cls)
+    if handler is None:
+        handler = _dispatch[cls] = _lookup(cls)
+    return handler
+
+
+class Serializer:
+    # Re-entrant: references are collected per call, never on the serializer
+    def __init__(self, manager: Any):
+        self.manager = manager
+
+    def serialize(self, element: object) -> Tuple[object, List]:
+        # Iterative walk, so deep trees do not hit the recursion limit. Every slot of the output is
+        # first filled with the raw value and replaced by its serialized form when popped.
+        manager = self.manager
+        references: List = []
+        root = [element]
+        stack: List[Tuple[Any, Any]] = [(root, 0)]
+        while stack:
+            parent, key = stack.pop()
+            value = parent[key]
+            cls = type(value)
+            if cls in PRIMITIVES:
+                continue
+            handler = _dispatch.get(cls) or _resolve(cls)
+            if handler is SEQUENCE:
+                items = list(value)
+                parent[key] = items
+                for index in range(len(items) - 1, -1, -1):
+                    if type(items[index]) not in PRIMITIVES:
+                        stack.append((items, index))
+            elif handler is ELEMENT:
+                node = {'__type__': 'PyXElement', 'tag': value.tag, 'props': value.props, 'children': value.children}
+                parent[key] = node
+                stack.append((node, 'children'))
+                stack.append((node, 'props'))
+            elif handler is MAPPING:
+                items = dict(value)
+                parent[key] = items
+                for name in reversed(items):
+                    if type(items[name]) not in PRIMITIVES:
+                        stack.append((items, name))
+            else:
+                result = handler(manager, value, references)
+                if type(result) is cls:
+                    raise Exception(f"Converter for {cls} returned the same type")
+                parent[key] = result
+                stack.append((parent, key))
+        return root[0], references
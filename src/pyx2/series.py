@@ -0,0 +1,121 @@
+import array
+import sys
+from typing import Iterator, List, Tuple
+
+from .tracking import notifyChanged, recordRead
+
+# Binary payloads reach the browser as typed arrays, fetched from /arrays/<id> instead of being
+# embedded in the render tree. Element types use NumPy's kind + itemsize codes, little-endian.
+DTYPES = {
+    # code: (NumPy name, array module typecode)
+    'i1': ('int8', 'b'),
+    'u1': ('uint8', 'B'),
+    'i2': ('int16', 'h'),
+    'u2': ('uint16', 'H'),
+    'i4': ('int32', 'i'),
+    'u4': ('uint32', 'I'),
+    'i8': ('int64', 'q'),
+    'u8': ('uint64', 'Q'),
+    'f4': ('float32', 'f'),
+    'f8': ('float64', 'd'),
+}
+DTYPE_CODES = {name: code for code, (name, typecode) in DTYPES.items()}
+TYPECODES = {typecode: code for code, (name, typecode) in DTYPES.items()}
+DTYPE_SIZES = {code: int(code[1]) for code in DTYPES}
+CHUNK_BYTES = 1 << 20   # Largest piece written to the response at once
+MAX_BLOCKS = 1024       # Appended blocks are joined once there are more of them
+
+
+def dtypeCode(dtype: object):
+    # Accepts 'f4', '<f4', 'float32' or a NumPy dtype
+    name = str(getattr(dtype, 'str', dtype)).lstrip('<|=')
+    code = DTYPE_CODES.get(name, name)
+    if code not in DTYPES:
+        raise Exception(f"Unsupported array element type {dtype}")
+    return code
+
+
+def arrayInfo(data: object) -> Tuple[str, List[int], int]:
+    # (dtype code, shape, size in bytes) of a NumPy array, bytes-like object or Series
+    if isinstance(data, Series):
+        return data.dtype, [len(data)], data.nbytes
+    if isinstance(data, (bytes, bytearray)):
+        return 'u1', [len(data)], len(data)
+    if isinstance(data, memoryview):
+        code = TYPECODES.get(data.format, 'u1')
+        return code, [data.nbytes // DTYPE_SIZES[code]], data.nbytes
+    dtype = data.dtype
+    if dtype.byteorder == '>' or (dtype.byteorder == '=' and sys.byteorder == 'big'):
+        raise Exception("Only little-endian arrays can be sent to the browser")
+    return dtypeCode(dtype.kind + str(dtype.itemsize)), list(data.shape), data.nbytes
+
+
+def bufferOf(data: object) -> memoryview:
+    # A flat byte view of the data, copied only if the array is not contiguous
+    if hasattr(data, 'dtype') and not data.flags['C_CONTIGUOUS']:
+        data = data.copy()
+    return memoryview(data).cast('B')
+
+
+class Series:
+    # An append-only, growing array. Renders that reference it are updated when it grows, and
+    # browsers only fetch the appended bytes. Appended blocks are immutable, so responses being
+    # written while the series grows keep valid views of them.
+    def __init__(self, dtype: object = 'f8', values=()):
+        self.dtype = dtypeCode(dtype)
+        self.blocks: List[bytes] = []
+        self.nbytes = 0
+        self.append(values)
+
+    def __len__(self):
+        recordRead(self, 'length')
+        return self.nbytes // DTYPE_SIZES[self.dtype]
+
+    def append(self, values):
+        # Takes a single number, a sequence of numbers or a NumPy array
+        if hasattr(values, 'astype'):
+            data = values.astype(DTYPES[self.dtype][0], copy=False).tobytes()
+        else:
+            if not hasattr(values, '__iter__'):
+                values = (values,)
+            packed = array.array(DTYPES[self.dtype][1], values)
+            if sys.byteorder == 'big':
+                packed.byteswap()
+            data = packed.tobytes()
+        if len(data) == 0:
+            return
+        self.blocks.append(data)
+        self.nbytes += len(data)
+        if len(self.blocks) > MAX_BLOCKS:
+            self.blocks = [b''.join(self.blocks)]
+        notifyChanged(self, 'length')
+
+    def chunks(self, start: int, end: int) -> Iterator[memoryview]:
+        offset = 0
+        for block in list(self.blocks):
+            if offset >= end:
+                break
+            if offset + len(block) > start:
+                view = memoryview(block)[max(start - offset, 0):min(end - offset, len(block))]
+                for position in range(0, len(view), CHUNK_BYTES):
+                    yield view[position:position + CHUNK_BYTES]
+            offset += len(block)
+
+
+def parseRange(header: str, size: int):
+    # A single `bytes=START-END`, `bytes=START-` or `bytes=-SUFFIX` range as (start, end), end
+    # exclusive; None if it cannot be satisfied
+    unit, _, spec = header.partition('=')
+    if unit.strip() != 'bytes' or ',' in spec:
+        return None
+    first, _, last = spec.strip().partition('-')
+    try:
+        if first == '':
+            start, end = max(size - int(last), 0), size
+        else:
+            start, end = int(first), min(int(last) + 1, size) if last != '' else size
+    except ValueError:
+        return None
+    if start >= end:
+        return None
+    return start, end
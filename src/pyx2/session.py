@@ -0,0 +1,49 @@
+import asyncio
+import secrets
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .resource import Hash
+
+
+class PendingSessions:
+    # Clients rendered on the server for an HTML response, waiting for the browser's WebSocket.
+    # Sessions that are not adopted within `ttl` seconds are released; at most `maxSessions` wait
+    # at a time, so anonymous page loads cannot pin unbounded memory. Expired clients are passed to
+    # `release`.
+    def __init__(self, ttl: float = 30, maxSessions: Optional[int] = 256, release: Optional[Callable[[Any], None]] = None):
+        self.ttl = ttl
+        self.maxSessions = maxSessions
+        self.release = release if release is not None else (lambda client: client.release())
+        self.sessions: Dict[str, Tuple[Any, Dict[Hash, int], float]] = {}
+
+    def create(self, client: Any, versions: Dict[Hash, int]):
+        self.expire()
+        token = secrets.token_urlsafe(16)
+        self.sessions[token] = (client, versions, time.monotonic() + self.ttl)
+        try:
+            asyncio.get_running_loop().call_later(self.ttl, self.expire)
+        except RuntimeError:
+            pass
+        return token
+
+    def full(self):
+        self.expire()
+        return self.maxSessions is not None and len(self.sessions) >= self.maxSessions
+
+    def adopt(self, token: Optional[str]):
+        # Returns (client, versions) at most once per token
+        self.expire()
+        if token is None or token not in self.sessions:
+            return None
+        client, versions, _ = self.sessions.pop(token)
+        return client, versions
+
+    def expire(self):
+        now = time.monotonic()
+        for token in [token for token, (_, _, deadline) in self.sessions.items() if deadline <= now]:
+            client, _, _ = self.sessions.pop(token)
+            self.release(client)
+
+    def __len__(self):
+        return len(self.sessions)
@@ -0,0 +1,124 @@
+import html
+import json
+import re
+from typing import Dict, List
+
+from .resource import Hash
+
+# Server-side rendering of serialized frames (the same trees sent over the WebSocket) to HTML
+# markup that React can hydrate. Renderables are inlined from their own frames.
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'}
+
+ATTRIBUTE_NAMES = {'className': 'class', 'htmlFor': 'for', 'defaultValue': 'value', 'defaultChecked': 'checked'}
+SKIPPED_PROPS = {'key', 'ref', 'children', 'dangerouslySetInnerHTML', 'suppressHydrationWarning'}
+
+# CSS properties React writes without a px suffix
+UNITLESS_STYLES = {
+    'animationIterationCount', 'aspectRatio', 'columnCount', 'columns', 'flex', 'flexGrow', 'flexShrink',
+    'fontWeight', 'gridArea', 'gridColumn', 'gridColumnEnd', 'gridColumnStart', 'gridRow', 'gridRowEnd',
+    'gridRowStart', 'lineClamp', 'lineHeight', 'opacity', 'order', 'orphans', 'scale', 'tabSize', 'widows',
+    'zIndex', 'zoom', 'fillOpacity', 'floodOpacity', 'stopOpacity', 'strokeDasharray', 'strokeDashoffset',
+    'strokeMiterlimit', 'strokeOpacity', 'strokeWidth',
+}
+
+TEXT_SEPARATOR = '<!-- -->'     # React's marker between adjacent text nodes
+
+
+def _styleName(name: str):
+    if name.startswith('--'):
+        return name
+    name = re.sub(r'([A-Z])', lambda match: '-' + match.group(1).lower(), name)
+    return '-' + name if name.startswith('ms-') else name
+
+
+def _style(style: Dict):
+    declarations = []
+    for name, value in style.items():
+        if value is None or isinstance(value, bool) or value == '':
+            continue
+        if isinstance(value, (int, float)) and value != 0 and name not in UNITLESS_STYLES and not name.startswith('--'):
+            value = f'{value}px'
+        declarations.append(f'{_styleName(name)}:{value}')
+    return ';'.join(declarations)
+
+
+def _attributes(props: Dict):
+    attributes = []
+    for name, value in props.items():
+        if name in SKIPPED_PROPS or value is None:
+            continue
+        if isinstance(value, dict):
+            # Functions are attached by hydration; other objects are only meaningful as styles
+            if name == 'style' and '__type__' not in value:
+                value = _style(value)
+                if value == '':
+                    continue
+            else:
+                continue
+        elif isinstance(value, (list, tuple)):
+            continue
+        name = ATTRIBUTE_NAMES.get(name, name)
+        if isinstance(value, bool):
+            if name.startswith(('aria-', 'data-')):
+                value = 'true' if value else 'false'
+            elif value:
+                attributes.append(f' {name}=""')
+                continue
+            else:
+                continue
+        attributes.append(f' {name}="{html.escape(str(value))}"')
+    return ''.join(attributes)
+
+
+def renderToHTML(frames: Dict[Hash, object], root: Hash) -> str:
+    # Iterative walk; the stack holds nodes to render and literal closing tags
+    output: List[str] = []
+    lastWasText = False
+    stack: List[object] = [{'__type__': 'Renderable', 'id': root}]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _Markup):
+            output.append(node)
+            lastWasText = False
+        elif node is None or isinstance(node, bool):
+            continue
+        elif isinstance(node, (str, int, float)):
+            if lastWasText:
+                output.append(TEXT_SEPARATOR)
+            output.append(html.escape(str(node), quote=False))
+            lastWasText = True
+        elif isinstance(node, (list, tuple)):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict) and node.get('__type__') == 'Renderable':
+            if node['id'] in frames:
+                stack.append(frames[node['id']])
+        elif isinstance(node, dict) and node.get('__type__') == 'PyXElement':
+            tag = node['tag']
+            props = node['props'] or {}
+            output.append(f'<{tag}{_attributes(props)}>')
+            lastWasText = False
+            if tag in VOID_TAGS:
+                continue
+            stack.append(_Markup(f'</{tag}>'))
+            inner = props.get('dangerouslySetInnerHTML')
+            if isinstance(inner, dict) and '__html' in inner:
+                stack.append(_Markup(inner['__html']))
+            elif tag == 'textarea' and ('value' in props or 'defaultValue' in props):
+                stack.append(_Markup(html.escape(str(props.get('value', props.get('defaultValue'))), quote=False)))
+            else:
+                stack.extend(reversed(node['children']))
+    return ''.join(output)
+
+
+class _Markup(str):
+    pass
+
+
+ROOT_ELEMENT = '<div id="root"></div>'    # Where the markup goes in index.html
+
+
+def embedState(page: str, markup: str, state: Dict) -> str:
+    # `<` is escaped so that no string in the state can close the script tag
+    script = '<script>window.__PYX_STATE__=' + json.dumps(state, separators=(',', ':')).replace('<', '\\u003c') + '</script>'
+    return page.replace(ROOT_ELEMENT, f'<div id="root">{markup}</div>{script}', 1)
@@ -0,0 +1,78 @@
+import asyncio
+import math
+from typing import Any, List, Optional, Set
+
+
+class ConnectionSupervisor:
+    # One task watches every connection. Clients sit in the slot of a timing wheel for the tick
+    # they are next due; every tick handles one slot in a single pass, pinging clients that
+    # have been quiet for `interval` seconds and tearing down those quiet for over `timeout`.
+    # Any inbound message (pongs included) counts as activity.
+    def __init__(self, app: Any, interval: float = 10, timeout: float = 30, tick: float = 1):
+        self.app = app
+        self.interval = interval
+        self.timeout = timeout
+        self.tick = tick
+        self.slots: List[Set[Any]] = [set() for _ in range(math.ceil(max(interval, timeout) / tick) + 1)]
+        self.position = 0
+        self.task: Optional[asyncio.Task] = None
+        self.pings = 0
+        self.expired = 0
+
+    def add(self, client: Any):
+        loop = asyncio.get_running_loop()
+        client.lastSeen = loop.time()
+        self.place(client, self.interval)
+        if self.task is None or self.task.done():
+            self.task = loop.create_task(self.run())
+
+    def remove(self, client: Any):
+        slot = getattr(client, 'wheelSlot', None)
+        if slot is not None:
+            self.slots[slot].discard(client)
+            client.wheelSlot = None
+
+    def place(self, client: Any, delay: float):
+        ticks = min(max(1, math.ceil(delay / self.tick)), len(self.slots) - 1)
+        slot = (self.position + ticks) % len(self.slots)
+        self.slots[slot].add(client)
+        client.wheelSlot = slot
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            deadline += self.tick
+            await asyncio.sleep(max(0, deadline - loop.time()))
+            self.advance(loop.time())
+
+    def advance(self, now: float):
+        self.position = (self.position + 1) % len(self.slots)
+        due = self.slots[self.position]
+        self.slots[self.position] = set()
+        ping = {'event': 'ping'}
+        for client in due:
+            client.wheelSlot = None
+            idle = now - client.lastSeen
+            if idle > self.timeout:
+                self.expired += 1
+                self.app.dropClient(client, 1001)
+                continue
+            if self.app.quota.idle(client, now):
+                self.app.quota.evict(client, 1001)
+                continue
+            if idle >= self.interval:
+                client.outbox.post(ping)
+                self.pings += 1
+                # Check again by the deadline, or ping again if the client stays quiet
+                self.place(client, min(self.interval, self.timeout - idle))
+            else:
+                self.place(client, self.interval - idle)
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def __len__(self):
+        return sum(len(slot) for slot in self.slots)
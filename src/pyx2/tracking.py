@@ -0,0 +1,308 @@
+import asyncio
+import contextvars
+import copyreg
+import weakref
+from typing import Any, Callable, Dict, Hashable, List, Set, Tuple
+
+# A dependency is an attribute of a specific instance: (id(owner), attribute name).
+# Containers use ITEMS as the attribute name for their contents.
+Key = Tuple[int, str]
+ITEMS = '[]'
+
+# Reads are only recorded while a tracker is active, i.e. while a resource is rendering
+_reads: contextvars.ContextVar = contextvars.ContextVar('pyx2_reads', default=None)
+
+_engines: 'weakref.WeakSet[ReactiveEngine]' = weakref.WeakSet()
+_trackedClasses: Dict[type, type] = {}
+_writeListeners: List[Callable[[object, str], None]] = []
+_trackListeners: List[Callable[[object], None]] = []
+
+
+class Tracker:
+    def __enter__(self):
+        self.reads: Set[Key] = set()
+        self.token = _reads.set(self.reads)
+        return self.reads
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _reads.reset(self.token)
+
+
+def recordRead(obj: object, name: str):
+    reads = _reads.get()
+    if reads is not None:
+        reads.add((id(obj), name))
+
+
+def notifyChanged(obj: object, name: str):
+    # State written while rendering does not trigger another render
+    if _reads.get() is not None:
+        return
+    key = (id(obj), name)
+    for engine in list(_engines):
+        engine.changed(key)
+    for listener in _writeListeners:
+        listener(obj, name)
+
+
+def addWriteListener(listener: Callable[[object, str], None]):
+    # Called with (owner, attribute name) for every tracked write outside of renders
+    _writeListeners.append(listener)
+
+
+def addTrackListener(listener: Callable[[object], None]):
+    # Called with every instance that starts being tracked
+    _trackListeners.append(listener)
+
+
+class ReactiveEngine:
+    # Per-instance, per-attribute version counters and the resources subscribed to each of them
+    def __init__(self, onChange: Callable[[Hashable], None]):
+        self.onChange = onChange
+        self.versions: Dict[Key, int] = {}
+        self.subscribers: Dict[Key, Set[Hashable]] = {}
+        self.dependencies: Dict[Hashable, Set[Key]] = {}
+        _engines.add(self)
+
+    def setDependencies(self, resource_hash: Hashable, keys: Set[Key]):
+        # Dependencies are replaced on every render, so stale reads stop triggering renders
+        previous = self.dependencies.get(resource_hash, set())
+        for key in previous - keys:
+            subscribers = self.subscribers[key]
+            subscribers.discard(resource_hash)
+            if len(subscribers) == 0:
+                del self.subscribers[key]
+                del self.versions[key]
+        for key in keys - previous:
+            if key not in self.subscribers:
+                self.subscribers[key] = set()
+                self.versions[key] = 0
+            self.subscribers[key].add(resource_hash)
+        self.dependencies[resource_hash] = keys
+
+    def forget(self, resource_hash: Hashable):
+        if resource_hash in self.dependencies:
+            self.setDependencies(resource_hash, set())
+            del self.dependencies[resource_hash]
+
+    def version(self, key: Key):
+        return self.versions.get(key, 0)
+
+    def changed(self, key: Key):
+        subscribers = self.subscribers.get(key)
+        if not subscribers:
+            return
+        self.versions[key] += 1
+        for resource_hash in list(subscribers):
+            self.onChange(resource_hash)
+
+
+# Plain lists, dicts and sets cannot notify anyone of in-place mutations, and replacing them with
+# notifying subclasses would break every other reference to them. Instead, renders record the
+# identity of the containers they read, and a container read outside of a render is fingerprinted
+# right away, before it can be mutated, and again once the code that read it is done. Handlers
+# are checked when they complete (see MutationScope); other code on the event loop at the end of
+# the current tick. Mutations made through a reference that was not read from a tracked instance
+# in that window are not seen; rerender explicitly after those.
+CONTAINERS = (list, dict, set)
+
+_scope: contextvars.ContextVar = contextvars.ContextVar('pyx2_mutations', default=None)
+_pending: Dict[int, Tuple[object, int]] = {}    # Containers read outside of handlers
+_watched: Dict[int, int] = {}                   # Container ids watched without a render reading them
+_checkScheduled = False
+
+
+def fingerprint(value: object):
+    # Hash of the container's contents, nested containers included; other objects count by identity
+    tokens: List[Any] = []
+    seen: Set[int] = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is list or item_type is tuple or item_type is set or item_type is frozenset:
+            if id(item) in seen:
+                tokens.append(id(item))
+                continue
+            seen.add(id(item))
+            tokens.append((item_type, len(item)))
+            stack.extend(item)
+        elif item_type is dict:
+            if id(item) in seen:
+                tokens.append(id(item))
+                continue
+            seen.add(id(item))
+            tokens.append((dict, len(item)))
+            for key, child in item.items():
+                tokens.append(key)
+                stack.append(child)
+        elif item_type is str or item_type is int or item_type is float or item_type is bool or item is None or item_type is bytes:
+            tokens.append(item)
+        else:
+            tokens.append(id(item))
+    return hash(tuple(tokens))
+
+
+def watchContainer(value: object):
+    # Mutations of the container are reported to the write listeners even if no render reads it
+    _watched[id(value)] = _watched.get(id(value), 0) + 1
+
+
+def unwatchContainer(value: object):
+    count = _watched.get(id(value), 0) - 1
+    if count > 0:
+        _watched[id(value)] = count
+    else:
+        _watched.pop(id(value), None)
+
+
+def touchContainer(value: object):
+    global _checkScheduled
+    key = id(value)
+    scope = _scope.get()
+    touched = scope.containers if scope is not None else _pending
+    if key in touched:
+        return
+    if key not in _watched and not any((key, ITEMS) in engine.subscribers for engine in list(_engines)):
+        return
+    touched[key] = (value, fingerprint(value))
+    if scope is None and not _checkScheduled:
+        try:
+            asyncio.get_running_loop().call_soon(checkPending)
+            _checkScheduled = True
+        except RuntimeError:
+            pass    # Read outside of the event loop; checked along with the next read on it
+
+
+def checkContainers(touched: Dict[int, Tuple[object, int]]):
+    entries = list(touched.values())
+    touched.clear()
+    for value, before in entries:
+        if fingerprint(value) != before:
+            notifyChanged(value, ITEMS)
+
+
+def checkPending():
+    global _checkScheduled
+    _checkScheduled = False
+    checkContainers(_pending)
+
+
+class MutationScope:
+    # Collects the containers a handler reads from tracked instances; check() reports the ones it
+    # mutated. Tasks and threads started inside the scope share it through the context.
+    def __enter__(self):
+        self.containers: Dict[int, Tuple[object, int]] = {}
+        self.token = _scope.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _scope.reset(self.token)
+
+    def check(self):
+        checkContainers(self.containers)
+
+
+_setClass = object.__dict__['__class__'].__set__
+
+
+def _newInstance(cls: type, *args):
+    # copyreg.__newobj__ for instances pickled under another class than their own
+    return cls.__new__(cls, *args)
+
+
+def _createTrackedClass(cls: type):
+    base_getattribute = cls.__getattribute__
+    base_setattr = cls.__setattr__
+    base_delattr = cls.__delattr__
+    base_reduce_ex = cls.__reduce_ex__
+
+    def __getattribute__(self, name):
+        if name[:2] == '__':
+            return base_getattribute(self, name)
+        reads = _reads.get()
+        if reads is not None:
+            reads.add((id(self), name))
+        value = base_getattribute(self, name)
+        if type(value) in CONTAINERS:
+            if reads is not None:
+                reads.add((id(value), ITEMS))
+            else:
+                touchContainer(value)
+        return value
+
+    def __setattr__(self, name, value):
+        base_setattr(self, name, value)
+        notifyChanged(self, name)
+
+    def __reduce_ex__(self, protocol):
+        # Pickled (and copied) as the user's class; copies are tracked once they are rendered
+        reduced = base_reduce_ex(self, protocol)
+        if isinstance(reduced, tuple) and len(reduced) >= 2 and len(reduced[1]) > 0 and reduced[1][0] is type(self):
+            constructor = _newInstance if reduced[0] is copyreg.__newobj__ else reduced[0]
+            reduced = (constructor, (cls,) + tuple(reduced[1][1:])) + tuple(reduced[2:])
+        return reduced
+
+    def __delattr__(self, name):
+        base_delattr(self, name)
+        notifyChanged(self, name)
+
+    # Instances report the user's class, so code comparing `obj.__class__` (dataclass and attrs
+    # __eq__, isinstance, functools.singledispatch, copy and pickle) treats tracked and untracked
+    # instances alike. Only type(obj) reveals the tracking subclass.
+    def getClass(self):
+        return cls
+
+    def setClass(self, value):
+        _setClass(self, value)
+
+    # Empty __slots__ keeps the instance layout identical, so __class__ can be swapped in place
+    return type(cls.__name__, (cls,), {
+        '__slots__': (),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__class__': property(getClass, setClass),
+        '__getattribute__': __getattribute__,
+        '__setattr__': __setattr__,
+        '__delattr__': __delattr__,
+        '__reduce_ex__': __reduce_ex__,
+        '__pyx_tracked__': cls,
+    })
+
+
+def isTracked(obj: object):
+    return type(obj).__dict__.get('__pyx_tracked__') is not None
+
+
+def trackInstance(obj: object):
+    # Swaps the class of this one instance for a tracking subclass; the user's class is left untouched.
+    # Limitation: type(obj) is the subclass from then on, so `type(obj) is Cls` and dispatch on
+    # type(obj) see a different class for rendered instances; compare obj.__class__ or use isinstance.
+    cls = type(obj)
+    if cls.__dict__.get('__pyx_tracked__') is not None:
+        return True
+    if cls not in _trackedClasses:
+        try:
+            _trackedClasses[cls] = _createTrackedClass(cls)
+        except TypeError:
+            return False
+    try:
+        obj.__class__ = _trackedClasses[cls]
+    except TypeError:
+        return False
+    for listener in _trackListeners:
+        listener(obj)
+    return True
+
+
+def retrackInstance(obj: object, cls: type):
+    # Moves a tracked instance to the tracking subclass of another class (a reloaded version of its
+    # class); raises TypeError if the layouts differ
+    if cls not in _trackedClasses:
+        _trackedClasses[cls] = _createTrackedClass(cls)
+    obj.__class__ = _trackedClasses[cls]
+
+
+def trackedClass(obj: object):
+    # The user's class of a tracked instance
+    return type(obj).__dict__.get('__pyx_tracked__', type(obj))
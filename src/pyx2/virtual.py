@@ -0,0 +1,80 @@
+import asyncio
+import math
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from .context import current
+from .element import createElement
+from .resource import hashResource
+
+
+class Viewport:
+    # The rows one client has rendered, and the scroll handler its browser calls. Kept per client,
+    # so every session scrolls independently, and released with the list's node in its graph.
+    __pyx_preload__ = [(0, 'target', 'scrollTop'), (0, 'target', 'clientHeight')]
+
+    def __init__(self, virtualList: 'VirtualList', client: Any, start: int, end: int):
+        self.virtualList = virtualList
+        self.client = client
+        self.start = start
+        self.end = end
+
+    async def __call__(self, event):
+        scroll_top, client_height = await asyncio.gather(event.target.scrollTop, event.target.clientHeight)
+        self.virtualList.scrolled(self, scroll_top or 0, client_height or 0)
+
+
+class VirtualList:
+    # A scrolling list that only renders the rows in view plus `overscan` rows on each side. The
+    # window moves once the visible rows leave it; rows that fall out of it are dropped from the
+    # client's graph, releasing their resources. Rows have a fixed height of `rowHeight` pixels.
+    # `items` is kept as given, not copied: mutating it through the app's state rerenders the list.
+    __render_cache__ = False    # Every client renders its own window
+
+    def __init__(self, items: Sequence, renderItem: Optional[Callable[[Any, int], Any]] = None, rowHeight: int = 32, height: int = 600,
+                 overscan: int = 10, key: Optional[Callable[[Any], Any]] = None, props: Optional[Dict] = None):
+        self.items = items
+        self.renderItem = renderItem
+        self.rowHeight = rowHeight
+        self.height = height
+        self.overscan = overscan
+        self.key = key
+        self.props = props if props is not None else {}
+
+    def viewport(self, client: Any) -> Viewport:
+        resource_hash = hashResource(self)
+        viewport = client.local.get(resource_hash)
+        if viewport is None:
+            viewport = Viewport(self, client, 0, math.ceil(self.height / self.rowHeight) + self.overscan)
+            client.local[resource_hash] = viewport
+        return viewport
+
+    def scrolled(self, viewport: Viewport, scroll_top: float, client_height: float):
+        first = int(scroll_top // self.rowHeight)
+        last = math.ceil((scroll_top + (client_height or self.height)) / self.rowHeight)
+        if first >= viewport.start and last <= viewport.end:
+            return
+        viewport.start = max(0, first - self.overscan)
+        viewport.end = last + self.overscan
+        # Only this client's window moved
+        current.app.scheduler.markDirty(hashResource(self), viewport.client)
+
+    def renderRow(self, item: Any, index: int):
+        return self.renderItem(item, index) if self.renderItem is not None else item
+
+    def __render__(self):
+        viewport = self.viewport(current.user)
+        items = self.items
+        count = len(items)
+        rows = []
+        for index in range(viewport.start, min(viewport.end, count)):
+            item = items[index]
+            rows.append(createElement('div', {
+                'key': self.key(item) if self.key is not None else index,
+                'style': {'position': 'absolute', 'top': index * self.rowHeight, 'height': self.rowHeight, 'left': 0, 'right': 0},
+            }, self.renderRow(item, index)))
+        props = dict(self.props)
+        props['style'] = {'height': self.height, 'overflowY': 'auto', 'position': 'relative', **props.get('style', {})}
+        props['onScroll'] = viewport
+        return createElement('div', props,
+            createElement('div', {'style': {'height': count * self.rowHeight, 'position': 'relative'}}, *rows),
+        )
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Tests run against the source tree, like benchmarks/run.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
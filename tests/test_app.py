@@ -0,0 +1,147 @@
+import json
+import re
+
+from starlette.responses import PlainTextResponse
+from starlette.testclient import TestClient
+
+from pyx2 import PyX, VirtualList, createElement, current
+from pyx2.ssr import ROOT_ELEMENT, embedState, renderToHTML
+
+
+class Hello:
+    def __render__(self):
+        return createElement('div', {}, 'hello')
+
+
+def test_routes_added_after_construction_take_precedence_over_assets():
+    app = PyX(Hello(), ssr=False)
+
+    @app.route('/api/hello')
+    async def hello(request):
+        return PlainTextResponse('hi')
+
+    with TestClient(app) as client:
+        assert client.get('/api/hello').text == 'hi'
+        script = client.get('/pyx2.js')
+        assert script.status_code == 200
+        assert 'javascript' in script.headers['content-type']
+        assert client.get('/missing.js').status_code == 404
+
+
+class Gallery:
+    def __init__(self):
+        from PIL import Image
+        self.image = Image.new('RGB', (4, 4), 'red')
+        self.data = bytearray(b'\x01\x02\x03\x04')
+
+    def __render__(self):
+        return createElement('div', {}, createElement('img', {'src': self.image}), createElement('pyx-chart', {'points': self.data}))
+
+
+def test_images_and_arrays_require_their_token():
+    app = PyX(Gallery(), ssr=False)
+    with TestClient(app) as client:
+        with client.websocket_connect('/ws') as websocket:
+            frames = []
+            while not any(message['event'] == 'render' for message in frames):
+                message = websocket.receive_json()
+                frames.extend(message['data'] if message['event'] == 'batch' else [message])
+            root = [message for message in frames if message['event'] == 'root'][0]['data']
+            tree = [message for message in frames if message['event'] == 'render'][0]['data'][str(root)]
+            image, chart = tree['children']
+            src = image['props']['src']
+            array = chart['props']['points']
+
+            assert client.get('/' + src).status_code == 200
+            assert client.get('/' + src.replace('t=', 't=x')).status_code == 404
+            assert client.get('/' + src.split('?')[0]).status_code == 404
+
+            url = f"/arrays/{array['id']}"
+            assert client.get(url, params={'t': array['token']}).content == b'\x01\x02\x03\x04'
+            assert client.get(url, params={'t': 'guess'}).status_code == 404
+            assert client.get(url).status_code == 404
+
+
+class Greeting:
+    def __render__(self):
+        return createElement('p', {}, f"hello {current.user.data['name']}")
+
+
+class GreetingApp(PyX):
+    connects = 0
+    disconnects = 0
+
+    def onConnect(self):
+        self.connects += 1
+        current.user.data['name'] = '<ada>'
+
+    def onDisconnect(self):
+        self.disconnects += 1
+
+
+def pageState(page):
+    return json.loads(re.search(r'window\.__PYX_STATE__=(.*?)</script>', page).group(1))
+
+
+def test_server_rendered_page_runs_on_connect_and_is_adopted():
+    app = GreetingApp(Greeting())
+    with TestClient(app) as client:
+        page = client.get('/').text
+        assert app.connects == 1
+        assert '<div id="root"><p>hello &lt;ada&gt;</p></div>' in page
+        state = pageState(page)
+        assert state['resources'][str(state['root'])]['children'] == ['hello <ada>']
+        pending = app.sessions.sessions[state['session']][0]
+
+        with client.websocket_connect('/ws?session=' + state['session']):
+            assert app.clients == {pending}
+            assert app.connects == 1
+            assert len(app.sessions) == 0
+        assert app.disconnects == 1
+
+
+def test_expired_server_rendered_session_runs_on_disconnect():
+    app = GreetingApp(Greeting(), session_ttl=0)
+    with TestClient(app) as client:
+        client.get('/')
+        app.sessions.expire()
+        assert len(app.sessions) == 0
+        assert (app.connects, app.disconnects) == (1, 1)
+        assert app.resource_manager.resources.keys() == {app.resource_manager.root.hash}
+
+
+def test_embedded_state_cannot_close_the_script_tag():
+    page = embedState(f'<body>{ROOT_ELEMENT}</body>', renderToHTML({1: {'__type__': 'PyXElement', 'tag': 'i', 'props': {}, 'children': ['</script>']}}, 1), {'text': '</script><script>'})
+    assert page.count('</script>') == 1
+    assert '<i>&lt;/script&gt;</i>' in page
+    assert pageState(page) == {'text': '</script><script>'}
+
+
+def receiveUntil(websocket, event):
+    messages = []
+    while not any(message['event'] == event for message in messages):
+        message = websocket.receive_json()
+        messages.extend(message['data'] if message['event'] == 'batch' else [message])
+    return messages
+
+
+def test_scrolling_a_virtual_list_renders_through_the_scheduler():
+    rows = VirtualList([f'row {index}' for index in range(1000)], rowHeight=20, height=200, overscan=5)
+    app = PyX(rows, ssr=False, frame_budget=0.01)
+    flushes = []
+    flush = app.scheduler.flush
+    app.scheduler.flush = lambda: (flushes.append(dict(app.scheduler.local)), flush())
+    with TestClient(app) as client:
+        with client.websocket_connect('/ws') as websocket, client.websocket_connect('/ws') as other:
+            messages = receiveUntil(websocket, 'render')
+            receiveUntil(other, 'render')
+            root = [message for message in messages if message['event'] == 'root'][0]['data']
+            tree = [message for message in messages if message['event'] == 'render'][0]['data'][str(root)]
+            handler = tree['props']['onScroll']['id']
+
+            websocket.send_json({'event': 'resource_event', 'data': {'id': handler, 'data': {'event': 'call', 'data': {
+                'call_id': 'a', 'arg_count': 1, 'preloaded_data': [[[0, 'target', 'scrollTop'], 10000], [[0, 'target', 'clientHeight'], 200]]}}}})
+            render = [message for message in receiveUntil(websocket, 'render') if message['event'] == 'render'][0]
+            assert str(root) in render.get('patch', render['data'])
+            assert [list(dirty.values()) for dirty in flushes if dirty] == [[{root: None}]]
+            assert sorted(session.local[root].start for session in app.clients) == [0, 495]
@@ -0,0 +1,66 @@
+import asyncio
+import os
+import stat
+
+import pytest
+
+from pyx2 import bus
+from pyx2.bus import UnixSocketBus
+
+
+def test_default_socket_lives_in_a_private_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+    monkeypatch.setattr(bus.tempfile, 'gettempdir', lambda: str(tmp_path))
+
+    async def main():
+        relay = UnixSocketBus()
+        await relay.start(lambda message: None)
+        try:
+            directory = os.path.dirname(relay.path)
+            assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+            assert stat.S_IMODE(os.stat(relay.path).st_mode) & 0o077 == 0
+        finally:
+            await relay.close()
+    asyncio.run(main())
+
+
+def test_shared_directory_is_refused(tmp_path, monkeypatch):
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    shared.chmod(0o777)
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(shared))
+    with pytest.raises(Exception, match='only its owner'):
+        asyncio.run(UnixSocketBus().start(lambda message: None))
+
+
+def test_unusable_lock_file_is_reported(tmp_path):
+    path = str(tmp_path / 'bus.sock')
+    os.mkdir(path + '.lock')
+    with pytest.raises(Exception, match='Cannot open the bus lock file'):
+        asyncio.run(UnixSocketBus(path).start(lambda message: None))
+
+
+def test_peers_of_other_users_are_refused(tmp_path, monkeypatch):
+    path = str(tmp_path / 'bus.sock')
+
+    async def main():
+        received = []
+        relay = UnixSocketBus(path)
+        await relay.start(received.append)
+        monkeypatch.setattr(bus, 'peerUid', lambda writer: os.getuid() + 1)
+        try:
+            # The relay refuses the peer, and the peer refuses the relay
+            with pytest.raises(Exception, match='another user'):
+                await UnixSocketBus(path).start(lambda message: None)
+            reader, writer = await asyncio.open_unix_connection(path)
+            data = bus.pickle.dumps({'n': 1})
+            writer.write(len(data).to_bytes(4, 'big') + data)
+            try:
+                assert await reader.read() == b''
+            except ConnectionResetError:
+                pass    # Closed by the relay while the frame was in flight
+            writer.close()
+            assert received == [] and len(relay.peers) == 0
+        finally:
+            await relay.close()
+    asyncio.run(main())
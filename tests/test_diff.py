@@ -0,0 +1,99 @@
+import json
+import random
+
+from pyx2.diff import diffElement
+
+
+def element(tag, props, *children):
+    # Serialized form of a PyXElement, as produced by the serializer
+    return {'__type__': 'PyXElement', 'tag': tag, 'props': props, 'children': list(children)}
+
+
+def applyPatch(tree, ops):
+    # Mirror of PyXClient.applyPatch in src/frontend/src/PyXClient.tsx
+    tree = json.loads(json.dumps(tree))
+    for op in ops:
+        kind, path = op[0], op[1]
+        if kind == 'r' and len(path) == 0:
+            tree = op[2]
+            continue
+        node = tree
+        for index in (path[:-1] if kind == 'r' else path):
+            node = node['children'][index]
+        if kind == 'r':
+            node['children'][path[-1]] = op[2]
+        elif kind == 'p':
+            node['props'][op[2]] = op[3]
+        elif kind == 'd':
+            del node['props'][op[2]]
+        elif kind == 'i':
+            node['children'].insert(op[2], op[3])
+        elif kind == 'x':
+            del node['children'][op[2]]
+        elif kind == 'm':
+            node['children'].insert(op[3], node['children'].pop(op[2]))
+    return tree
+
+
+def randomTree(rng: random.Random, depth: int, keyed: bool):
+    if depth == 0 or rng.random() < 0.3:
+        return rng.choice(['a', 'b', 'c', 1, 2])
+    count = rng.randint(0, 5)
+    children = [randomTree(rng, depth - 1, keyed) for _ in range(count)]
+    if keyed:
+        keys = rng.sample(range(8), count)
+        children = [element('li', {'key': key, 'x': rng.randint(0, 2)}, child) for key, child in zip(keys, children)]
+        if rng.random() < 0.3:
+            children.append('tail')
+    props = {'a': rng.randint(0, 2)} if rng.random() < 0.5 else {}
+    return element(rng.choice(['div', 'div', 'span']), props, *children)
+
+
+def test_round_trip():
+    rng = random.Random(1)
+    patched = 0
+    for _ in range(5000):
+        keyed = rng.random() < 0.5
+        old, new = randomTree(rng, 4, keyed), randomTree(rng, 4, keyed)
+        ops = diffElement(old, new)
+        if ops is None:
+            continue
+        patched += 1
+        assert applyPatch(old, ops) == new
+    assert patched > 1000
+
+
+def test_unchanged_tree_has_empty_patch():
+    tree = element('div', {'id': 'x'}, element('span', {}, 'a'), 'b')
+    assert diffElement(tree, json.loads(json.dumps(tree))) == []
+
+
+def test_replaced_root_has_no_patch():
+    assert diffElement(element('div', {}), element('span', {})) is None
+    assert diffElement(element('li', {'key': 1}), element('li', {'key': 2})) is None
+    assert diffElement('a', 'b') is None
+
+
+def test_props():
+    old = element('div', {'a': 1, 'b': 2})
+    new = element('div', {'a': 1, 'c': 3})
+    ops = diffElement(old, new)
+    assert sorted(op[0] for op in ops) == ['d', 'p']
+    assert applyPatch(old, ops) == new
+
+
+def test_keyed_reorder_moves_children():
+    rows = [element('li', {'key': key}, f'row {key}') for key in range(5)]
+    old = element('ul', {}, *rows)
+    new = element('ul', {}, *reversed(rows))
+    ops = diffElement(old, new)
+    assert {op[0] for op in ops} == {'m'}
+    assert applyPatch(old, ops) == new
+
+
+def test_keyed_insert_and_remove():
+    old = element('ul', {}, *[element('li', {'key': key}, key) for key in (1, 2, 3)])
+    new = element('ul', {}, *[element('li', {'key': key}, key) for key in (0, 2, 3, 4)])
+    ops = diffElement(old, new)
+    assert all(op[0] in ('i', 'x') for op in ops)
+    assert applyPatch(old, ops) == new
@@ -0,0 +1,71 @@
+import random
+
+from pyx2.resource import ReferenceGraph
+
+
+def reachable(graph: ReferenceGraph):
+    seen = {graph.root}
+    stack = [graph.root]
+    while stack:
+        for child in graph.nodes[stack.pop()]:
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+    return seen
+
+
+def referenceCounts(graph: ReferenceGraph):
+    counts = {node: 1 if node == graph.root else 0 for node in graph.nodes}
+    for edges in graph.nodes.values():
+        for child in edges:
+            counts[child] += 1
+    return counts
+
+
+def test_apply_updates_matches_reachability():
+    rng = random.Random(1)
+    for _ in range(1000):
+        graph = ReferenceGraph(0)
+        for _ in range(15):
+            before = set(graph.nodes)
+            updates = {node: set(rng.sample(range(12), rng.randint(0, 3))) for node in rng.sample(sorted(before), min(len(before), rng.randint(1, 3)))}
+            created, deleted = graph.applyUpdates(updates)
+            after = set(graph.nodes)
+            assert after == reachable(graph)
+            assert created == after - before
+            assert deleted == before - after
+            assert graph.referenceCount == referenceCounts(graph)
+
+
+def test_cycles_are_collected():
+    graph = ReferenceGraph(0)
+    graph.applyUpdates({0: {1}, 1: {2}, 2: {1, 3}, 3: {3}})
+    created, deleted = graph.applyUpdates({0: set()})
+    assert created == set()
+    assert deleted == {1, 2, 3}
+    assert graph.nodes == {0: set()}
+
+
+def test_cycle_still_referenced_from_outside_survives():
+    graph = ReferenceGraph(0)
+    graph.applyUpdates({0: {1, 4}, 1: {2}, 2: {1}, 4: {2}})
+    created, deleted = graph.applyUpdates({0: {4}})
+    assert deleted == set()
+    assert reachable(graph) == set(graph.nodes) == {0, 1, 2, 4}
+
+
+def test_nodes_created_and_dropped_in_one_batch_are_not_reported():
+    graph = ReferenceGraph(0)
+    graph.applyUpdates({0: {1}})
+    created, deleted = graph.applyUpdates({0: set(), 1: {2}})
+    assert created == set()
+    assert deleted == {1}
+    assert graph.nodes == {0: set()}
+
+
+def test_long_chain_is_released_without_recursion():
+    graph = ReferenceGraph(0)
+    graph.applyUpdates({index: {index + 1} for index in range(50000)})
+    created, deleted = graph.applyUpdates({0: set()})
+    assert len(deleted) == 50000
+    assert graph.nodes == {0: set()}
@@ -0,0 +1,174 @@
+import asyncio
+import copy
+import json
+import random
+
+from pyx2.codec import WireFormat, getCodec
+from pyx2.diff import diffElement
+from pyx2.outbox import MAX_MERGED_OPS, Outbox
+
+from test_diff import applyPatch, randomTree
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.frames = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.closed = None
+
+    async def send_text(self, data: str):
+        await self.gate.wait()
+        self.frames.append(json.loads(data))
+
+    async def close(self, code: int = 1000):
+        self.closed = code
+
+
+class FakeResourceManager:
+    metrics = None
+
+
+class FakeClient:
+    def __init__(self):
+        self.websocket = FakeWebSocket()
+        self.wire = WireFormat(getCodec('json'))
+        self.sent = {}
+        self.resourceManager = FakeResourceManager()
+
+
+def applyRender(trees, message):
+    # What the browser does with a render message
+    trees = dict(trees)
+    trees.update(message['data'])
+    for resource_hash, ops in message.get('patch', {}).items():
+        trees[resource_hash] = applyPatch(trees[resource_hash], ops)
+    return trees
+
+
+def renderMessage(client, resource_hash, tree):
+    # Like Client.createRenderMessage: a patch against the last sent tree when there is one
+    previous = client.sent.get(resource_hash)
+    ops = diffElement(previous, tree) if previous is not None else None
+    client.sent[resource_hash] = tree
+    if ops is None:
+        return {'event': 'render', 'data': {resource_hash: tree}}
+    return {'event': 'render', 'data': {}, 'patch': {resource_hash: ops}}
+
+
+def test_merged_render_equals_renders_in_sequence():
+    rng = random.Random(1)
+    for _ in range(300):
+        client = FakeClient()
+        outbox = Outbox(client)
+        browser = {}
+        for resource_hash in range(3):
+            browser = applyRender(browser, renderMessage(client, resource_hash, randomTree(rng, 3, False)))
+        expected = browser
+        pending = None
+        for _ in range(rng.randint(1, 6)):
+            message = renderMessage(client, rng.randrange(4), randomTree(rng, 3, rng.random() < 0.5))
+            expected = applyRender(expected, copy.deepcopy(message))
+            if pending is None:
+                pending = message
+            else:
+                outbox.merge(pending, message)
+        assert applyRender(browser, pending) == expected
+
+
+def test_patches_chain_and_collapse():
+    client = FakeClient()
+    outbox = Outbox(client)
+    client.sent[1] = 'tree'
+    pending = {'event': 'render', 'data': {}, 'patch': {1: [['p', [], 'a', 1]]}}
+    outbox.merge(pending, {'event': 'render', 'data': {}, 'patch': {1: [['p', [], 'a', 2]]}})
+    assert pending == {'event': 'render', 'data': {}, 'patch': {1: [['p', [], 'a', 1], ['p', [], 'a', 2]]}}
+    outbox.merge(pending, {'event': 'render', 'data': {}, 'patch': {1: [['p', [], 'b', 0]] * MAX_MERGED_OPS}})
+    assert pending == {'event': 'render', 'data': {1: 'tree'}}
+
+
+def test_frame_absorbs_later_patches():
+    client = FakeClient()
+    outbox = Outbox(client)
+    client.sent[1] = 'newest'
+    pending = {'event': 'render', 'data': {1: 'older'}}
+    outbox.merge(pending, {'event': 'render', 'data': {}, 'patch': {1: [['p', [], 'a', 1]]}})
+    assert pending == {'event': 'render', 'data': {1: 'newest'}}
+
+
+def test_unsent_render_absorbs_newer_renders():
+    async def main():
+        client = FakeClient()
+        client.websocket.gate.clear()
+        outbox = Outbox(client)
+        outbox.start()
+        outbox.offer({'event': 'a'})
+        await asyncio.sleep(0)      # The writer takes 'a' and waits on the socket
+        client.sent.update({1: 'one', 2: 'two'})
+        for resource_hash in (1, 2, 1):
+            assert outbox.offer({'event': 'render', 'data': {resource_hash: client.sent[resource_hash]}})
+        assert len(outbox.queue) == 1
+        client.websocket.gate.set()
+        await asyncio.sleep(0.01)
+        outbox.close()
+        assert client.websocket.frames == [{'event': 'a'}, {'event': 'render', 'data': {'1': 'one', '2': 'two'}}]
+    asyncio.run(main())
+
+
+def test_full_queue_drops_renders_and_retries_producers():
+    async def main():
+        client = FakeClient()
+        client.websocket.gate.clear()
+        outbox = Outbox(client, limit=2, policy='block')
+        outbox.start()
+        outbox.offer({'event': 'a'})
+        await asyncio.sleep(0)
+        outbox.offer({'event': 'b'})
+        outbox.offer({'event': 'c'})
+        client.sent[1] = 'tree'
+        assert outbox.offer({'event': 'render', 'data': {}, 'patch': {1: [['p', [], 'a', 1]]}})
+        assert outbox.dropped == 1
+        retries = []
+        for _ in range(2):
+            assert not outbox.offer({'event': 'preload'}, 'preload', lambda: retries.append(1))
+        client.websocket.gate.set()
+        await asyncio.sleep(0.01)
+        outbox.close()
+        assert retries == [1]
+        assert client.websocket.frames[1] == {'event': 'batch', 'data': [{'event': 'b'}, {'event': 'c'}, {'event': 'render', 'data': {'1': 'tree'}}]}
+    asyncio.run(main())
+
+
+def test_full_queue_disconnects():
+    async def main():
+        client = FakeClient()
+        client.websocket.gate.clear()
+        outbox = Outbox(client, limit=1, policy='disconnect')
+        outbox.start()
+        outbox.offer({'event': 'a'})
+        await asyncio.sleep(0)
+        outbox.offer({'event': 'b'})
+        assert not outbox.offer({'event': 'c'})
+        await asyncio.sleep(0)
+        assert outbox.closed and client.websocket.closed == 1013
+    asyncio.run(main())
+
+
+def test_unencodable_message_is_dropped_alone():
+    async def main():
+        client = FakeClient()
+        client.websocket.gate.clear()
+        outbox = Outbox(client)
+        outbox.start()
+        outbox.offer({'event': 'a'})
+        await asyncio.sleep(0)
+        outbox.offer({'event': 'function_return', 'data': {'return': {1, 2}}})
+        outbox.offer({'event': 'b'})
+        client.websocket.gate.set()
+        await asyncio.sleep(0.01)
+        outbox.offer({'event': 'c'})
+        await asyncio.sleep(0.01)
+        assert not outbox.closed
+        outbox.close()
+        assert client.websocket.frames == [{'event': 'a'}, {'event': 'b'}, {'event': 'c'}]
+    asyncio.run(main())
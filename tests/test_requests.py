@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from pyx2.app import RequestManager
+
+
+class FakeSender:
+    # Stands in for the client's Outbox
+    def __init__(self):
+        self.messages = []
+        self.full = False
+        self.closed = False
+        self.retries = {}
+
+    def offer(self, message, key=None, retry=None):
+        if self.closed:
+            return False
+        if self.full:
+            self.retries[key] = retry
+            return False
+        self.messages.append(message)
+        return True
+
+    def drain(self):
+        self.full = False
+        retries, self.retries = self.retries, {}
+        for retry in retries.values():
+            retry()
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_requests_in_one_tick_share_a_frame():
+    async def main():
+        sender = FakeSender()
+        manager = RequestManager(sender)
+        first, second = manager.request('a'), manager.request('b')
+        await asyncio.sleep(0)
+        assert sender.messages == [{'event': 'requests', 'data': [{'id': 1, 'data': 'a'}, {'id': 2, 'data': 'b'}]}]
+        manager.response({'id': 2, 'data': 'B'})
+        manager.response({'id': 1, 'data': 'A'})
+        assert await first == 'A' and await second == 'B'
+        third = manager.request('c')
+        await asyncio.sleep(0)
+        assert sender.messages[-1] == {'event': 'request', 'data': {'id': 3, 'data': 'c'}}
+        manager.response({'id': 3, 'data': None})
+        assert await third is None
+        assert manager.stats() == {'in_flight': 0, 'issued': 3, 'timed_out': 0, 'cancelled': 0}
+    run(main())
+
+
+def test_timeout_and_late_answer():
+    async def main():
+        manager = RequestManager(FakeSender(), timeout=0.01)
+        future = manager.request('a')
+        with pytest.raises(TimeoutError):
+            await future
+        manager.response({'id': 1, 'data': 'late'})     # Dropped
+        with pytest.raises(Exception):
+            manager.response({'id': 2, 'data': 'never issued'})
+        assert manager.stats() == {'in_flight': 0, 'issued': 1, 'timed_out': 1, 'cancelled': 0}
+    run(main())
+
+
+def test_cancelled_requests_are_not_sent():
+    async def main():
+        sender = FakeSender()
+        manager = RequestManager(sender)
+        manager.request('a').cancel()
+        kept = manager.request('b')
+        await asyncio.sleep(0)
+        assert sender.messages == [{'event': 'request', 'data': {'id': 2, 'data': 'b'}}]
+        assert manager.stats()['cancelled'] == 1
+        manager.cancelAll()
+        assert kept.cancelled()
+        assert manager.stats() == {'in_flight': 0, 'issued': 2, 'timed_out': 0, 'cancelled': 2}
+    run(main())
+
+
+def test_full_send_queue_defers_the_batch():
+    async def main():
+        sender = FakeSender()
+        sender.full = True
+        manager = RequestManager(sender)
+        first = manager.request('a')
+        await asyncio.sleep(0)
+        second = manager.request('b')
+        await asyncio.sleep(0)
+        assert sender.messages == []
+        sender.drain()
+        assert sender.messages == [{'event': 'requests', 'data': [{'id': 1, 'data': 'a'}, {'id': 2, 'data': 'b'}]}]
+        manager.response({'id': 1, 'data': 1})
+        manager.response({'id': 2, 'data': 2})
+        assert (await first, await second) == (1, 2)
+    run(main())
+
+
+def test_closed_send_queue_fails_the_batch():
+    async def main():
+        sender = FakeSender()
+        sender.closed = True
+        manager = RequestManager(sender)
+        future = manager.request('a')
+        await asyncio.sleep(0)
+        assert future.cancelled()
+        assert manager.inFlight == 0
+    run(main())
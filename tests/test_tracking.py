@@ -0,0 +1,126 @@
+import asyncio
+import copy
+import dataclasses
+import pickle
+
+from pyx2 import tracking
+from pyx2.tracking import ITEMS, MutationScope, ReactiveEngine, Tracker, fingerprint, trackInstance, unwatchContainer, watchContainer
+
+
+class Todo:
+    def __init__(self):
+        self.title = 'todo'
+        self.items = ['a']
+        self.tags = {'x': [1]}
+
+
+@dataclasses.dataclass
+class Item:
+    n: int
+
+
+def rendered(obj, read):
+    # Tracks `obj`, records what `read` reads as the dependencies of resource 1
+    trackInstance(obj)
+    changes = []
+    engine = ReactiveEngine(changes.append)
+    with Tracker() as reads:
+        read(obj)
+    engine.setDependencies(1, reads)
+    return engine, changes, reads
+
+
+def test_reads_are_recorded_per_instance_and_attribute():
+    todo = Todo()
+    engine, changes, reads = rendered(todo, lambda todo: todo.title)
+    assert reads == {(id(todo), 'title')}
+    todo.items = []         # Not read by the render
+    assert changes == []
+    todo.title = 'done'
+    assert changes == [1]
+
+
+def test_reads_outside_a_render_are_not_recorded():
+    todo = Todo()
+    engine, changes, reads = rendered(todo, lambda todo: None)
+    todo.title
+    assert reads == set()
+
+
+def test_dependencies_are_replaced_on_every_render():
+    todo = Todo()
+    engine, changes, reads = rendered(todo, lambda todo: todo.title)
+    with Tracker() as reads:
+        todo.items
+    engine.setDependencies(1, reads)
+    todo.title = 'ignored'
+    assert changes == []
+
+
+def test_containers_are_tracked_in_place():
+    items = ['a']
+    todo = Todo()
+    todo.items = items
+    engine, changes, reads = rendered(todo, lambda todo: list(todo.items))
+    assert todo.items is items
+    assert (id(items), ITEMS) in reads
+    with MutationScope() as scope:
+        todo.items.append('b')
+    scope.check()
+    assert changes == [1]
+    assert items == ['a', 'b']
+
+
+def test_scope_reports_only_mutated_containers():
+    todo = Todo()
+    engine, changes, reads = rendered(todo, lambda todo: (list(todo.items), dict(todo.tags)))
+    with MutationScope() as scope:
+        len(todo.items)
+        todo.tags['x'].append(2)    # Nested containers count towards their parent
+    scope.check()
+    assert changes == [1]
+
+
+def test_unscoped_reads_are_checked_at_the_end_of_the_tick():
+    async def main():
+        todo = Todo()
+        engine, changes, reads = rendered(todo, lambda todo: list(todo.items))
+        todo.items.append('b')
+        assert changes == []
+        await asyncio.sleep(0)
+        assert changes == [1]
+    asyncio.run(main())
+
+
+def test_watched_containers_are_checked_without_a_render(monkeypatch):
+    todo = Todo()
+    trackInstance(todo)
+    written = []
+    monkeypatch.setattr(tracking, '_writeListeners', [lambda owner, name: written.append((owner, name))])
+    watchContainer(todo.items)
+    try:
+        with MutationScope() as scope:
+            todo.items.append('b')
+        scope.check()
+    finally:
+        unwatchContainer(todo.items)
+    assert written == [(todo.items, ITEMS)]
+
+
+def test_fingerprint():
+    assert fingerprint([1, {'a': (2, 3)}]) == fingerprint([1, {'a': (2, 3)}])
+    assert fingerprint([1, {'a': (2, 3)}]) != fingerprint([1, {'a': (2, 4)}])
+    cyclic = [1]
+    cyclic.append(cyclic)
+    assert fingerprint(cyclic) == fingerprint(cyclic)
+    first, second = object(), object()
+    assert fingerprint([first]) != fingerprint([second])
+
+
+def test_tracked_instances_keep_their_class_semantics():
+    tracked, plain = Item(1), Item(1)
+    assert trackInstance(tracked)
+    assert tracked == plain and plain == tracked
+    assert tracked.__class__ is Item and isinstance(tracked, Item)
+    for clone in (copy.copy(tracked), copy.deepcopy(tracked), pickle.loads(pickle.dumps(tracked))):
+        assert type(clone) is Item and clone == tracked
@@ -4,13 +4,10 @@ from pyx2 import createElement, current
 
 import display
 
-import watcher
-
 class Counter:
     def __init__(self):
         self.count = 0
         self.display = display.Display()
-        watcher.watcher.target.append((display, self.display))
 
     def increment(self):
         self.count += 1